@@ -10,18 +10,48 @@
 
 import requests
 import json
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any
+from requests.adapters import HTTPAdapter
 
 # API 基礎 URL
 BASE_URL = "http://localhost:8009"
 
+# 共用的 HTTP 會話 - 所有測試重用 keep-alive 連接，避免每個請求重新建立 TCP 連接
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
+# 並行測試時每個執行緒先緩衝輸出，測試結束後整段打印，避免輸出交錯
+_output = threading.local()
+_print_lock = threading.Lock()
+
+def log(*args):
+    """打印輸出；在並行測試中寫入當前執行緒的緩衝區"""
+    buffer = getattr(_output, "buffer", None)
+    if buffer is None:
+        print(*args)
+    else:
+        buffer.append(" ".join(str(arg) for arg in args))
+
+def run_buffered(test_func):
+    """執行單個測試並在結束後一次性打印其輸出"""
+    _output.buffer = []
+    try:
+        test_func()
+    finally:
+        lines, _output.buffer = _output.buffer, None
+        with _print_lock:
+            print("\n".join(lines))
+
 def print_result(test_name: str, response: requests.Response):
     """打印測試結果"""
-    print(f"\n{'='*60}")
-    print(f"測試: {test_name}")
-    print(f"{'='*60}")
-    print(f"狀態碼: {response.status_code}")
-    print(f"響應: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
+    log(f"\n{'='*60}")
+    log(f"測試: {test_name}")
+    log(f"{'='*60}")
+    log(f"狀態碼: {response.status_code}")
+    log(f"響應: {json.dumps(response.json(), indent=2, ensure_ascii=False)}")
 
 def test_valid_request():
     """測試 1: 正常請求（如果有可用的模型）"""
@@ -39,7 +69,7 @@ def test_valid_request():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("正常請求", response)
         
         # 驗證成功響應
@@ -47,11 +77,11 @@ def test_valid_request():
             data = response.json()
             assert 'success' in data, "響應缺少 success 字段"
             assert 'result' in data, "響應缺少 result 字段"
-            print("✅ 成功響應格式正確")
+            log("✅ 成功響應格式正確")
         else:
-            print(f"⚠️ 狀態碼不是 200，而是 {response.status_code}")
+            log(f"⚠️ 狀態碼不是 200，而是 {response.status_code}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_missing_parameters():
     """測試 2: 缺少必需參數 - 應返回 400"""
@@ -64,7 +94,7 @@ def test_missing_parameters():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("缺少必需參數", response)
         
         # 驗證錯誤響應
@@ -77,13 +107,13 @@ def test_missing_parameters():
         if isinstance(detail, dict):
             assert 'error_type' in detail, "錯誤詳情缺少 error_type"
             assert detail['error_type'] == 'ValidationError', f"錯誤類型應為 ValidationError，實際為 {detail['error_type']}"
-            print("✅ 400 錯誤響應格式正確")
+            log("✅ 400 錯誤響應格式正確")
         else:
-            print(f"⚠️ detail 不是字典格式: {detail}")
+            log(f"⚠️ detail 不是字典格式: {detail}")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_unsupported_task():
     """測試 3: 不支持的任務類型 - 應返回 400"""
@@ -96,7 +126,7 @@ def test_unsupported_task():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("不支持的任務類型", response)
         
         # 驗證錯誤響應
@@ -106,11 +136,11 @@ def test_unsupported_task():
         detail = data['detail']
         if isinstance(detail, dict):
             assert detail['error_type'] == 'UnsupportedTaskError', f"錯誤類型應為 UnsupportedTaskError"
-            print("✅ 400 錯誤響應格式正確")
+            log("✅ 400 錯誤響應格式正確")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_invalid_engine_task_combination():
     """測試 4: 引擎與任務不兼容 - 應返回 400"""
@@ -123,7 +153,7 @@ def test_invalid_engine_task_combination():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("引擎與任務不兼容", response)
         
         # 驗證錯誤響應
@@ -133,11 +163,11 @@ def test_invalid_engine_task_combination():
         detail = data['detail']
         if isinstance(detail, dict):
             assert detail['error_type'] == 'UnsupportedTaskError', f"錯誤類型應為 UnsupportedTaskError"
-            print("✅ 400 錯誤響應格式正確")
+            log("✅ 400 錯誤響應格式正確")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_missing_data_fields():
     """測試 5: 缺少必需的數據字段 - 應返回 400"""
@@ -150,7 +180,7 @@ def test_missing_data_fields():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("缺少必需的數據字段", response)
         
         # 驗證錯誤響應
@@ -160,11 +190,11 @@ def test_missing_data_fields():
         detail = data['detail']
         if isinstance(detail, dict):
             assert detail['error_type'] == 'ValidationError', f"錯誤類型應為 ValidationError"
-            print("✅ 400 錯誤響應格式正確")
+            log("✅ 400 錯誤響應格式正確")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_model_not_found():
     """測試 6: 模型未找到 - 應返回 404 或 500（取決於實現）"""
@@ -177,54 +207,54 @@ def test_model_not_found():
     }
     
     try:
-        response = requests.post(url, json=payload)
+        response = SESSION.post(url, json=payload, timeout=30)
         print_result("模型未找到", response)
         
         # 可能返回 404 或 500，取決於何時檢測到模型不存在
         assert response.status_code in [404, 500], f"應返回 404 或 500，實際返回 {response.status_code}"
         
         data = response.json()
-        print(f"✅ 錯誤狀態碼: {response.status_code}")
+        log(f"✅ 錯誤狀態碼: {response.status_code}")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_health_check():
     """測試 7: 健康檢查端點"""
     url = f"{BASE_URL}/inference/health"
     
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=10)
         print_result("健康檢查", response)
         
         assert response.status_code == 200, f"健康檢查應返回 200，實際返回 {response.status_code}"
         
         data = response.json()
         assert 'status' in data, "健康檢查響應缺少 status 字段"
-        print("✅ 健康檢查正常")
+        log("✅ 健康檢查正常")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def test_supported_tasks():
     """測試 8: 獲取支持的任務"""
     url = f"{BASE_URL}/inference/supported-tasks"
     
     try:
-        response = requests.get(url)
+        response = SESSION.get(url, timeout=10)
         print_result("獲取支持的任務", response)
         
         assert response.status_code == 200, f"應返回 200，實際返回 {response.status_code}"
         
         data = response.json()
         assert 'tasks' in data, "響應缺少 tasks 字段"
-        print("✅ 支持的任務列表正常")
+        log("✅ 支持的任務列表正常")
     except AssertionError as e:
-        print(f"❌ 斷言失敗: {e}")
+        log(f"❌ 斷言失敗: {e}")
     except Exception as e:
-        print(f"❌ 測試失敗: {e}")
+        log(f"❌ 測試失敗: {e}")
 
 def main():
     """運行所有測試"""
@@ -232,23 +262,28 @@ def main():
     print("開始錯誤處理重構驗證測試")
     print("="*60)
     
-    # 先測試基礎端點
-    print("\n【基礎端點測試】")
-    test_health_check()
-    test_supported_tasks()
-    
-    # 測試錯誤處理
-    print("\n【錯誤處理測試】")
-    test_missing_parameters()
-    test_unsupported_task()
-    test_invalid_engine_task_combination()
-    test_missing_data_fields()
-    test_model_not_found()
+    # 基礎端點與錯誤處理測試彼此獨立，並行執行
+    parallel_tests = [
+        test_health_check,
+        test_supported_tasks,
+        test_missing_parameters,
+        test_unsupported_task,
+        test_invalid_engine_task_combination,
+        test_missing_data_fields,
+        test_model_not_found,
+    ]
     
-    # 最後測試正常請求（如果有可用模型）
-    print("\n【正常請求測試】")
-    print("⚠️ 此測試需要有可用的模型，如果沒有會失敗")
-    test_valid_request()
+    try:
+        print("\n【基礎端點與錯誤處理測試（並行）】")
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(run_buffered, parallel_tests))
+        
+        # 最後串行測試正常請求（如果有可用模型）
+        print("\n【正常請求測試】")
+        print("⚠️ 此測試需要有可用的模型，如果沒有會失敗")
+        test_valid_request()
+    finally:
+        SESSION.close()
     
     print("\n" + "="*60)
     print("測試完成")
@@ -6,11 +6,18 @@
 基於新的推理管理器實現。
 """
 
+import hashlib
 import logging
+import os
+import threading
 import time
-from typing import Dict, Any, Optional
-from fastapi import APIRouter, HTTPException, status
-from pydantic import BaseModel, Field
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, Tuple
+from fastapi import APIRouter, HTTPException, Request, Response, status
+from pydantic import BaseModel, ConfigDict, Field
+
+from .responses import ORJSONResponse, orjson_dumps
 
 # 導入新的推理管理器
 from ..inference.manager import inference_manager
@@ -19,17 +26,26 @@ from ..inference.manager import inference_manager
 from ..inference.exceptions import (
     InferenceError,
     ValidationError,
-    UnsupportedTaskError,
-    ModelNotFoundError,
     ResourceNotFoundError,
-    ModelLoadError,
-    InferenceExecutionError,
-    EngineError,
-    ResourceExhaustedError
+    ResourceExhaustedError,
+    format_error_response
 )
 
 logger = logging.getLogger(__name__)
 
+# 推理專用的有界執行緒池 - 阻塞的模型推理在此執行，不佔用事件循環
+# 大小應與 GPU/CPU 可承受的並發推理數一致
+_INFER_MAX_WORKERS = int(os.getenv("INFER_MAX_WORKERS", "4"))
+_INFER_POOL = ThreadPoolExecutor(
+    max_workers=_INFER_MAX_WORKERS,
+    thread_name_prefix="inference"
+)
+
+# 健康檢查快照的緩存時間（秒）- 高頻的存活/就緒探針在 TTL 內共用同一次檢查結果
+_HEALTH_TTL_SEC = float(os.getenv("INFER_HEALTH_TTL_SEC", "5"))
+_HEALTH_CACHE: Optional[Tuple[float, bytes]] = None
+_HEALTH_LOCK = threading.Lock()
+
 # 創建路由器
 router = APIRouter(
     prefix="/inference",
@@ -40,6 +56,8 @@ router = APIRouter(
 
 class InferenceRequest(BaseModel):
     """統一推理請求模型"""
+    model_config = ConfigDict(extra="ignore", validate_assignment=False)
+    
     task: str = Field(
         description="任務類型",
         examples=["text-generation", "vlm", "asr", "ocr", "audio-classification", "video-analysis", "document-analysis"]
@@ -61,32 +79,119 @@ class InferenceRequest(BaseModel):
         ]
     )
     options: Optional[Dict[str, Any]] = Field(
-        default={},
+        default_factory=dict,
         description="推理選項",
         examples=[{"max_length": 100, "temperature": 0.7}]
     )
 
 class HealthCheckResponse(BaseModel):
     """健康檢查響應模型"""
+    model_config = ConfigDict(extra="ignore")
+    
     status: str
     components: Dict[str, bool]
-    stats: Dict[str, Any]
+    stats: Optional[Dict[str, Any]] = None
     timestamp: float
 
 class SupportedTasksResponse(BaseModel):
     """支持的任務響應模型"""
+    model_config = ConfigDict(extra="ignore")
+    
     tasks: Dict[str, Dict[str, Any]]
     total_tasks: int
 
 class StatsResponse(BaseModel):
     """統計信息響應模型"""
+    model_config = ConfigDict(extra="ignore")
+    
     stats: Dict[str, Any]
     timestamp: float
 
+# ===== 異常處理 =====
+
+# 資源耗盡時建議客戶端的重試間隔（秒）
+_RETRY_AFTER_SEC = 60
+_RETRY_AFTER_HEADERS = {"Retry-After": str(_RETRY_AFTER_SEC)}
+
+def _error_context(request: Request, exc: InferenceError) -> Dict[str, Any]:
+    """
+    按異常類型挑選附加到錯誤響應中的上下文字段
+    
+    - ValidationError（包括 UnsupportedTaskError）: task, engine
+    - ResourceNotFoundError（包括 ModelNotFoundError）: model_name
+    - ResourceExhaustedError: retry_after
+    """
+    if isinstance(exc, ResourceExhaustedError):
+        return {"retry_after": _RETRY_AFTER_SEC}
+    # unified_inference 記錄的請求上下文；其他端點拋出的異常沒有上下文
+    context = getattr(request.state, "inference_context", None)
+    if not context:
+        return {}
+    if isinstance(exc, ValidationError):
+        return {"task": context["task"], "engine": context["engine"]}
+    if isinstance(exc, ResourceNotFoundError):
+        return {"model_name": context["model_name"]}
+    return {}
+
+async def inference_error_handler(request: Request, exc: InferenceError) -> ORJSONResponse:
+    """
+    推理異常的統一處理器
+    
+    根據異常類型轉換為對應的 HTTP 狀態碼和統一的錯誤響應格式：
+    - 400 Bad Request: ValidationError, UnsupportedTaskError
+    - 404 Not Found: ModelNotFoundError, ResourceNotFoundError
+    - 500 Internal Server Error: ModelLoadError, InferenceExecutionError, EngineError 等
+    - 503 Service Unavailable: ResourceExhaustedError
+    
+    需在應用上註冊: app.add_exception_handler(InferenceError, inference_error_handler)
+    """
+    detail = format_error_response(exc, **_error_context(request, exc))
+    headers = _RETRY_AFTER_HEADERS if isinstance(exc, ResourceExhaustedError) else None
+    # 狀態碼只用於 HTTP 響應本身，不放入 detail，保持與客戶端既有的錯誤格式一致
+    status_code = detail.pop("status_code")
+    
+    if status_code >= 500:
+        logger.error(f"推理錯誤 ({type(exc).__name__}): {exc}", exc_info=exc)
+    else:
+        logger.warning(f"請求失敗 ({type(exc).__name__}): {exc}")
+    
+    return ORJSONResponse(
+        status_code=status_code,
+        content={"detail": detail},
+        headers=headers
+    )
+
+# ===== 條件請求 (ETag) =====
+
+def _serialize_with_etag(payload: Dict[str, Any]) -> Tuple[bytes, str]:
+    """序列化響應內容並計算強 ETag"""
+    body = orjson_dumps(payload)
+    return body, f'"{hashlib.md5(body).hexdigest()}"'
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """判斷 If-None-Match 請求頭是否命中當前 ETag"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return any(tag.removeprefix("W/") == etag for tag in candidates)
+
+def _conditional_response(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """
+    根據 If-None-Match 返回 304 或完整的 JSON 響應
+    
+    客戶端持有的 ETag 與當前內容一致時直接返回 304，省去響應體傳輸。
+    """
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
 # ===== API 端點 =====
 
 @router.post("/infer", summary="統一推理接口")
-def unified_inference(request: InferenceRequest):
+async def unified_inference(request: InferenceRequest, http_request: Request):
     """
     統一推理接口 - 支持所有任務類型和引擎組合
     
@@ -141,6 +246,7 @@ def unified_inference(request: InferenceRequest):
     - model_name: 使用的模型
     - processing_time: 處理時間（秒）
     - api_processing_time: API 層處理時間（秒）
+    - request_id: 請求 ID（沿用 X-Request-ID 請求頭，未提供時自動生成）
     - timestamp: 時間戳
     
     **錯誤響應:**
@@ -149,120 +255,81 @@ def unified_inference(request: InferenceRequest):
     - 500 Internal Server Error: 推理執行失敗或其他服務器錯誤
     - 503 Service Unavailable: 資源耗盡（GPU/內存不足）
     """
-    try:
-        start_time = time.time()
-        logger.info(f"收到推理請求: {request.task} - {request.engine} - {request.model_name}")
-        
-        # 執行推理 - 可能拋出各種自定義異常
-        result = inference_manager.infer(
-            task=request.task,
-            engine=request.engine,
-            model_name=request.model_name,
-            data=request.data,
-            options=request.options
-        )
-        
-        # 添加API層的元數據
-        result['api_processing_time'] = time.time() - start_time
-        result['request_id'] = id(request)
-        result['success'] = True  # API 層添加成功標誌
-        
-        logger.info(f"推理完成: {request.task} - 用時 {result['processing_time']:.2f}秒")
-        return result
-    
-    # 4xx 客戶端錯誤
-    except (ValidationError, UnsupportedTaskError) as e:
-        logger.warning(f"請求驗證失敗 ({type(e).__name__}): {e}")
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail={
-                "error_type": type(e).__name__,
-                "message": str(e),
-                "task": request.task,
-                "engine": request.engine
-            }
-        )
+    start_ns = time.perf_counter_ns()
+    logger.info("收到推理請求: %s - %s - %s", request.task, request.engine, request.model_name)
+    # 記錄請求上下文，供 inference_error_handler 在錯誤響應中回傳 task/engine/model_name
+    http_request.state.inference_context = {
+        "task": request.task,
+        "engine": request.engine,
+        "model_name": request.model_name
+    }
     
-    except (ModelNotFoundError, ResourceNotFoundError) as e:
-        logger.warning(f"資源未找到 ({type(e).__name__}): {e}")
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail={
-                "error_type": type(e).__name__,
-                "message": str(e),
-                "model_name": request.model_name
-            }
-        )
+    # 執行推理 - 可能拋出各種自定義異常，由 inference_error_handler 統一轉換為 HTTP 響應
+    # 阻塞的推理調用交由專用執行緒池執行，事件循環可繼續處理其他請求
+    result = await inference_manager.infer_async(
+        task=request.task,
+        engine=request.engine,
+        model_name=request.model_name,
+        data=request.data,
+        options=request.options,
+        executor=_INFER_POOL
+    )
     
-    # 503 服務不可用
-    except ResourceExhaustedError as e:
-        logger.error(f"資源耗盡: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
-            detail={
-                "error_type": "ResourceExhaustedError",
-                "message": str(e),
-                "retry_after": 60  # 建議60秒後重試
-            }
-        )
+    # 添加API層的元數據
+    result['api_processing_time'] = (time.perf_counter_ns() - start_ns) / 1e9
+    result['request_id'] = http_request.headers.get("x-request-id") or uuid.uuid4().hex
+    result['success'] = True  # API 層添加成功標誌
     
-    # 5xx 服務器錯誤
-    except (ModelLoadError, InferenceExecutionError, EngineError, InferenceError) as e:
-        logger.error(f"推理錯誤 ({type(e).__name__}): {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error_type": type(e).__name__,
-                "message": str(e)
-            }
-        )
-    
-    except Exception as e:
-        logger.error(f"未預期的錯誤: {e}", exc_info=True)
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail={
-                "error_type": "UnexpectedError",
-                "message": "推理服務發生未預期錯誤，請聯繫管理員"
-            }
-        )
+    logger.info("推理完成: %s - 用時 %.2f秒", request.task, result['processing_time'])
+    return result
 
 @router.get("/health", response_model=HealthCheckResponse, summary="健康檢查")
 def health_check():
     """
     推理系統健康檢查
     
-    檢查推理管理器和相關組件的狀態。
+    檢查推理管理器和相關組件的狀態。結果緩存 INFER_HEALTH_TTL_SEC 秒（默認 5 秒）。
     """
-    try:
-        health_info = inference_manager.health_check()
-        return health_info
-    except Exception as e:
-        logger.error(f"健康檢查失敗: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"健康檢查失敗: {str(e)}"
-        )
+    global _HEALTH_CACHE
+    cached = _HEALTH_CACHE
+    if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL_SEC:
+        return Response(content=cached[1], media_type="application/json")
+    
+    # 同一時間只允許一個請求執行實際檢查，其餘請求等待並複用其結果
+    with _HEALTH_LOCK:
+        cached = _HEALTH_CACHE
+        if cached is not None and time.monotonic() - cached[0] < _HEALTH_TTL_SEC:
+            return Response(content=cached[1], media_type="application/json")
+        
+        try:
+            health_info = inference_manager.health_check()
+        except Exception as e:
+            logger.error(f"健康檢查失敗: {e}")
+            raise HTTPException(
+                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                detail=f"健康檢查失敗: {str(e)}"
+            )
+        
+        body = orjson_dumps(health_info)
+        _HEALTH_CACHE = (time.monotonic(), body)
+    
+    return Response(content=body, media_type="application/json")
+
+# 任務配置是模塊級常量，啟動時序列化一次；配置只隨重新部署改變，ETag 也隨之改變
+_SUPPORTED_TASKS = inference_manager.get_supported_tasks()
+_SUPPORTED_TASKS_BODY, _SUPPORTED_TASKS_ETAG = _serialize_with_etag({
+    "tasks": _SUPPORTED_TASKS,
+    "total_tasks": len(_SUPPORTED_TASKS)
+})
 
 @router.get("/supported-tasks", response_model=SupportedTasksResponse, summary="獲取支持的任務")
-def get_supported_tasks():
+def get_supported_tasks(request: Request):
     """
     獲取支持的任務類型和對應的引擎
     
-    返回所有支持的任務配置信息。
+    返回所有支持的任務配置信息。支持 ETag 條件請求，內容未變化時返回 304。
     """
-    try:
-        tasks = inference_manager.get_supported_tasks()
-        return {
-            "tasks": tasks,
-            "total_tasks": len(tasks)
-        }
-    except Exception as e:
-        logger.error(f"獲取支持任務失敗: {e}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail=f"獲取支持任務失敗: {str(e)}"
-        )
+    return _conditional_response(request, _SUPPORTED_TASKS_BODY, _SUPPORTED_TASKS_ETAG, "no-cache")
 
 @router.get("/stats", response_model=StatsResponse, summary="獲取統計信息")
 def get_stats():
@@ -307,103 +374,98 @@ def clear_cache():
 
 # ===== 向下兼容的端點 =====
 
-@router.post("/infer_fixed", summary="固定模型推理（向下兼容）")
-def infer_fixed_compatibility(request: InferenceRequest):
-    """
-    向下兼容的固定模型推理端點
-    
-    重定向到統一推理接口。
-    """
-    logger.info("使用向下兼容的固定推理端點，重定向到統一接口")
-    return unified_inference(request)
-
-@router.post("/infer_multimodal", summary="多模態推理（向下兼容）") 
-def infer_multimodal_compatibility(request: InferenceRequest):
-    """
-    向下兼容的多模態推理端點
-    
-    重定向到統一推理接口。
-    """
-    logger.info("使用向下兼容的多模態推理端點，重定向到統一接口")
-    return unified_inference(request)
+# 舊端點直接註冊為統一推理接口的別名路徑，由 FastAPI 直接分派到 unified_inference
+for _compat_path, _compat_summary in (
+    ("/infer_fixed", "固定模型推理（向下兼容）"),
+    ("/infer_multimodal", "多模態推理（向下兼容）"),
+):
+    router.add_api_route(
+        _compat_path,
+        unified_inference,
+        methods=["POST"],
+        summary=_compat_summary
+    )
 
 # ===== 使用示例生成端點 =====
 
+# 使用示例是純常量，在模塊加載時構建並預序列化
+_USAGE_EXAMPLES: Dict[str, Any] = {
+    "text-generation-ollama": {
+        "description": "使用 Ollama 進行文本生成",
+        "request": {
+            "task": "text-generation",
+            "engine": "ollama",
+            "model_name": "llama2-7b",
+            "data": {"inputs": "請寫一首關於春天的詩"},
+            "options": {"max_length": 200, "temperature": 0.8}
+        }
+    },
+    "text-generation-transformers": {
+        "description": "使用 Transformers 進行文本生成",
+        "request": {
+            "task": "text-generation",
+            "engine": "transformers",
+            "model_name": "gpt2-medium",
+            "data": {"inputs": "人工智能的未來發展"},
+            "options": {"max_length": 150, "temperature": 0.7}
+        }
+    },
+    "vlm": {
+        "description": "視覺語言模型 - 圖像理解",
+        "request": {
+            "task": "vlm",
+            "engine": "transformers",
+            "model_name": "llava-1.5-7b",
+            "data": {
+                "image": "base64_encoded_image_data",
+                "prompt": "請詳細描述這張圖片的內容"
+            },
+            "options": {"max_length": 256, "temperature": 0.7}
+        }
+    },
+    "asr": {
+        "description": "自動語音識別",
+        "request": {
+            "task": "asr",
+            "engine": "transformers",
+            "model_name": "whisper-large",
+            "data": {"audio": "/path/to/audio.wav"},
+            "options": {}
+        }
+    },
+    "ocr": {
+        "description": "光學字符識別",
+        "request": {
+            "task": "ocr",
+            "engine": "transformers",
+            "model_name": "trocr-large",
+            "data": {"image": "/path/to/image.jpg"},
+            "options": {}
+        }
+    },
+    "audio-classification": {
+        "description": "音頻分類",
+        "request": {
+            "task": "audio-classification",
+            "engine": "transformers",
+            "model_name": "ast-finetuned",
+            "data": {"audio": "/path/to/audio.wav"},
+            "options": {"top_k": 5}
+        }
+    }
+}
+
+_EXAMPLES_BODY, _EXAMPLES_ETAG = _serialize_with_etag({
+    "examples": _USAGE_EXAMPLES,
+    "total_examples": len(_USAGE_EXAMPLES),
+    "note": "所有示例都使用統一的 /inference/infer 端點"
+})
+
 @router.get("/examples", summary="獲取使用示例")
-def get_usage_examples():
+def get_usage_examples(request: Request):
     """
     獲取各種任務類型的使用示例
     
-    提供每種任務類型的請求格式示例。
+    提供每種任務類型的請求格式示例。支持 ETag 條件請求，內容未變化時返回 304。
     """
-    examples = {
-        "text-generation-ollama": {
-            "description": "使用 Ollama 進行文本生成",
-            "request": {
-                "task": "text-generation",
-                "engine": "ollama",
-                "model_name": "llama2-7b",
-                "data": {"inputs": "請寫一首關於春天的詩"},
-                "options": {"max_length": 200, "temperature": 0.8}
-            }
-        },
-        "text-generation-transformers": {
-            "description": "使用 Transformers 進行文本生成",
-            "request": {
-                "task": "text-generation",
-                "engine": "transformers",
-                "model_name": "gpt2-medium",
-                "data": {"inputs": "人工智能的未來發展"},
-                "options": {"max_length": 150, "temperature": 0.7}
-            }
-        },
-        "vlm": {
-            "description": "視覺語言模型 - 圖像理解",
-            "request": {
-                "task": "vlm",
-                "engine": "transformers",
-                "model_name": "llava-1.5-7b",
-                "data": {
-                    "image": "base64_encoded_image_data",
-                    "prompt": "請詳細描述這張圖片的內容"
-                },
-                "options": {"max_length": 256, "temperature": 0.7}
-            }
-        },
-        "asr": {
-            "description": "自動語音識別",
-            "request": {
-                "task": "asr",
-                "engine": "transformers",
-                "model_name": "whisper-large",
-                "data": {"audio": "/path/to/audio.wav"},
-                "options": {}
-            }
-        },
-        "ocr": {
-            "description": "光學字符識別",
-            "request": {
-                "task": "ocr",
-                "engine": "transformers",
-                "model_name": "trocr-large",
-                "data": {"image": "/path/to/image.jpg"},
-                "options": {}
-            }
-        },
-        "audio-classification": {
-            "description": "音頻分類",
-            "request": {
-                "task": "audio-classification",
-                "engine": "transformers",
-                "model_name": "ast-finetuned",
-                "data": {"audio": "/path/to/audio.wav"},
-                "options": {"top_k": 5}
-            }
-        }
-    }
-    
-    return {
-        "examples": examples,
-        "total_examples": len(examples),
-        "note": "所有示例都使用統一的 /inference/infer 端點"
-    }
\ No newline at end of file
+    return _conditional_response(request, _EXAMPLES_BODY, _EXAMPLES_ETAG, "public, max-age=86400")
@@ -0,0 +1,28 @@
+# src/api/responses.py
+"""
+共用的 HTTP 響應類型
+
+以 orjson 取代標準庫 json 進行響應序列化，直接輸出 bytes，
+避免中間字符串的生成，降低長文本推理結果的編碼開銷。
+"""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+# 允許非字符串鍵（如整數類別 ID）以及 numpy 數組直接序列化
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def orjson_dumps(content: Any) -> bytes:
+    """使用統一選項將內容序列化為 JSON bytes"""
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class ORJSONResponse(JSONResponse):
+    """使用 orjson 序列化的 JSON 響應，作為應用的默認響應類型"""
+    media_type = "application/json"
+
+    def render(self, content: Any) -> bytes:
+        return orjson_dumps(content)
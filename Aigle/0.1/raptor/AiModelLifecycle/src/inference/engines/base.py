@@ -152,6 +152,25 @@ class BaseEngine(ABC):
         logger.debug(f"卸載模型: {self.name}")
         return True
     
+    def release_model(self, model_name: str) -> bool:
+        """
+        釋放調用方對模型的持有
+        
+        執行器淘汰或卸載模型時調用此方法，而非 unload_model()：同一引擎實例可能被多個執行器共享，
+        只有在沒有任何持有者時才應真正卸載。
+        
+        Args:
+            model_name (str): 模型名稱（與 load_model() 的參數相同）
+            
+        Returns:
+            bool: 是否因此真正卸載了模型
+            
+        Note:
+            - 默認實現不做任何事並返回 False，未做引用計數的引擎不會因單一持有者釋放而卸載共享的模型
+            - 會緩存模型的引擎應重寫此方法，在最後一個持有者釋放時卸載
+        """
+        return False
+    
     def validate_inputs(self, inputs: Dict[str, Any], required_keys: list) -> bool:
         """
         驗證輸入數據
@@ -17,6 +17,7 @@ import logging
 import os
 import torch
 import gc
+import threading
 from typing import Any, Dict, Optional
 from pathlib import Path
 from .base import BaseEngine
@@ -130,6 +131,9 @@ class TransformersEngine(BaseEngine):
         
         # 已加載的模型緩存
         self._loaded_models: Dict[str, Any] = {}
+        # 各模型的持有者計數：每次 load_model() 加一、release_model() 減一，歸零時才卸載
+        self._model_refs: Dict[str, int] = {}
+        self._models_lock = threading.RLock()
         
         self.is_initialized = True
         logger.info(
@@ -212,9 +216,11 @@ class TransformersEngine(BaseEngine):
             
             # 檢查是否已加載（且不強制重新加載）
             force_reload = kwargs.get('force_reload', False)
-            if model_name in self._loaded_models and not force_reload:
-                logger.info(f"重用已加載的模型: {model_name}")
-                return self._loaded_models[model_name]
+            with self._models_lock:
+                if model_name in self._loaded_models and not force_reload:
+                    logger.info(f"重用已加載的模型: {model_name}")
+                    self._model_refs[model_name] = self._model_refs.get(model_name, 0) + 1
+                    return self._loaded_models[model_name]
             
             # 1. 獲取模型路徑
             model_path = self._get_model_path(model_name, **kwargs)
@@ -225,8 +231,10 @@ class TransformersEngine(BaseEngine):
             # 3. 加載模型
             model = self._load_model_by_task(model_path, task, **kwargs)
             
-            # 4. 緩存模型
-            self._loaded_models[model_name] = model
+            # 4. 緩存模型並記錄持有者
+            with self._models_lock:
+                self._loaded_models[model_name] = model
+                self._model_refs[model_name] = self._model_refs.get(model_name, 0) + 1
             
             logger.info(f"Transformers 模型加載成功: {model_name}")
             return model
@@ -660,11 +668,13 @@ class TransformersEngine(BaseEngine):
         """
         try:
             # 查找並移除緩存
-            for model_name, cached_model in list(self._loaded_models.items()):
-                if cached_model is model:
-                    del self._loaded_models[model_name]
-                    logger.info(f"從緩存中移除模型: {model_name}")
-                    break
+            with self._models_lock:
+                for model_name, cached_model in list(self._loaded_models.items()):
+                    if cached_model is model:
+                        del self._loaded_models[model_name]
+                        self._model_refs.pop(model_name, None)
+                        logger.info(f"從緩存中移除模型: {model_name}")
+                        break
             
             # 清理模型
             if isinstance(model, dict):
@@ -687,6 +697,30 @@ class TransformersEngine(BaseEngine):
             logger.error(f"模型卸載失敗: {e}")
             return False
     
+    def release_model(self, model_name: str) -> bool:
+        """
+        釋放一個持有者對模型的引用，最後一個持有者釋放時才卸載
+        
+        同一引擎實例由多個執行器共享（例如同一 Whisper 模型同時用於 asr 與 asr-hf），
+        直接 unload_model() 會清空其他執行器仍在使用的模型字典。
+        
+        Args:
+            model_name (str): 模型名稱
+            
+        Returns:
+            bool: 是否因此真正卸載了模型
+        """
+        with self._models_lock:
+            refs = self._model_refs.get(model_name, 0) - 1
+            if refs > 0:
+                self._model_refs[model_name] = refs
+                return False
+            self._model_refs.pop(model_name, None)
+            model = self._loaded_models.get(model_name)
+            if model is None:
+                return False
+            return self.unload_model(model)
+    
     def get_info(self) -> Dict[str, Any]:
         """
         獲取引擎詳細信息
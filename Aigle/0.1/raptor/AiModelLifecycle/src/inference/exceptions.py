@@ -157,6 +157,20 @@ class ResourceExhaustedError(InferenceError):
 
 # ===== 異常工具函數 =====
 
+# 異常類型到 HTTP 狀態碼的映射；未列出的子類在首次查詢時沿 MRO 解析並記錄
+_STATUS_BY_TYPE: dict = {
+    ValidationError: 400,           # Bad Request
+    UnsupportedTaskError: 400,      # Bad Request
+    ResourceNotFoundError: 404,     # Not Found
+    ModelNotFoundError: 404,        # Not Found
+    ResourceExhaustedError: 503,    # Service Unavailable
+    ModelLoadError: 500,            # Internal Server Error
+    InferenceExecutionError: 500,   # Internal Server Error
+    EngineError: 500,               # Internal Server Error
+    InferenceError: 500,            # Internal Server Error
+}
+
+
 def get_http_status_code(exception: Exception) -> int:
     """
     根據異常類型返回建議的 HTTP 狀態碼
@@ -167,25 +181,28 @@ def get_http_status_code(exception: Exception) -> int:
     Returns:
         int: HTTP 狀態碼
     """
-    if isinstance(exception, (ValidationError, UnsupportedTaskError)):
-        return 400  # Bad Request
-    elif isinstance(exception, (ResourceNotFoundError, ModelNotFoundError)):
-        return 404  # Not Found
-    elif isinstance(exception, ResourceExhaustedError):
-        return 503  # Service Unavailable
-    elif isinstance(exception, InferenceError):
-        return 500  # Internal Server Error
-    else:
-        return 500  # Internal Server Error (默認)
+    exc_type = type(exception)
+    code = _STATUS_BY_TYPE.get(exc_type)
+    if code is not None:
+        return code
+    
+    for cls in exc_type.__mro__:
+        code = _STATUS_BY_TYPE.get(cls)
+        if code is not None:
+            _STATUS_BY_TYPE[exc_type] = code
+            return code
+    
+    return 500  # Internal Server Error (默認)
 
 
-def format_error_response(exception: Exception, include_traceback: bool = False) -> dict:
+def format_error_response(exception: Exception, include_traceback: bool = False, **extra) -> dict:
     """
     格式化異常為統一的錯誤響應格式
     
     Args:
         exception: 異常實例
         include_traceback: 是否包含堆棧追蹤（僅用於調試）
+        **extra: 附加到響應中的上下文字段（如 retry_after）
         
     Returns:
         dict: 格式化的錯誤響應
@@ -193,7 +210,8 @@ def format_error_response(exception: Exception, include_traceback: bool = False)
     response = {
         "error_type": type(exception).__name__,
         "message": str(exception),
-        "status_code": get_http_status_code(exception)
+        "status_code": get_http_status_code(exception),
+        **extra
     }
     
     if include_traceback:
@@ -10,7 +10,11 @@
 """
 
 import logging
+import os
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import Future
 from typing import Dict, Any, Optional
 
 # 核心依賴導入
@@ -31,6 +35,9 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 緩存未命中的哨兵值（模型實例本身可能為假值）
+_MISSING = object()
+
 class ModelExecutor:
     """
     模型執行器
@@ -39,17 +46,28 @@ class ModelExecutor:
     負責協調模型加載、數據處理和推理執行。
     """
     
-    def __init__(self, engine, model_handler):
+    def __init__(self, engine, model_handler, max_loaded_models: Optional[int] = None):
         """
         初始化模型執行器
         
         Args:
             engine: 推理引擎實例
             model_handler: 模型處理器實例
+            max_loaded_models (int, optional): 最多同時駐留的模型數量，
+                超出時按 LRU 順序淘汰未在推理中的模型。默認讀取環境變數 INFER_MAX_LOADED_MODELS（4）
         """
         self.engine = engine
         self.model_handler = model_handler
-        self._loaded_models: Dict[str, Any] = {}
+        
+        # 已加載模型的 LRU 緩存 - 最近使用的模型位於末尾
+        self._loaded_models: "OrderedDict[str, Any]" = OrderedDict()
+        self._max_loaded_models = max(1, max_loaded_models or int(os.getenv("INFER_MAX_LOADED_MODELS", "4")))
+        self._models_lock = threading.RLock()
+        
+        # 進行中的模型加載: {model_name: Future}，並發請求同一冷模型時只加載一次
+        self._inflight_loads: Dict[str, Future] = {}
+        # 正在推理中的模型引用數: {model_name: count}，大於零的模型不會被 LRU 淘汰
+        self._pinned_models: Dict[str, int] = {}
         
         logger.debug(f"創建模型執行器: {engine.__class__.__name__} + {model_handler.__class__.__name__}")
     
@@ -69,42 +87,46 @@ class ModelExecutor:
             ModelLoadError: 模型加載失敗
             InferenceExecutionError: 推理執行失敗
         """
-        try:
+        # 僅在 DEBUG 級別啟用時才計時和格式化調試日誌
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        if debug_enabled:
             start_time = time.time()
-            logger.debug(f"開始執行推理: {model_name}")
-            
-            # 步驟 1: 確保模型已加載 - 可能拋出 ModelLoadError
+            logger.debug("開始執行推理: %s", model_name)
+        
+        try:
+            # 步驟 1: 確保模型已加載並在推理期間固定 - 可能拋出 ModelLoadError
             model = self._get_or_load_model(model_name)
+            try:
+                # 步驟 2: 數據預處理
+                processed_data = self.model_handler.preprocess(data, options)
+                if debug_enabled:
+                    logger.debug("數據預處理完成")
+                
+                # 步驟 3: 執行推理
+                raw_result = self.engine.infer(model, processed_data, options)
+                if debug_enabled:
+                    logger.debug("推理執行完成")
+                
+                # 步驟 4: 結果後處理
+                final_result = self.model_handler.postprocess(raw_result, options)
+            finally:
+                self._unpin_model(model_name)
             
-            # 步驟 2: 數據預處理
-            processed_data = self.model_handler.preprocess(data, options)
-            logger.debug("數據預處理完成")
-            
-            # 步驟 3: 執行推理
-            raw_result = self.engine.infer(model, processed_data, options)
-            logger.debug("推理執行完成")
-            
-            # 步驟 4: 結果後處理
-            final_result = self.model_handler.postprocess(raw_result, options)
-            
-            execution_time = time.time() - start_time
-            logger.debug(f"推理執行完成，用時: {execution_time:.2f}秒")
-            
-            return final_result
-            
-        except ModelLoadError:
-            # 模型加載錯誤，直接向上傳播
-            raise
         except InferenceError:
-            # 其他已知推理錯誤，直接向上傳播
+            # 已知推理錯誤（包括 ModelLoadError），直接向上傳播
             raise
         except Exception as e:
             logger.error(f"推理執行失敗: {e}", exc_info=True)
             raise InferenceExecutionError(f"推理執行失敗: {str(e)}") from e
+        
+        if debug_enabled:
+            logger.debug("推理執行完成，用時: %.2f秒", time.time() - start_time)
+        
+        return final_result
     
     def _get_or_load_model(self, model_name: str) -> Any:
         """
-        獲取或加載模型
+        獲取或加載模型，並將其固定直到調用方執行 _unpin_model()
         
         Args:
             model_name (str): 模型名稱
@@ -115,22 +137,96 @@ class ModelExecutor:
         Raises:
             ModelLoadError: 模型加載失敗
         """
-        if model_name not in self._loaded_models:
-            logger.info(f"加載模型: {model_name}")
-            
-            try:
-                # 使用引擎加載模型
-                model = self.engine.load_model(model_name)
-                self._loaded_models[model_name] = model
-                logger.info(f"模型加載成功: {model_name}")
+        while True:
+            with self._models_lock:
+                model = self._loaded_models.get(model_name, _MISSING)
+                if model is not _MISSING:
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("重用已加載的模型: %s", model_name)
+                    self._loaded_models.move_to_end(model_name)
+                    self._pinned_models[model_name] = self._pinned_models.get(model_name, 0) + 1
+                    return model
                 
-            except Exception as e:
-                logger.error(f"模型加載失敗: {model_name}, 錯誤: {e}", exc_info=True)
-                raise ModelLoadError(f"模型 '{model_name}' 加載失敗: {str(e)}") from e
-        else:
-            logger.debug(f"重用已加載的模型: {model_name}")
+                future = self._inflight_loads.get(model_name)
+                is_owner = future is None
+                if is_owner:
+                    future = Future()
+                    self._inflight_loads[model_name] = future
+                    # 已加載與加載中的模型總數超出上限時，先淘汰最久未使用的模型以騰出內存/顯存
+                    self._evict_over_capacity()
             
-        return self._loaded_models[model_name]
+            if is_owner:
+                break
+            # 其他請求正在加載同一模型，等待其完成（失敗時拋出相同的 ModelLoadError）；
+            # 完成後回到緩存中取得並固定模型，期間若已被淘汰則重新加載
+            logger.debug("等待進行中的模型加載: %s", model_name)
+            future.result()
+        
+        # 在鎖外加載，不阻塞其他模型的命中與加載
+        logger.info("加載模型: %s", model_name)
+        try:
+            model = self.engine.load_model(model_name)
+        except BaseException as e:
+            # 任何異常（包括 KeyboardInterrupt、SystemExit 與協程取消）都必須移除進行中的條目並完成 Future，
+            # 否則之後請求同一模型的調用方會永遠阻塞在 future.result()
+            error = ModelLoadError(f"模型 '{model_name}' 加載失敗: {str(e) or type(e).__name__}")
+            error.__cause__ = e
+            with self._models_lock:
+                del self._inflight_loads[model_name]
+            future.set_exception(error)
+            if not isinstance(e, Exception):
+                raise
+            logger.error(f"模型加載失敗: {model_name}, 錯誤: {e}", exc_info=True)
+            raise error
+        
+        with self._models_lock:
+            self._loaded_models[model_name] = model
+            self._pinned_models[model_name] = self._pinned_models.get(model_name, 0) + 1
+            del self._inflight_loads[model_name]
+        future.set_result(model)
+        
+        logger.info("模型加載成功: %s", model_name)
+        return model
+    
+    def _unpin_model(self, model_name: str) -> None:
+        """推理結束後解除固定；超出上限時補做先前因模型使用中而延後的淘汰"""
+        with self._models_lock:
+            count = self._pinned_models.get(model_name, 0) - 1
+            if count > 0:
+                self._pinned_models[model_name] = count
+            else:
+                self._pinned_models.pop(model_name, None)
+            self._evict_over_capacity()
+    
+    def _evict_over_capacity(self) -> None:
+        """
+        按 LRU 順序淘汰未在推理中的模型，直到不超出上限（調用方需持有 _models_lock）
+        
+        所有模型都在推理中時暫時允許超出上限，待 _unpin_model() 時再淘汰。
+        """
+        while len(self._loaded_models) + len(self._inflight_loads) > self._max_loaded_models:
+            evicted_name = next(
+                (name for name in self._loaded_models if name not in self._pinned_models),
+                None
+            )
+            if evicted_name is None:
+                return
+            self._release_model(evicted_name)
+            logger.info(f"已按 LRU 策略淘汰模型: {evicted_name}")
+    
+    def _release_model(self, model_name: str) -> None:
+        """
+        移除此執行器對模型的引用（調用方需持有 _models_lock）
+        
+        引擎實例在多個執行器之間共享，因此只通知引擎釋放一個持有者，
+        由引擎在沒有任何持有者時才真正卸載，不直接調用 engine.unload_model()。
+        """
+        del self._loaded_models[model_name]
+        try:
+            if hasattr(self.engine, 'release_model'):
+                self.engine.release_model(model_name)
+        except Exception as e:
+            logger.error(f"釋放模型失敗: {model_name}, 錯誤: {e}")
     
     def unload_model(self, model_name: str) -> bool:
         """
@@ -140,38 +236,33 @@ class ModelExecutor:
             model_name (str): 模型名稱
             
         Returns:
-            bool: 是否成功卸載
+            bool: 是否成功卸載（模型未加載或正在推理中時返回 False）
         """
-        if model_name in self._loaded_models:
-            try:
-                # 如果引擎支持顯式卸載，調用引擎的卸載方法
-                if hasattr(self.engine, 'unload_model'):
-                    self.engine.unload_model(self._loaded_models[model_name])
-                
-                del self._loaded_models[model_name]
-                logger.info(f"模型已卸載: {model_name}")
-                return True
-                
-            except Exception as e:
-                logger.error(f"模型卸載失敗: {model_name}, 錯誤: {e}")
+        with self._models_lock:
+            if model_name not in self._loaded_models:
+                logger.warning(f"模型未加載，無需卸載: {model_name}")
                 return False
-        else:
-            logger.warning(f"模型未加載，無需卸載: {model_name}")
-            return False
+            if model_name in self._pinned_models:
+                logger.warning(f"模型正在推理中，暫不卸載: {model_name}")
+                return False
+            
+            self._release_model(model_name)
+            logger.info(f"模型已卸載: {model_name}")
+            return True
     
     def get_loaded_models(self) -> list:
         """
         獲取已加載的模型列表
         
         Returns:
-            list: 已加載的模型名稱列表
+            list: 已加載的模型名稱列表（按最近使用排序，最新的在最後）
         """
-        return list(self._loaded_models.keys())
+        with self._models_lock:
+            return list(self._loaded_models.keys())
     
     def clear_models(self):
         """清理所有已加載的模型"""
-        model_names = list(self._loaded_models.keys())
-        for model_name in model_names:
+        for model_name in self.get_loaded_models():
             self.unload_model(model_name)
         
         logger.info("所有模型已清理")
@@ -187,6 +278,7 @@ class ModelExecutor:
             'engine_type': self.engine.__class__.__name__,
             'model_handler_type': self.model_handler.__class__.__name__,
             'loaded_models': self.get_loaded_models(),
+            'max_loaded_models': self._max_loaded_models,
             'engine_info': getattr(self.engine, 'get_info', lambda: {})(),
             'handler_info': getattr(self.model_handler, 'get_info', lambda: {})()
         }
\ No newline at end of file
@@ -6,26 +6,42 @@
 簡化了原有的複雜架構，提供清晰的任務路由和模型執行機制。
 """
 
+import asyncio
+import functools
+import importlib
 import logging
+import os
 import time
 import threading
-from typing import Dict, Any, Optional
+from collections import OrderedDict
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from types import MappingProxyType
+from hashlib import blake2b
+from typing import Dict, Any, Mapping, Optional, Tuple
 from contextlib import contextmanager
 
+import orjson
+
+def _resolve(name: str, *module_paths: str) -> Any:
+    """
+    依次嘗試導入候選模組，返回第一個可用模組中的屬性
+    
+    同時支持包內相對導入和以 src 為根的絕對導入，全部失敗時返回 None。
+    """
+    for module_path in module_paths:
+        try:
+            module = importlib.import_module(module_path, __package__)
+        except (ImportError, TypeError):
+            # TypeError: 非包上下文中無法解析相對路徑
+            continue
+        return getattr(module, name, None)
+    return None
+
 # 核心依賴導入
-try:
-    from ..core.model_manager import model_manager
-    from ..core.gpu_manager import gpu_manager
-    from ..core.config import config
-except ImportError:
-    try:
-        from src.core.model_manager import model_manager
-        from src.core.gpu_manager import gpu_manager  
-        from src.core.config import config
-    except ImportError:
-        model_manager = None
-        gpu_manager = None
-        config = None
+model_manager = _resolve('model_manager', '..core.model_manager', 'src.core.model_manager')
+gpu_manager = _resolve('gpu_manager', '..core.gpu_manager', 'src.core.gpu_manager')
+config = _resolve('config', '..core.config', 'src.core.config')
 
 # 模組內部導入
 from .router import TaskRouter
@@ -48,6 +64,259 @@ from .exceptions import (
 
 logger = logging.getLogger(__name__)
 
+# 緩存未命中的哨兵值（推理結果本身可能為假值）
+_MISSING = object()
+
+# 未提供推理選項時共用的只讀空映射，避免每次調用分配新字典，也防止下游誤改默認值
+_EMPTY_OPTIONS: Mapping[str, Any] = MappingProxyType({})
+
+# ===== 參數驗證常量（模塊加載時構建一次）=====
+
+# 支持的任務類型
+_SUPPORTED_TASKS = frozenset({
+    'text-generation', 'text-generation-ollama', 'text-generation-hf',
+    'vlm', 'asr', 'asr-hf', 'vad-hf', 'ocr', 'ocr-hf',
+    'audio-classification', 'video-analysis', 'scene-detection',
+    'document-analysis', 'image-captioning', 'video-summary',
+    'audio-transcription'
+})
+
+# 支持的引擎類型
+_SUPPORTED_ENGINES = frozenset({'ollama', 'transformers'})
+
+# Ollama 引擎支持的任務
+_OLLAMA_TASKS = frozenset({'text-generation', 'text-generation-ollama'})
+
+# 通用文本生成任務支持的引擎（驗證快速路徑使用，小元組的成員檢查與集合相當）
+_TEXT_GENERATION_ENGINES = ('ollama', 'transformers')
+
+# 各任務類型必需的數據字段
+_REQUIRED_FIELDS = {
+    'text-generation': ('inputs',),
+    'text-generation-ollama': ('inputs',),
+    'text-generation-hf': ('inputs',),
+    'vlm': ('image', 'prompt'),
+    'asr': ('audio',),
+    'asr-hf': ('audio',),
+    'vad-hf': ('audio',),
+    'ocr': ('image',),
+    'ocr-hf': ('image',),
+    'audio-classification': ('audio',),
+    'video-analysis': ('video',),
+    'scene-detection': ('video',),
+    'document-analysis': ('document',),
+    'image-captioning': ('image',),
+    'video-summary': ('video',),
+    'audio-transcription': ('audio',)
+}
+
+# 合法的 (任務, 引擎) 組合 - 一次集合查詢即可完成任務、引擎及其兼容性檢查
+_VALID_TASK_ENGINE = frozenset(
+    (task, engine)
+    for task in _SUPPORTED_TASKS
+    for engine in _SUPPORTED_ENGINES
+    if engine != 'ollama' or task in _OLLAMA_TASKS
+)
+
+def _make_field_validator(fields: tuple):
+    """生成檢查必需字段的驗證函數，返回缺失的字段列表"""
+    def _validate(data: Dict[str, Any]) -> list:
+        return [field for field in fields if field not in data]
+    return _validate
+
+# 各任務類型的必需字段驗證函數
+_FIELD_VALIDATORS = {task: _make_field_validator(fields) for task, fields in _REQUIRED_FIELDS.items()}
+
+@dataclass(frozen=True, slots=True)
+class TaskInfo:
+    """
+    任務配置記錄
+    
+    固定字段的只讀記錄，比每個任務一個字典更省內存；orjson 可直接序列化為與原先相同的 JSON 結構。
+    """
+    engines: Tuple[str, ...]
+    description: str
+    input_format: Dict[str, str]
+    examples: Tuple[str, ...]
+
+# 支持的任務配置信息
+_SUPPORTED_TASKS_INFO: Dict[str, TaskInfo] = {
+    'text-generation-ollama': TaskInfo(
+        engines=('ollama',),
+        description='文本生成任務 (Ollama 引擎)',
+        input_format={'inputs': '輸入文本'},
+        examples=('llama2-7b', 'mistral-7b')
+    ),
+    'text-generation-hf': TaskInfo(
+        engines=('transformers',),
+        description='文本生成任務 (HuggingFace 引擎)',
+        input_format={'inputs': '輸入文本'},
+        examples=('gpt2', 'bloom-560m')
+    ),
+    'text-generation': TaskInfo(
+        engines=('ollama', 'transformers'),
+        description='文本生成任務（通用，向下兼容）',
+        input_format={'inputs': '輸入文本'},
+        examples=('gpt-3.5-turbo', 'llama2-7b')
+    ),
+    'vlm': TaskInfo(
+        engines=('transformers',),
+        description='視覺語言模型任務',
+        input_format={'image': 'base64圖像', 'prompt': '提示詞'},
+        examples=('llava-1.5-7b', 'blip2-t5')
+    ),
+    'asr-hf': TaskInfo(
+        engines=('transformers',),
+        description='自動語音識別任務 (HuggingFace)',
+        input_format={'audio': '音頻文件路徑'},
+        examples=('whisper-large', 'wav2vec2-large')
+    ),
+    'asr': TaskInfo(
+        engines=('transformers',),
+        description='自動語音識別任務（通用）',
+        input_format={'audio': '音頻文件路徑'},
+        examples=('whisper-large', 'wav2vec2-large')
+    ),
+    'vad-hf': TaskInfo(
+        engines=('transformers',),
+        description='語音活動檢測任務 (HuggingFace)',
+        input_format={'audio': '音頻文件路徑'},
+        examples=('silero-vad',)
+    ),
+    'ocr-hf': TaskInfo(
+        engines=('transformers',),
+        description='光學字符識別任務 (HuggingFace)',
+        input_format={'image': '圖像文件路徑'},
+        examples=('trocr-base', 'trocr-large')
+    ),
+    'ocr': TaskInfo(
+        engines=('transformers',),
+        description='光學字符識別任務（通用）',
+        input_format={'image': '圖像文件路徑'},
+        examples=('trocr-base', 'paddleocr')
+    ),
+    'audio-classification': TaskInfo(
+        engines=('transformers',),
+        description='音頻分類任務',
+        input_format={'audio': '音頻文件路徑'},
+        examples=('ast-finetuned', 'wav2vec2-audio')
+    ),
+    'video-analysis': TaskInfo(
+        engines=('transformers',),
+        description='視頻分析任務',
+        input_format={'video': '視頻文件路徑'},
+        examples=('videomae-large', 'vivit-base')
+    ),
+    'scene-detection': TaskInfo(
+        engines=('transformers',),
+        description='場景檢測任務',
+        input_format={'video': '視頻文件路徑'},
+        examples=('scene-detection-model',)
+    ),
+    'document-analysis': TaskInfo(
+        engines=('transformers',),
+        description='文檔分析任務',
+        input_format={'document': '文檔文件路徑'},
+        examples=('layoutlm-large', 'donut-base')
+    ),
+    'image-captioning': TaskInfo(
+        engines=('transformers',),
+        description='圖像標題生成任務',
+        input_format={'image': '圖像文件路徑'},
+        examples=('blip-image-captioning',)
+    ),
+    'video-summary': TaskInfo(
+        engines=('transformers',),
+        description='視頻摘要任務',
+        input_format={'video': '視頻文件路徑'},
+        examples=('video-summary-model',)
+    ),
+    'audio-transcription': TaskInfo(
+        engines=('transformers',),
+        description='音頻轉錄任務',
+        input_format={'audio': '音頻文件路徑'},
+        examples=('whisper-large-v2',)
+    )
+}
+
+# 支持的任務名稱（按配置順序）
+_SUPPORTED_TASK_NAMES = tuple(_SUPPORTED_TASKS_INFO)
+
+class _AtomicCounter:
+    """
+    執行緒安全的計數器
+    
+    以普通 int 記錄計數，遞增時持有各自獨立的短鎖（只包住一次加法），
+    不同計數器之間、以及讀取方都不會互相阻塞。
+    """
+    __slots__ = ('_value', '_lock')
+    
+    def __init__(self):
+        self._value = 0
+        self._lock = threading.Lock()
+    
+    def increment(self) -> None:
+        """計數加一"""
+        with self._lock:
+            self._value += 1
+    
+    @property
+    def value(self) -> int:
+        """當前計數值（讀取單個 int 屬性本身是原子的，無需加鎖）"""
+        return self._value
+
+def _make_result(result: Any, task: str, engine: str, model_name: str,
+                 processing_time: float, timestamp: float) -> Dict[str, Any]:
+    """
+    構建成功推理的結果信封
+    
+    保持普通 dict：API 層會在其上追加 request_id 等字段，且可直接交給 orjson 序列化。
+    """
+    return {
+        'result': result,
+        'task': task,
+        'engine': engine,
+        'model_name': model_name,
+        'processing_time': processing_time,
+        'timestamp': timestamp
+    }
+
+# 結果指紋中非字節值的規範化序列化選項（鍵排序保證等價輸入得到相同指紋）
+_FINGERPRINT_OPTIONS = orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+def _fingerprint_value(value: Any) -> Tuple[bytes, Any]:
+    """
+    將字段值轉換為 (類型標記, 可直接送入哈希的緩衝區)
+    
+    大負載（圖像/音頻字節、base64 字符串）不經 JSON 重新序列化：
+    字節類直接以 memoryview 零拷貝送入 blake2b（大輸入時會釋放 GIL），字符串只做一次 UTF-8 編碼。
+    """
+    if isinstance(value, str):
+        return b's', value.encode()
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return b'b', memoryview(value)
+    return b'j', orjson.dumps(value, option=_FINGERPRINT_OPTIONS, default=repr)
+
+def _result_fingerprint(task: str, engine: str, model_name: str,
+                        data: Dict[str, Any], options: Mapping[str, Any]) -> bytes:
+    """
+    計算請求的內容指紋（blake2b，16 字節）
+    
+    每個值前附加類型標記和長度前綴，避免不同字段拼接後產生碰撞。
+    """
+    hasher = blake2b(f"{task}\0{engine}\0{model_name}".encode(), digest_size=16)
+    for part in (data, options):
+        hasher.update(b'\1')
+        for key in sorted(part, key=str):
+            tag, buffer = _fingerprint_value(part[key])
+            encoded_key = str(key).encode()
+            hasher.update(len(encoded_key).to_bytes(4, 'little'))
+            hasher.update(encoded_key)
+            hasher.update(tag)
+            hasher.update(memoryview(buffer).nbytes.to_bytes(8, 'little'))
+            hasher.update(buffer)
+    return hasher.digest()
+
 class InferenceManager:
     """
     重構後的推理管理器
@@ -73,54 +342,54 @@ class InferenceManager:
     """
     
     _instance: Optional['InferenceManager'] = None
-    _lock = threading.Lock()
     
     def __new__(cls) -> 'InferenceManager':
-        """單例模式實現 - 使用雙重檢查鎖定"""
-        if not cls._instance:
-            with cls._lock:
-                if not cls._instance:
-                    cls._instance = super().__new__(cls)
+        """
+        單例模式實現
+        
+        全局實例在模塊底部創建，該過程受 Python 導入鎖保護，
+        因此首次實例化必然是單執行緒的，無需額外加鎖。
+        """
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
         return cls._instance
     
     def __init__(self):
         """
         初始化推理管理器
         
-        使用類級別的鎖來確保初始化過程的執行緒安全。
-        只有第一次調用會執行初始化邏輯。
+        只有第一次調用會執行初始化邏輯，之後的調用直接返回。
         """
-        # 使用類級別的鎖來保護初始化檢查和設置
-        with self.__class__._lock:
-            if hasattr(self, '_initialized') and self._initialized:
-                return
-                
-            try:
-                # 初始化核心組件
-                self.router = TaskRouter()
-                self.registry = ModelRegistry()
-                self.cache = ModelCache()
-                
-                # 統計信息
-                self.stats = {
-                    'total_inferences': 0,
-                    'successful_inferences': 0,
-                    'failed_inferences': 0,
-                    'cache_hits': 0,
-                    'cache_misses': 0
-                }
-                
-                # 統計數據的執行緒鎖 - 保護 stats 字典的並發訪問
-                self._stats_lock = threading.Lock()
-                
-                # 標記已初始化（使用 _ 前綴表示這是內部屬性）
-                self._initialized = True
-                logger.info("推理管理器初始化完成")
-                
-            except Exception as e:
-                logger.error(f"推理管理器初始化失敗: {e}")
-                raise InferenceError(f"初始化失敗: {e}")
-    
+        if getattr(self, '_initialized', False):
+            return
+        
+        try:
+            # 初始化核心組件
+            self.router = TaskRouter()
+            self.registry = ModelRegistry()
+            self.cache = ModelCache()
+            
+            # 統計計數器 - 每個計數器各自持有一把鎖，遞增只鎖定該計數器
+            self._total_inferences = _AtomicCounter()
+            self._successful_inferences = _AtomicCounter()
+            self._failed_inferences = _AtomicCounter()
+            self._cache_hits = _AtomicCounter()
+            self._cache_misses = _AtomicCounter()
+            
+            # 推理結果緩存: {指紋: result}，完全相同的請求直接返回上次結果
+            # 默認關閉（大小為 0）：採樣生成的結果本身不確定，只應在明確需要時開啟
+            self._result_cache: "OrderedDict[bytes, Any]" = OrderedDict()
+            self._result_cache_size = max(0, int(os.getenv("INFER_RESULT_CACHE_SIZE", "0")))
+            self._result_cache_lock = threading.Lock()
+            
+            # 標記已初始化（使用 _ 前綴表示這是內部屬性）
+            self._initialized = True
+            logger.info("推理管理器初始化完成")
+            
+        except Exception as e:
+            logger.error(f"推理管理器初始化失敗: {e}")
+            raise InferenceError(f"初始化失敗: {e}")
+
     def infer(self, 
               task: str, 
               engine: str, 
@@ -170,62 +439,106 @@ class InferenceManager:
             ResourceExhaustedError: 資源耗盡
             InferenceError: 推理過程中的其他錯誤
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         
-        # 執行緒安全地更新統計計數
-        with self._stats_lock:
-            self.stats['total_inferences'] += 1
+        self._total_inferences.increment()
+        if options is None:
+            options = _EMPTY_OPTIONS
         
         try:
-            logger.info(f"開始推理 - 任務: {task}, 引擎: {engine}, 模型: {model_name}")
+            logger.info("開始推理 - 任務: %s, 引擎: %s, 模型: %s", task, engine, model_name)
             
             # 參數驗證 - 可能拋出 ValidationError 或 UnsupportedTaskError
             self._validate_parameters(task, engine, model_name, data)
             
+            # 結果緩存命中時跳過路由與執行
+            fingerprint = None
+            if self._result_cache_size:
+                fingerprint = _result_fingerprint(task, engine, model_name, data, options)
+                with self._result_cache_lock:
+                    result = self._result_cache.get(fingerprint, _MISSING)
+                    if result is not _MISSING:
+                        self._result_cache.move_to_end(fingerprint)
+                if result is not _MISSING:
+                    self._cache_hits.increment()
+                    self._successful_inferences.increment()
+                    logger.info("推理結果緩存命中 - 任務: %s, 模型: %s", task, model_name)
+                    return _make_result(result, task, engine, model_name,
+                                        time.perf_counter() - start_time, time.time())
+                self._cache_misses.increment()
+            
             # 任務路由，獲取執行器 - 可能拋出 UnsupportedTaskError
             executor = self.router.route(task, engine, model_name)
             
             # 執行推理 - 可能拋出 ModelNotFoundError, InferenceExecutionError 等
-            result = executor.execute(model_name, data, options or {})
+            result = executor.execute(model_name, data, options)
+            
+            if fingerprint is not None:
+                with self._result_cache_lock:
+                    self._result_cache[fingerprint] = result
+                    self._result_cache.move_to_end(fingerprint)
+                    while len(self._result_cache) > self._result_cache_size:
+                        self._result_cache.popitem(last=False)
             
-            # 執行緒安全地更新成功統計
-            with self._stats_lock:
-                self.stats['successful_inferences'] += 1
+            self._successful_inferences.increment()
             
-            processing_time = time.time() - start_time
+            # 耗時使用單調時鐘計算，牆上時間只取一次作為時間戳
+            processing_time = time.perf_counter() - start_time
+            timestamp = time.time()
             
-            logger.info(f"推理完成 - 用時: {processing_time:.2f}秒")
+            logger.info("推理完成 - 用時: %.2f秒", processing_time)
             
             # 只返回成功結果，不包含 success 標誌
             # 如果有錯誤，會通過異常拋出
-            return {
-                'result': result,
-                'task': task,
-                'engine': engine,
-                'model_name': model_name,
-                'processing_time': processing_time,
-                'timestamp': time.time()
-            }
+            return _make_result(result, task, engine, model_name, processing_time, timestamp)
             
         except (ValidationError, UnsupportedTaskError, ModelNotFoundError, 
                 ResourceNotFoundError, ModelLoadError, InferenceExecutionError,
                 EngineError, ResourceExhaustedError) as e:
-            # 已知的推理異常，執行緒安全地更新失敗統計後直接向上傳播
-            with self._stats_lock:
-                self.stats['failed_inferences'] += 1
+            # 已知的推理異常，更新失敗統計後直接向上傳播
+            self._failed_inferences.increment()
             
             logger.error(f"推理失敗 ({type(e).__name__}): {e}")
             raise
             
         except Exception as e:
             # 未預期的異常，包裝為 InferenceExecutionError 後向上傳播
-            with self._stats_lock:
-                self.stats['failed_inferences'] += 1
+            self._failed_inferences.increment()
             
             logger.error(f"推理執行時發生未預期錯誤: {e}", exc_info=True)
             raise InferenceExecutionError(f"推理執行失敗: {str(e)}") from e
     
-    def _validate_parameters(self, task: str, engine: str, model_name: str, data: Dict) -> None:
+    async def infer_async(self,
+                          task: str,
+                          engine: str,
+                          model_name: str,
+                          data: Dict[str, Any],
+                          options: Optional[Dict[str, Any]] = None,
+                          executor: Optional[Executor] = None) -> Dict[str, Any]:
+        """
+        異步推理接口
+        
+        在執行緒池中運行阻塞的 infer()，供 async 端點調用而不阻塞事件循環。
+        統計計數器各自持鎖，每次遞增只短暫鎖定單一計數器。
+        
+        Args:
+            task, engine, model_name, data, options: 同 infer()
+            executor (Executor, optional): 執行推理的執行緒池，默認使用事件循環的默認執行器
+            
+        Returns:
+            Dict[str, Any]: 推理結果，同 infer()
+            
+        Raises:
+            同 infer()
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            executor,
+            functools.partial(self.infer, task, engine, model_name, data, options)
+        )
+    
+    @staticmethod
+    def _validate_parameters(task: str, engine: str, model_name: str, data: Dict) -> None:
         """
         驗證推理參數
         
@@ -240,221 +553,112 @@ class InferenceManager:
             UnsupportedTaskError: 不支持的任務或引擎組合
         """
         # 檢查參數完整性
-        if not all([task, engine, model_name]):
+        if not (task and engine and model_name):
             raise ValidationError("task, engine, model_name 不能為空")
         
-        # 檢查任務類型
-        supported_tasks = {
-            'text-generation', 'text-generation-ollama', 'text-generation-hf',
-            'vlm', 'asr', 'asr-hf', 'vad-hf', 'ocr', 'ocr-hf',
-            'audio-classification', 'video-analysis', 'scene-detection',
-            'document-analysis', 'image-captioning', 'video-summary',
-            'audio-transcription'
-        }
-        if task not in supported_tasks:
-            raise UnsupportedTaskError(f"不支持的任務類型: {task}，支持的任務: {supported_tasks}")
-        
-        # 檢查引擎類型
-        supported_engines = {'ollama', 'transformers'}
-        if engine not in supported_engines:
-            raise UnsupportedTaskError(f"不支持的引擎類型: {engine}，支持的引擎: {supported_engines}")
+        # 快速路徑：最常見的通用文本生成請求，兩個引擎均支持，只需檢查 inputs 字段
+        if task == 'text-generation' and engine in _TEXT_GENERATION_ENGINES \
+                and type(data) is dict and 'inputs' in data:
+            return
         
-        # 檢查引擎與任務的兼容性
-        ollama_tasks = {'text-generation', 'text-generation-ollama'}
-        if engine == 'ollama' and task not in ollama_tasks:
-            raise UnsupportedTaskError(f"Ollama 引擎僅支持 {ollama_tasks} 任務，當前任務: {task}")
+        # 檢查任務與引擎組合，不合法時再細分具體原因
+        if (task, engine) not in _VALID_TASK_ENGINE:
+            if task not in _SUPPORTED_TASKS:
+                raise UnsupportedTaskError(f"不支持的任務類型: {task}，支持的任務: {set(_SUPPORTED_TASKS)}")
+            if engine not in _SUPPORTED_ENGINES:
+                raise UnsupportedTaskError(f"不支持的引擎類型: {engine}，支持的引擎: {set(_SUPPORTED_ENGINES)}")
+            raise UnsupportedTaskError(f"Ollama 引擎僅支持 {set(_OLLAMA_TASKS)} 任務，當前任務: {task}")
         
         # 檢查輸入數據
         if not isinstance(data, dict) or not data:
             raise ValidationError("data 必須是非空字典")
         
         # 根據任務類型檢查必需的數據字段
-        required_fields = {
-            'text-generation': ['inputs'],
-            'text-generation-ollama': ['inputs'],
-            'text-generation-hf': ['inputs'],
-            'vlm': ['image', 'prompt'],
-            'asr': ['audio'],
-            'asr-hf': ['audio'],
-            'vad-hf': ['audio'],
-            'ocr': ['image'],
-            'ocr-hf': ['image'],
-            'audio-classification': ['audio'],
-            'video-analysis': ['video'],
-            'scene-detection': ['video'],
-            'document-analysis': ['document'],
-            'image-captioning': ['image'],
-            'video-summary': ['video'],
-            'audio-transcription': ['audio']
-        }
-        
-        if task in required_fields:
-            missing_fields = [field for field in required_fields[task] if field not in data]
-            if missing_fields:
-                raise ValidationError(f"任務 {task} 缺少必需的數據字段: {missing_fields}")
+        missing_fields = _FIELD_VALIDATORS[task](data)
+        if missing_fields:
+            raise ValidationError(f"任務 {task} 缺少必需的數據字段: {missing_fields}")
     
-    def get_supported_tasks(self) -> Dict[str, Dict[str, Any]]:
+    def get_supported_tasks(self) -> Dict[str, TaskInfo]:
         """
         獲取支持的任務類型和對應的引擎
         
+        返回模塊級常量，調用方不應修改返回的字典。
+        
         Returns:
-            Dict[str, Dict[str, Any]]: 支持的任務配置
+            Dict[str, TaskInfo]: 支持的任務配置
         """
-        return {
-            'text-generation-ollama': {
-                'engines': ['ollama'],
-                'description': '文本生成任務 (Ollama 引擎)',
-                'input_format': {'inputs': '輸入文本'},
-                'examples': ['llama2-7b', 'mistral-7b']
-            },
-            'text-generation-hf': {
-                'engines': ['transformers'],
-                'description': '文本生成任務 (HuggingFace 引擎)',
-                'input_format': {'inputs': '輸入文本'},
-                'examples': ['gpt2', 'bloom-560m']
-            },
-            'text-generation': {
-                'engines': ['ollama', 'transformers'],
-                'description': '文本生成任務（通用，向下兼容）',
-                'input_format': {'inputs': '輸入文本'},
-                'examples': ['gpt-3.5-turbo', 'llama2-7b']
-            },
-            'vlm': {
-                'engines': ['transformers'],
-                'description': '視覺語言模型任務',
-                'input_format': {'image': 'base64圖像', 'prompt': '提示詞'},
-                'examples': ['llava-1.5-7b', 'blip2-t5']
-            },
-            'asr-hf': {
-                'engines': ['transformers'],
-                'description': '自動語音識別任務 (HuggingFace)',
-                'input_format': {'audio': '音頻文件路徑'},
-                'examples': ['whisper-large', 'wav2vec2-large']
-            },
-            'asr': {
-                'engines': ['transformers'],
-                'description': '自動語音識別任務（通用）',
-                'input_format': {'audio': '音頻文件路徑'},
-                'examples': ['whisper-large', 'wav2vec2-large']
-            },
-            'vad-hf': {
-                'engines': ['transformers'],
-                'description': '語音活動檢測任務 (HuggingFace)',
-                'input_format': {'audio': '音頻文件路徑'},
-                'examples': ['silero-vad']
-            },
-            'ocr-hf': {
-                'engines': ['transformers'],
-                'description': '光學字符識別任務 (HuggingFace)',
-                'input_format': {'image': '圖像文件路徑'},
-                'examples': ['trocr-base', 'trocr-large']
-            },
-            'ocr': {
-                'engines': ['transformers'],
-                'description': '光學字符識別任務（通用）',
-                'input_format': {'image': '圖像文件路徑'},
-                'examples': ['trocr-base', 'paddleocr']
-            },
-            'audio-classification': {
-                'engines': ['transformers'],
-                'description': '音頻分類任務',
-                'input_format': {'audio': '音頻文件路徑'},
-                'examples': ['ast-finetuned', 'wav2vec2-audio']
-            },
-            'video-analysis': {
-                'engines': ['transformers'],
-                'description': '視頻分析任務',
-                'input_format': {'video': '視頻文件路徑'},
-                'examples': ['videomae-large', 'vivit-base']
-            },
-            'scene-detection': {
-                'engines': ['transformers'],
-                'description': '場景檢測任務',
-                'input_format': {'video': '視頻文件路徑'},
-                'examples': ['scene-detection-model']
-            },
-            'document-analysis': {
-                'engines': ['transformers'],
-                'description': '文檔分析任務',
-                'input_format': {'document': '文檔文件路徑'},
-                'examples': ['layoutlm-large', 'donut-base']
-            },
-            'image-captioning': {
-                'engines': ['transformers'],
-                'description': '圖像標題生成任務',
-                'input_format': {'image': '圖像文件路徑'},
-                'examples': ['blip-image-captioning']
-            },
-            'video-summary': {
-                'engines': ['transformers'],
-                'description': '視頻摘要任務',
-                'input_format': {'video': '視頻文件路徑'},
-                'examples': ['video-summary-model']
-            },
-            'audio-transcription': {
-                'engines': ['transformers'],
-                'description': '音頻轉錄任務',
-                'input_format': {'audio': '音頻文件路徑'},
-                'examples': ['whisper-large-v2']
-            }
-        }
+        return _SUPPORTED_TASKS_INFO
     
     def get_stats(self) -> Dict[str, Any]:
         """
         獲取推理管理器統計信息
         
-        執行緒安全地讀取統計數據，確保返回的數據是一致的快照。
+        各計數器逐個讀取，數值之間只是近似一致，不保證為同一時刻的快照。
         
         Returns:
             Dict[str, Any]: 統計信息
         """
-        # 執行緒安全地讀取統計數據，創建一個一致的快照
-        with self._stats_lock:
-            stats_snapshot = self.stats.copy()
-            total = stats_snapshot['total_inferences']
-            successful = stats_snapshot['successful_inferences']
-            cache_hits = stats_snapshot['cache_hits']
-            cache_misses = stats_snapshot['cache_misses']
+        # 各計數器逐個讀取：每個計數器各自持鎖遞增，跨計數器沒有共同的鎖，
+        # 計數器之間的短暫偏差對監控用的比率估算無影響
+        total = self._total_inferences.value
+        successful = self._successful_inferences.value
+        failed = self._failed_inferences.value
+        cache_hits = self._cache_hits.value
+        cache_misses = self._cache_misses.value
         
-        # 在鎖外計算衍生統計（避免長時間持有鎖）
         return {
-            **stats_snapshot,
+            'total_inferences': total,
+            'successful_inferences': successful,
+            'failed_inferences': failed,
+            'cache_hits': cache_hits,
+            'cache_misses': cache_misses,
             'success_rate': successful / max(total, 1),
             'cache_hit_rate': cache_hits / max(cache_hits + cache_misses, 1),
             'cached_models': self.cache.get_cached_models(),
-            'supported_tasks': list(self.get_supported_tasks().keys())
+            'supported_tasks': list(_SUPPORTED_TASK_NAMES)
         }
     
     def clear_cache(self) -> None:
-        """清理模型緩存"""
+        """清理模型緩存和推理結果緩存"""
         self.cache.clear()
+        with self._result_cache_lock:
+            self._result_cache.clear()
         logger.info("模型緩存已清理")
     
-    def health_check(self) -> Dict[str, Any]:
+    def health_check(self, include_stats: bool = True) -> Dict[str, Any]:
         """
         健康檢查
         
+        Args:
+            include_stats (bool): 是否在結果中附帶統計信息，僅需存活探測時可關閉
+        
         Returns:
             Dict[str, Any]: 健康狀態信息
         """
         try:
             # 檢查核心組件
-            components_status = {
-                'router': self.router is not None,
-                'registry': self.registry is not None,
-                'cache': self.cache is not None,
-                'model_manager': model_manager is not None,
-                'gpu_manager': gpu_manager is not None
-            }
+            router_ok = self.router is not None
+            registry_ok = self.registry is not None
+            cache_ok = self.cache is not None
+            model_manager_ok = model_manager is not None
+            gpu_manager_ok = gpu_manager is not None
             
-            all_healthy = all(components_status.values())
+            all_healthy = router_ok and registry_ok and cache_ok and model_manager_ok and gpu_manager_ok
             
-            return {
+            health_info = {
                 'status': 'healthy' if all_healthy else 'unhealthy',
-                'components': components_status,
-                'stats': self.get_stats(),
+                'components': {
+                    'router': router_ok,
+                    'registry': registry_ok,
+                    'cache': cache_ok,
+                    'model_manager': model_manager_ok,
+                    'gpu_manager': gpu_manager_ok
+                },
                 'timestamp': time.time()
             }
+            if include_stats:
+                health_info['stats'] = self.get_stats()
+            return health_info
             
         except Exception as e:
             logger.error(f"健康檢查失敗: {e}")
@@ -7,7 +7,8 @@
 """
 
 import logging
-from typing import Dict, Any, Optional
+import threading
+from typing import Dict, Any, Optional, Tuple
 
 # 模組內部導入
 from .executor import ModelExecutor
@@ -32,10 +33,31 @@ class TaskRouter:
     管理引擎實例的創建和重用。
     """
     
+    # 任務描述
+    _TASK_DESCRIPTIONS = {
+        'text-generation-ollama': '文本生成任務 (Ollama 引擎)',
+        'text-generation-hf': '文本生成任務 (HuggingFace 引擎)',
+        'text-generation': '文本生成任務（通用）',
+        'vlm': '視覺語言模型任務，結合圖像和文本進行理解和生成',
+        'asr-hf': '自動語音識別任務 (HuggingFace)',
+        'asr': '自動語音識別任務（通用）',
+        'vad-hf': '語音活動檢測任務 (HuggingFace)',
+        'ocr-hf': '光學字符識別任務 (HuggingFace)',
+        'ocr': '光學字符識別任務（通用）',
+        'audio-classification': '音頻分類任務，對音頻內容進行分類',
+        'video-analysis': '視頻分析任務，分析視頻內容和場景',
+        'scene-detection': '場景檢測任務，檢測視頻中的場景變化',
+        'document-analysis': '文檔分析任務，理解和提取文檔結構與內容',
+        'image-captioning': '圖像標題生成任務，為圖像生成描述文本',
+        'video-summary': '視頻摘要任務，生成視頻內容摘要',
+        'audio-transcription': '音頻轉錄任務，將音頻轉換為文本'
+    }
+    
     def __init__(self):
         """初始化任務路由器"""
         # 引擎實例緩存
         self._engines: Dict[str, Any] = {}
+        self._engines_lock = threading.Lock()
         
         # 執行器緩存: {(task, engine): executor}
         self._executors: Dict[tuple, ModelExecutor] = {}
@@ -106,8 +128,45 @@ class TaskRouter:
             }
         }
         
+        # 扁平化的 (task, engine) -> 引擎類 查找表：路由只需一次字典查找
+        # 字符串的哈希值會緩存在對象上，元組鍵無需再轉換為整數編碼
+        self._engine_classes: Dict[Tuple[str, str], type] = {
+            (task, engine): engine_class
+            for task, engines in self._task_engine_mapping.items()
+            for engine, engine_class in engines.items()
+        }
+        
         self._initialized = True
         logger.info("任務路由器初始化完成 (v2.1.1)")
+        
+        # 在後台預先創建引擎實例，將引擎初始化延遲移到啟動階段
+        if self._prewarm_enabled():
+            threading.Thread(target=self._prewarm_engines, name="engine-prewarm", daemon=True).start()
+    
+    @staticmethod
+    def _prewarm_enabled() -> bool:
+        """讀取 inference.router.prewarm_engines 配置（默認開啟）"""
+        try:
+            from ..core.config import config as app_config
+            prewarm = app_config.get_config("inference", "router", "prewarm_engines")
+        except Exception as e:
+            logger.debug(f"無法讀取引擎預熱配置: {e}")
+            prewarm = None
+        return True if prewarm is None else bool(prewarm)
+    
+    def _prewarm_engines(self):
+        """預先創建映射中出現的所有引擎實例"""
+        engine_classes = {}
+        for engines in self._task_engine_mapping.values():
+            engine_classes.update(engines)
+        
+        for engine_type, engine_class in engine_classes.items():
+            try:
+                self._get_or_create_engine(engine_type, engine_class)
+                logger.info(f"引擎預熱完成: {engine_type}")
+            except Exception as e:
+                # 預熱失敗不影響服務，首個請求會再次嘗試創建
+                logger.warning(f"引擎預熱失敗: {engine_type}, 錯誤: {e}")
     
     def route(self, task: str, engine: str, model_name: str) -> ModelExecutor:
         """
@@ -126,38 +185,38 @@ class TaskRouter:
             ValidationError: 參數無效
             InferenceError: 路由過程中的其他錯誤
         """
+        # 快速路徑：已緩存的執行器只對應合法的任務/引擎組合，一次查找即可返回
+        executor_key = (task, engine)
+        executor = self._executors.get(executor_key)
+        if executor is not None:
+            logger.debug("重用已緩存的執行器: %s -> %s", task, engine)
+            return executor
+        
         try:
-            logger.debug(f"路由任務: {task} -> {engine} -> {model_name}")
+            logger.debug("路由任務: %s -> %s -> %s", task, engine, model_name)
             
-            # 檢查任務類型是否支持
-            if task not in self._task_engine_mapping:
-                raise UnsupportedTaskError(f"不支持的任務類型: {task}")
-            
-            # 檢查引擎類型是否支持該任務
-            task_engines = self._task_engine_mapping[task]
-            if engine not in task_engines:
-                supported_engines = list(task_engines.keys())
+            # 一次查找確認任務/引擎組合是否支持，失敗時再區分具體原因
+            engine_class = self._engine_classes.get(executor_key)
+            if engine_class is None:
+                if task not in self._task_engine_mapping:
+                    raise UnsupportedTaskError(f"不支持的任務類型: {task}")
+                supported_engines = list(self._task_engine_mapping[task].keys())
                 raise UnsupportedTaskError(
                     f"任務 '{task}' 不支持引擎 '{engine}'，支持的引擎: {supported_engines}"
                 )
             
-            # 檢查是否已有緩存的執行器
-            executor_key = (task, engine)
-            if executor_key in self._executors:
-                logger.debug(f"重用已緩存的執行器: {task} -> {engine}")
-                return self._executors[executor_key]
-            
             # 獲取或創建引擎實例
-            engine_instance = self._get_or_create_engine(engine, task_engines[engine])
+            engine_instance = self._get_or_create_engine(engine, engine_class)
             
             # 獲取模型處理器
             model_handler = get_model_handler(task, model_name)
             
-            # 創建並緩存執行器
-            executor = ModelExecutor(engine_instance, model_handler)
-            self._executors[executor_key] = executor
+            # 創建並緩存執行器；並發創建時保留先寫入的執行器，避免其已加載的模型被丟棄
+            executor = self._executors.setdefault(
+                executor_key, ModelExecutor(engine_instance, model_handler)
+            )
             
-            logger.debug(f"成功創建並緩存執行器: {task} -> {engine}")
+            logger.debug("成功創建並緩存執行器: %s -> %s", task, engine)
             return executor
             
         except (UnsupportedTaskError, ValidationError):
@@ -179,24 +238,35 @@ class TaskRouter:
         Returns:
             Any: 引擎實例
         """
-        if engine_type not in self._engines:
-            logger.debug(f"創建新的引擎實例: {engine_type}")
+        # 命中路徑只做一次無鎖查找
+        engine_instance = self._engines.get(engine_type)
+        if engine_instance is not None:
+            logger.debug("重用現有引擎實例: %s", engine_type)
+            return engine_instance
+        
+        # 未命中時加鎖並再次檢查，保證預熱線程與請求線程不會重複創建同一引擎
+        with self._engines_lock:
+            engine_instance = self._engines.get(engine_type)
+            if engine_instance is not None:
+                return engine_instance
+            
+            logger.debug("創建新的引擎實例: %s", engine_type)
             # 為 Ollama engine 傳遞配置
             if engine_type == 'ollama':
                 try:
                     from ..core.config import config as app_config
                     ollama_config = app_config.get_config("ollama") or {}
-                    logger.debug(f"Ollama 引擎配置: {ollama_config}")
-                    self._engines[engine_type] = engine_class(config=ollama_config)
+                    logger.debug("Ollama 引擎配置: %s", ollama_config)
+                    engine_instance = engine_class(config=ollama_config)
                 except Exception as e:
                     logger.warning(f"無法加載 Ollama 配置: {e}，使用默認配置")
-                    self._engines[engine_type] = engine_class()
+                    engine_instance = engine_class()
             else:
-                self._engines[engine_type] = engine_class()
-        else:
-            logger.debug(f"重用現有引擎實例: {engine_type}")
+                engine_instance = engine_class()
             
-        return self._engines[engine_type]
+            self._engines[engine_type] = engine_instance
+        
+        return engine_instance
     
     def get_supported_combinations(self) -> Dict[str, Any]:
         """
@@ -223,25 +293,7 @@ class TaskRouter:
         Returns:
             str: 任務描述
         """
-        descriptions = {
-            'text-generation-ollama': '文本生成任務 (Ollama 引擎)',
-            'text-generation-hf': '文本生成任務 (HuggingFace 引擎)',
-            'text-generation': '文本生成任務（通用）',
-            'vlm': '視覺語言模型任務，結合圖像和文本進行理解和生成',
-            'asr-hf': '自動語音識別任務 (HuggingFace)',
-            'asr': '自動語音識別任務（通用）',
-            'vad-hf': '語音活動檢測任務 (HuggingFace)',
-            'ocr-hf': '光學字符識別任務 (HuggingFace)',
-            'ocr': '光學字符識別任務（通用）',
-            'audio-classification': '音頻分類任務，對音頻內容進行分類',
-            'video-analysis': '視頻分析任務，分析視頻內容和場景',
-            'scene-detection': '場景檢測任務，檢測視頻中的場景變化',
-            'document-analysis': '文檔分析任務，理解和提取文檔結構與內容',
-            'image-captioning': '圖像標題生成任務，為圖像生成描述文本',
-            'video-summary': '視頻摘要任務，生成視頻內容摘要',
-            'audio-transcription': '音頻轉錄任務，將音頻轉換為文本'
-        }
-        return descriptions.get(task, f'{task} 任務')
+        return self._TASK_DESCRIPTIONS.get(task, f'{task} 任務')
     
     def clear_engines(self):
         """清理引擎和執行器緩存"""
@@ -250,5 +302,6 @@ class TaskRouter:
             executor.clear_models()
         
         self._executors.clear()
-        self._engines.clear()
+        with self._engines_lock:
+            self._engines.clear()
         logger.info("引擎和執行器緩存已清理")
\ No newline at end of file
@@ -1,8 +1,11 @@
 # src/main.py
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 from .api import models_api, datasets_api, gpu_api, config_api, inference_api
+from .api.responses import ORJSONResponse
 from .core.gpu_manager import gpu_manager
 from .core.model_manager import model_manager  # 確保 model_manager 被初始化
+from .inference.exceptions import InferenceError
 
 app = FastAPI(
     title="AI 模型生命週期管理平台",
@@ -10,9 +13,13 @@ app = FastAPI(
     version="2.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
-    openapi_url="/openapi.json"
+    openapi_url="/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
+# 響應壓縮 - 僅壓縮超過 1KB 的響應（GZipMiddleware 會自動附加 Vary: Accept-Encoding）
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=6)
+
 # 引入所有 API 路由
 app.include_router(models_api.router)
 app.include_router(datasets_api.router)
@@ -20,6 +27,9 @@ app.include_router(inference_api.router)
 app.include_router(gpu_api.router)
 app.include_router(config_api.router)
 
+# 推理異常統一轉換為 HTTP 錯誤響應
+app.add_exception_handler(InferenceError, inference_api.inference_error_handler)
+
 @app.get("/", tags=["系統狀態 (System Status)"])
 def read_root():
     """系統根端點，返回平台基本信息和狀態"""
@@ -221,3 +231,7 @@ def get_api_info():
         ]
     }
 
+
+# 所有路由註冊完成後預先生成並緩存 OpenAPI schema，
+# 首次訪問 /docs 或 /openapi.json 時不再需要現場構建
+app.openapi()
@@ -7,28 +7,1409 @@ API Base URL: http://raptor_open_0_1_api.dhtsolution.com:8012
 API Docs: http://raptor_open_0_1_api.dhtsolution.com:8012/docs
 """
 
+import asyncio
+import gzip
+import http.client
+import os
 import requests
 import json
-from typing import Optional, List, Dict, Any
+import math
+import shutil
+import threading
+import time
+import urllib.parse
+import uuid
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator, Tuple, Callable, Sequence, ClassVar, Mapping
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# requests-toolbelt 為選用依賴，安裝後上傳檔案改為串流方式
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# httpx 為選用依賴，僅 AsyncRaptorAPIClient 需要
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson 為選用依賴，安裝後以其編碼/解碼 JSON (較標準 json 模組快數倍)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(payload: Any, sort_keys: bool = False) -> bytes:
+    """將請求內容編碼為 JSON bytes；sort_keys 時按鍵排序，可作為穩定的快取鍵"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(payload, sort_keys=sort_keys).encode("utf-8")
+
+
+def _json_loads(content: bytes) -> Any:
+    """將回應內容解碼為 Python 物件"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_request_body(payload: Any, headers: Mapping[str, str], compress: bool) -> Tuple[bytes, Mapping[str, str]]:
+    """
+    將請求內容編碼為 JSON 本體並返回對應的標頭
+    
+    compress 為真且本體達到 REQUEST_COMPRESSION_MIN_SIZE 時以 gzip 壓縮，並加上 Content-Encoding 標頭。
+    """
+    body = _json_dumps(payload)
+    if compress and len(body) >= REQUEST_COMPRESSION_MIN_SIZE:
+        return gzip.compress(body, compresslevel=5), {**headers, "Content-Encoding": "gzip"}
+    return body, headers
+
+
+# SSE 串流結束標記
+SSE_DONE = "[DONE]"
+
+
+def _sse_text(line: str) -> Optional[str]:
+    """取出 SSE "data:" 行的文字片段；事件名稱、註解與空行返回 None"""
+    if not line.startswith("data:"):
+        return None
+    data = line[6:] if line.startswith("data: ") else line[5:]
+    if data.startswith("{"):
+        try:
+            return _json_loads(data).get("response", "")
+        except ValueError:
+            pass
+    return data
+
+
+# 各 API 端點路徑 (相對於 base_url)
+API_PATHS = {
+    "register": "/api/v1/auth/register",
+    "login": "/api/v1/auth/login",
+    "video_search": "/api/v1/search/video_search",
+    "audio_search": "/api/v1/search/audio_search",
+    "document_search": "/api/v1/search/document_search",
+    "image_search": "/api/v1/search/image_search",
+    "unified_search": "/api/v1/search/unified_search",
+    "fileupload": "/api/v1/asset/fileupload",
+    "fileupload_batch": "/api/v1/asset/fileupload_batch",
+    "fileupload_analysis": "/api/v1/asset/fileupload_analysis",
+    "fileupload_analysis_batch": "/api/v1/asset/fileupload_analysis_batch",
+    "fileversions": "/api/v1/asset/fileversions",
+    "filedownload": "/api/v1/asset/filedownload",
+    "filearchive": "/api/v1/asset/filearchive",
+    "delfile": "/api/v1/asset/delfile",
+    "process_file": "/api/v1/processing/process-file",
+    "processing_cache": "/api/v1/processing/processing/cache",
+    "cache_all": "/api/v1/processing/cache/all",
+    "chat": "/api/v1/chat/chat",
+    "chat_memory": "/api/v1/chat/memory",
+    "health": "/health"
+}
+
+# 串流下載的區塊大小 (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# 大於此大小的上傳檔案以 1 MiB 讀取緩衝開啟，減少讀檔系統呼叫次數
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# 上傳端點的共同路徑前綴；上傳請求不自動重試
+UPLOAD_PATH_PREFIX = "/api/v1/asset/fileupload"
+
+# get_cached_value / get_all_cache 的本地讀取快取：有效時間 (秒) 與最大條目數
+READ_CACHE_TTL = 2.0
+READ_CACHE_MAX_ENTRIES = 1024
+
+# 啟用 compress_requests 時，JSON 請求本體達到此大小 (bytes) 才以 gzip 壓縮
+REQUEST_COMPRESSION_MIN_SIZE = 1024
+
+# POST 只在這些狀態碼時自動重試：429 / 503 代表伺服器拒絕了請求而未處理，重送不會造成重複執行
+POST_RETRY_STATUSES = frozenset([429, 503])
+
+
+class _IdempotentRetry(Retry):
+    """
+    GET / DELETE 依 status_forcelist 重試；POST 只在 POST_RETRY_STATUSES 時重試
+    
+    收到 500 / 502 / 504 時伺服器可能已完成處理，重送 process_file、send_chat、archive_asset、
+    register_user 等非冪等的 POST 會造成重複處理或重複的聊天輪次。
+    POST 不在 allowed_methods 中，讀取逾時等連線中途的錯誤同樣不會重送 POST。
+    """
+    
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class SearchResultCache:
+    """
+    搜尋結果快取 (選用)
+    
+    以 (端點, 使用者 token, 篩選條件) 分區，預設以正規化後的查詢文字 (合併空白、轉小寫) 精確比對；
+    提供 embed_fn 時改為語意比對：查詢向量與同分區已快取查詢的餘弦相似度達到 threshold 即視為命中，
+    例如傳入 sentence-transformers 模型的 encode，讓措辭略有差異的查詢也能直接返回快取結果。
+    
+    Args:
+        ttl: 快取有效時間 (秒)
+        max_entries: 最大快取筆數，超出時淘汰最久未使用的項目
+        embed_fn: 將查詢文字轉換為向量的函數 (可選)
+        threshold: 語意比對的餘弦相似度閾值
+    """
+    
+    def __init__(
+        self,
+        ttl: float = 600.0,
+        max_entries: int = 256,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = 0.92
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        # {(分區, 正規化查詢): (寫入時間, 單位化查詢向量, 搜尋結果)}
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[float, Optional[List[float]], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def _normalize(query_text: str) -> str:
+        """正規化查詢文字"""
+        return " ".join(query_text.split()).lower()
+    
+    def _embed(self, text: str) -> List[float]:
+        """計算單位化查詢向量"""
+        vector = [float(x) for x in self.embed_fn(text)]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+    
+    def _nearest(self, namespace: Any, vector: List[float], now: float) -> Any:
+        """在同分區中尋找相似度最高且未過期的快取結果"""
+        best, best_score = None, self.threshold
+        with self._lock:
+            for (entry_namespace, _), (stored_at, entry_vector, result) in self._entries.items():
+                if entry_namespace != namespace or entry_vector is None or now - stored_at >= self.ttl:
+                    continue
+                score = sum(a * b for a, b in zip(vector, entry_vector))
+                if score >= best_score:
+                    best, best_score = result, score
+        return best
+    
+    def get_or_fetch(self, namespace: Any, query_text: str, fetch: Callable[[], Any]) -> Any:
+        """
+        取得快取結果，未命中時呼叫 fetch 並快取其結果
+        
+        Args:
+            namespace: 快取分區
+            query_text: 查詢文字
+            fetch: 未命中時取得結果的函數
+            
+        Returns:
+            搜尋結果 (快取命中時與先前返回的是同一物件，請勿修改)
+        """
+        key = (namespace, self._normalize(query_text))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[2]
+        
+        vector = None
+        if self.embed_fn is not None:
+            vector = self._embed(key[1])
+            result = self._nearest(namespace, vector, now)
+            if result is not None:
+                return result
+        
+        result = fetch()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), vector, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+    
+    def clear(self) -> None:
+        """清除所有快取"""
+        with self._lock:
+            self._entries.clear()
 
 
 class RaptorAPIClient:
     """RAPTOR API Gateway 客戶端"""
     
-    def __init__(self, base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012"):
+    # 同一進程內所有客戶端實例共用的 Session 與連線池，首次使用時建立；
+    # 各實例只保留自己的 token，認證資訊透過請求標頭傳遞，不會互相影響
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    # 已預熱連線池的 base_url
+    _warmed_base_urls: ClassVar[set] = set()
+    # 每個主機保留的連線數上限；需在建立共用 Session (首次請求) 之前設定，多執行緒服務可依 worker 執行緒數調大
+    pool_maxsize: ClassVar[int] = 16
+    
+    def __init__(
+        self,
+        base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012",
+        search_cache: Optional["SearchResultCache"] = None,
+        warm_up: bool = True,
+        compress_requests: bool = False
+    ):
+        self.base_url = base_url
+        self.token = None
+        # 以 gzip 壓縮較大的 JSON 請求本體，預設關閉 (伺服器需支援解壓 Content-Encoding: gzip 的請求)
+        self.compress_requests = compress_requests
+        # 搜尋結果快取，預設關閉
+        self.search_cache = search_cache
+        # Redis 快取讀取結果的短時效本地快取，輪詢時避免重複打到網路
+        self._read_cache: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        # health_check 的 ETag 與對應回應，用於條件式 GET
+        self._health_etag: Optional[str] = None
+        self._health_body: Optional[Dict[str, Any]] = None
+        
+        # 在背景預熱連線池 (每個 base_url 只執行一次)
+        if warm_up:
+            self._warm_up()
+    
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """建立帶連線池與重試設定的 Session"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=cls.pool_maxsize,
+            # 對 429 與暫時性的 5xx 錯誤退避重試，並遵守伺服器的 Retry-After 標頭；POST 只重試 429 / 503
+            max_retries=_IdempotentRetry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "DELETE"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+    
+    @property
+    def _session(self) -> requests.Session:
+        """共用的 Session，透過 HTTP keep-alive 在所有實例間重複使用連線"""
+        cls = type(self)
+        session = cls._shared_session
+        if session is None:
+            with cls._shared_lock:
+                session = cls._shared_session
+                if session is None:
+                    session = cls._shared_session = cls._build_session()
+        return session
+    
+    def _upload_session(self) -> requests.Session:
+        """
+        確保此 base_url 的上傳端點掛載了不重試的 adapter，並返回共用 Session
+        
+        上傳本體可能很大，串流上傳的本體也無法重送，因此上傳失敗時交由調用方決定是否重試。
+        """
+        session = self._session
+        prefix = self._upload_prefix
+        if prefix not in session.adapters:
+            with type(self)._shared_lock:
+                if prefix not in session.adapters:
+                    session.mount(prefix, HTTPAdapter(pool_maxsize=type(self).pool_maxsize, max_retries=Retry(total=0)))
+        return session
+    
+    def _warm_up(self) -> None:
+        """
+        在背景以 HEAD /health 預先完成 DNS 解析、TCP 連線與 keep-alive，縮短首個請求的延遲
+        
+        同一進程內每個 base_url 只預熱一次，不阻塞建構函式。
+        """
+        cls = type(self)
+        with cls._shared_lock:
+            if self._base_url in cls._warmed_base_urls:
+                return
+            cls._warmed_base_urls.add(self._base_url)
+        
+        session = self._session
+        url = self._urls["health"]
+        
+        def head_health() -> None:
+            try:
+                session.head(url, timeout=2.0)
+            except requests.RequestException:
+                # 預熱失敗不影響使用，首個請求會正常建立連線
+                pass
+        
+        threading.Thread(target=head_health, name="raptor-pool-warmup", daemon=True).start()
+    
+    @classmethod
+    def close_shared_session(cls) -> None:
+        """關閉共用連線池；之後的請求會重新建立 Session"""
+        with cls._shared_lock:
+            session, cls._shared_session = cls._shared_session, None
+        if session is not None:
+            session.close()
+    
+    def close(self) -> None:
+        """
+        釋放此實例的本地快取
+        
+        連線池由所有實例共用，不會在此關閉；需要時調用 RaptorAPIClient.close_shared_session()。
+        """
+        self.invalidate_read_cache()
+    
+    def __enter__(self) -> "RaptorAPIClient":
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    @property
+    def base_url(self) -> str:
+        """API Base URL"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """設定 base_url 時一併預先組好各端點的完整 URL，避免每次請求重新格式化字串"""
+        self._base_url = value
+        self._urls = {name: f"{value}{path}" for name, path in API_PATHS.items()}
+        self._upload_prefix = f"{value}{UPLOAD_PATH_PREFIX}"
+    
+    @property
+    def token(self) -> Optional[str]:
+        """JWT access token"""
+        return self._token
+    
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        """設定 token 時一併重建快取的請求標頭，之後每次請求直接重用"""
+        self._token = value
+        self._headers_no_auth = MappingProxyType({
+            "Content-Type": "application/json",
+            # 用戶端可解碼的壓縮格式 (gzip/deflate，安裝 brotli 後含 br)，讓伺服器壓縮大型 JSON 回應
+            "Accept-Encoding": ACCEPT_ENCODING
+        })
+        if value:
+            self._headers_auth = MappingProxyType({**self._headers_no_auth, "Authorization": f"Bearer {value}"})
+        else:
+            self._headers_auth = self._headers_no_auth
+    
+    def _get_headers(self, include_auth: bool = True) -> Mapping[str, str]:
+        """取得請求標頭 (返回快取的唯讀映射，需要額外標頭時請複製後再加入)"""
+        return self._headers_auth if include_auth else self._headers_no_auth
+    
+    def _post_multipart(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        files: List[Tuple[str, str]]
+    ) -> requests.Response:
+        """
+        以 multipart/form-data 上傳檔案
+        
+        安裝 requests-toolbelt 時以 MultipartEncoder 邊讀檔邊發送，記憶體用量與檔案大小無關，
+        並預先帶上 Content-Length，避免退回 chunked 傳輸；
+        否則退回 requests 內建的 files= 上傳 (會先將檔案讀入記憶體)。
+        
+        Args:
+            url: 上傳端點
+            data: 表單欄位
+            files: (欄位名稱, 檔案路徑) 列表
+            
+        Returns:
+            HTTP 回應
+        """
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        file_fields = []
+        try:
+            for field_name, file_path in files:
+                buffering = UPLOAD_BUFFER_SIZE if os.path.getsize(file_path) > UPLOAD_BUFFER_SIZE else -1
+                file_fields.append((field_name, (os.path.basename(file_path), open(file_path, 'rb', buffering=buffering))))
+            
+            if MultipartEncoder is None:
+                return self._upload_session().post(url, files=file_fields, data=data, headers=headers)
+            
+            encoder = MultipartEncoder(fields=[(key, str(value)) for key, value in data.items()] + file_fields)
+            headers["Content-Type"] = encoder.content_type
+            headers["Content-Length"] = str(encoder.len)
+            return self._upload_session().post(url, data=encoder, headers=headers)
+        finally:
+            for _, (_, file_obj) in file_fields:
+                file_obj.close()
+            self.invalidate_read_cache()
+    
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """以 JSON 發送 POST 請求並解碼回應"""
+        body, headers = _json_request_body(payload, self._get_headers(), self.compress_requests)
+        response = self._session.post(url, data=body, headers=headers)
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def _get_read_cached(self, cache_key: Any, url: str) -> Dict[str, Any]:
+        """以短時效 LRU 快取包裝 GET 請求，有效期內的重複讀取直接返回本地結果"""
+        now = time.monotonic()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(cache_key)
+            if entry is not None and entry[0] > now:
+                self._read_cache.move_to_end(cache_key)
+                return entry[1]
+        
+        response = self._session.get(url)
+        response.raise_for_status()
+        result = _json_loads(response.content)
+        
+        with self._read_cache_lock:
+            self._read_cache[cache_key] = (now + READ_CACHE_TTL, result)
+            self._read_cache.move_to_end(cache_key)
+            while len(self._read_cache) > READ_CACHE_MAX_ENTRIES:
+                self._read_cache.popitem(last=False)
+        return result
+    
+    def invalidate_read_cache(self) -> None:
+        """
+        清空本地讀取快取
+        
+        上傳與處理檔案後會自動調用；其他途徑修改了 Redis 快取時可手動調用。
+        """
+        with self._read_cache_lock:
+            self._read_cache.clear()
+    
+    def _post_search(self, url: str, payload: Dict[str, Any], no_cache: bool = False) -> Dict[str, Any]:
+        """發送搜尋請求；設定了 search_cache 時先查詢快取"""
+        if no_cache or self.search_cache is None:
+            return self._post_json(url, payload)
+        
+        filters = _json_dumps({key: value for key, value in payload.items() if key != "query_text"}, sort_keys=True)
+        return self.search_cache.get_or_fetch(
+            (url, self.token, filters), payload["query_text"], lambda: self._post_json(url, payload)
+        )
+    
+    # ==================== Authentication ====================
+    
+    def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
+        """
+        註冊新使用者
+        
+        Args:
+            username: 使用者名稱
+            email: 電子郵件
+            password: 密碼
+            
+        Returns:
+            註冊結果
+        """
+        url = self._urls["register"]
+        payload = {
+            "username": username,
+            "email": email,
+            "password": password
+        }
+        response = self._session.post(url, data=_json_dumps(payload), headers=self._get_headers(include_auth=False))
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def login(self, username: str, password: str) -> str:
+        """
+        登入並取得 JWT token
+        
+        Args:
+            username: 使用者名稱
+            password: 密碼
+            
+        Returns:
+            JWT access token
+        """
+        url = self._urls["login"]
+        # OAuth2 password flow 使用 form data
+        data = {
+            "username": username,
+            "password": password
+        }
+        response = self._session.post(url, data=data)
+        response.raise_for_status()
+        result = _json_loads(response.content)
+        self.token = result.get("access_token")
+        return self.token
+    
+    # ==================== Search ====================
+    
+    def _search(
+        self,
+        kind: str,
+        query_text: str,
+        embedding_type: str,
+        limit: int,
+        no_cache: bool = False,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        單一集合的相似度搜尋，四個 *_search 方法的共用實作
+        
+        Args:
+            kind: 集合類型 (video, audio, document, image)
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            limit: 返回結果數量
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            **filters: 選用的篩選欄位 (filename, speaker, source)，空值不會送出
+            
+        Returns:
+            搜尋結果
+        """
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit": limit
+        }
+        payload.update((field, value) for field, value in filters.items() if value)
+        return self._post_search(self._urls[f"{kind}_search"], payload, no_cache)
+    
+    def video_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        speaker: Optional[List[str]] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        影片相似度搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            filename: 要搜尋的影片檔名列表
+            speaker: 要篩選的說話者列表
+            limit: 返回結果數量
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            
+        Returns:
+            搜尋結果
+        """
+        return self._search("video", query_text, embedding_type, limit, no_cache, filename=filename, speaker=speaker)
+    
+    def audio_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        speaker: Optional[List[str]] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        音訊相似度搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            filename: 要搜尋的音訊檔名列表
+            speaker: 要篩選的說話者列表
+            limit: 返回結果數量
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            
+        Returns:
+            搜尋結果
+        """
+        return self._search("audio", query_text, embedding_type, limit, no_cache, filename=filename, speaker=speaker)
+    
+    def document_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        文件相似度搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            filename: 要搜尋的文件檔名列表
+            source: 檔案類型 (如: csv, pdf, docx)
+            limit: 返回結果數量
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            
+        Returns:
+            搜尋結果
+        """
+        return self._search("document", query_text, embedding_type, limit, no_cache, filename=filename, source=source)
+    
+    def image_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        圖片相似度搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            filename: 要搜尋的圖片檔名列表
+            source: 副檔名 (如: jpg, png)
+            limit: 返回結果數量
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            
+        Returns:
+            搜尋結果
+        """
+        return self._search("image", query_text, embedding_type, limit, no_cache, filename=filename, source=source)
+    
+    def unified_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filters: Optional[Dict[str, Dict]] = None,
+        limit_per_collection: int = 5,
+        global_limit: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        跨集合統一搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            filters: 每個集合的篩選條件
+            limit_per_collection: 每個集合返回的結果數量 (最大 50)
+            global_limit: 聚合後的最大結果總數 (最大 100)
+            score_threshold: 最小分數閾值 (0.0-1.0)
+            no_cache: 略過搜尋快取，直接查詢伺服器
+            
+        Returns:
+            搜尋結果
+        """
+        url = self._urls["unified_search"]
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit_per_collection": limit_per_collection
+        }
+        if filters:
+            payload["filters"] = filters
+        if global_limit:
+            payload["global_limit"] = global_limit
+        if score_threshold is not None:
+            payload["score_threshold"] = score_threshold
+        
+        return self._post_search(url, payload, no_cache)
+    
+    # ==================== File Upload ====================
+    
+    def upload_file(
+        self,
+        file_path: str,
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        上傳單一檔案到儲存服務
+        
+        Args:
+            file_path: 要上傳的檔案路徑
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            
+        Returns:
+            上傳結果
+        """
+        url = self._urls["fileupload"]
+        
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        response = self._post_multipart(url, data, [('primary_file', file_path)])
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def upload_file_sendfile(
+        self,
+        file_path: str,
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        以 sendfile 零拷貝上傳單一檔案
+        
+        手動組出 multipart 標頭後以 socket.sendfile 發送檔案內容，由核心直接從頁面快取寫入 socket，
+        不經過 Python 讀檔與緩衝，適合大型檔案。僅適用於 http:// (TLS 需在使用者空間加密)，
+        https 時退回 upload_file。此請求使用獨立連線，不經過共用連線池，也不會自動重試。
+        
+        Args:
+            file_path: 要上傳的檔案路徑
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            
+        Returns:
+            上傳結果
+        """
+        url = self._urls["fileupload"]
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "http":
+            return self.upload_file(file_path, archive_ttl, destroy_ttl)
+        
+        boundary = uuid.uuid4().hex
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        # 與 requests 產生的 multipart 格式一致：檔名中的雙引號以 %22 轉義
+        filename = os.path.basename(file_path).replace('"', '%22')
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'
+            for key, value in data.items()
+        ) + (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="primary_file"; filename="{filename}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        )
+        head = head.encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+        try:
+            with open(file_path, 'rb') as f:
+                connection.putrequest("POST", parts.path)
+                connection.putheader("Content-Type", f"multipart/form-data; boundary={boundary}")
+                connection.putheader("Content-Length", str(len(head) + os.fstat(f.fileno()).st_size + len(tail)))
+                if self.token:
+                    connection.putheader("Authorization", f"Bearer {self.token}")
+                connection.endheaders(head)
+                connection.sock.sendfile(f)
+                connection.send(tail)
+            response = connection.getresponse()
+            content = response.read()
+        finally:
+            connection.close()
+            self.invalidate_read_cache()
+        
+        if response.status >= 400:
+            raise requests.HTTPError(f"{response.status} {response.reason} for url: {url}")
+        return _json_loads(content)
+    
+    def upload_files_batch(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        批次上傳多個檔案
+        
+        Args:
+            file_paths: 要上傳的檔案路徑列表
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            concurrency: 最大並行上傳數 (1-16)
+            
+        Returns:
+            批次上傳結果
+        """
+        url = self._urls["fileupload_batch"]
+        
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl,
+            'concurrency': concurrency
+        }
+        response = self._post_multipart(url, data, [('primary_files', file_path) for file_path in file_paths])
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def upload_files_parallel(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4,
+        processing_mode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        在客戶端並行上傳多個檔案 (每個檔案一個請求)
+        
+        以執行緒池對單檔上傳端點並行發送請求，共用 Session 連線池；
+        單一大檔案不會拖慢其他檔案，某個檔案失敗也不影響其餘檔案。
+        
+        Args:
+            file_paths: 要上傳的檔案路徑列表
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            concurrency: 最大並行上傳數 (1-16)
+            processing_mode: 設定時改用 upload_file_with_analysis，每個檔案上傳後自動以此模式分析
+            
+        Returns:
+            與 file_paths 順序一致的結果列表，每項包含 file_path、success，以及 result 或 error
+        """
+        def upload_one(file_path: str) -> Dict[str, Any]:
+            try:
+                if processing_mode is None:
+                    result = self.upload_file(file_path, archive_ttl, destroy_ttl)
+                else:
+                    result = self.upload_file_with_analysis(file_path, processing_mode, archive_ttl, destroy_ttl)
+            except Exception as e:
+                return {"file_path": file_path, "success": False, "error": str(e)}
+            return {"file_path": file_path, "success": True, "result": result}
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, 16))) as executor:
+            return list(executor.map(upload_one, file_paths))
+    
+    def upload_file_with_analysis(
+        self,
+        file_path: str,
+        processing_mode: str = "default",
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        上傳檔案並自動進行分析
+        
+        Args:
+            file_path: 要上傳的檔案路徑
+            processing_mode: 處理模式
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            
+        Returns:
+            上傳和分析結果
+        """
+        url = self._urls["fileupload_analysis"]
+        
+        data = {
+            'processing_mode': processing_mode,
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        response = self._post_multipart(url, data, [('primary_file', file_path)])
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def upload_files_batch_with_analysis(
+        self,
+        file_paths: List[str],
+        processing_mode: str = "default",
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        批次上傳多個檔案並自動分析
+        
+        Args:
+            file_paths: 要上傳的檔案路徑列表
+            processing_mode: 處理模式
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            concurrency: 最大並行上傳數 (1-16)
+            
+        Returns:
+            批次上傳和分析結果
+        """
+        url = self._urls["fileupload_analysis_batch"]
+        
+        data = {
+            'processing_mode': processing_mode,
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl,
+            'concurrency': concurrency
+        }
+        response = self._post_multipart(url, data, [('primary_files', file_path) for file_path in file_paths])
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    # ==================== Asset Management ====================
+    
+    def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
+        """
+        列出檔案的所有版本
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            filename: 檔名
+            
+        Returns:
+            版本列表
+        """
+        url = self._urls["fileversions"]
+        params = {
+            "asset_path": asset_path,
+            "filename": filename
+        }
+        response = self._session.get(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def download_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        return_file_content: bool = True,
+        dest_path: Optional[str] = None
+    ) -> Any:
+        """
+        下載資產
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            return_file_content: 是否返回檔案內容
+            dest_path: 儲存路徑；指定時以串流方式直接寫入檔案並返回該路徑，記憶體用量與檔案大小無關
+            
+        Returns:
+            檔案內容、儲存路徑 (指定 dest_path 時) 或回應
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": return_file_content
+        }
+        if return_file_content and dest_path:
+            with self._session.get(url, params=params, headers=self._get_headers(), stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(dest_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+            return dest_path
+        
+        response = self._session.get(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        
+        if return_file_content:
+            return response.content
+        else:
+            return _json_loads(response.content)
+    
+    def iter_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        以串流方式逐塊下載資產內容，適合大型影音檔案
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            chunk_size: 每塊大小 (bytes)
+            
+        Yields:
+            檔案內容區塊
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        with self._session.get(url, params=params, headers=self._get_headers(), stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+    
+    def download_asset_parallel(
+        self,
+        asset_path: str,
+        version_id: str,
+        parts: int = 8
+    ) -> bytes:
+        """
+        以多個平行的 HTTP Range 請求下載資產，適合高頻寬、高延遲網路下的大型檔案
+        
+        先以 HEAD 取得檔案大小；伺服器宣告 Accept-Ranges: bytes 時將檔案切成 parts 段，
+        由執行緒池同時下載並直接寫入預先配置的緩衝區。伺服器不支援範圍請求時退回 download_asset。
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            parts: 平行請求數 (1-16)，每段至少 DOWNLOAD_CHUNK_SIZE
+            
+        Returns:
+            檔案內容
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        # 範圍以未壓縮的原始內容計算，因此不接受壓縮編碼
+        headers = {**self._get_headers(), "Accept-Encoding": "identity"}
+        
+        head = self._session.head(url, params=params, headers=headers, allow_redirects=True)
+        size = int(head.headers.get("Content-Length") or 0) if head.ok else 0
+        parts = max(1, min(parts, 16, size // DOWNLOAD_CHUNK_SIZE))
+        if parts == 1 or head.headers.get("Accept-Ranges") != "bytes":
+            return self.download_asset(asset_path, version_id)
+        
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        step = math.ceil(size / parts)
+        
+        def fetch_range(start: int) -> None:
+            end = min(start + step, size) - 1
+            response = self._session.get(url, params=params, headers={**headers, "Range": f"bytes={start}-{end}"})
+            response.raise_for_status()
+            if response.status_code != 206 or len(response.content) != end - start + 1:
+                raise requests.HTTPError(f"範圍請求未返回預期的內容: bytes={start}-{end}", response=response)
+            view[start:end + 1] = response.content
+        
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            list(executor.map(fetch_range, range(0, size, step)))
+        return bytes(buffer)
+    
+    def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+        """
+        封存資產
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            
+        Returns:
+            封存結果
+        """
+        url = self._urls["filearchive"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id
+        }
+        response = self._session.post(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+        """
+        刪除已封存的資產
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            
+        Returns:
+            刪除結果
+        """
+        url = self._urls["delfile"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id
+        }
+        response = self._session.post(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    # ==================== Processing ====================
+    
+    def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        處理已上傳的檔案
+        
+        Args:
+            upload_result: 上傳結果資訊
+            
+        Returns:
+            處理結果
+        """
+        url = self._urls["process_file"]
+        payload = {"upload_result": upload_result}
+        result = self._post_json(url, payload)
+        self.invalidate_read_cache()
+        return result
+    
+    def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
+        """
+        從 Redis 取得快取值
+        
+        Args:
+            m_type: 媒體類型 (document, video, image, audio)
+            key: 快取鍵
+            
+        Returns:
+            快取值
+        """
+        url = f"{self._urls['processing_cache']}/{m_type}/{key}"
+        return self._get_read_cached((m_type, key), url)
+    
+    def get_all_cache(self) -> Dict[str, Any]:
+        """
+        取得所有 Redis 快取
+        
+        Returns:
+            所有快取鍵值對
+        """
+        url = self._urls["cache_all"]
+        return self._get_read_cached("__all__", url)
+    
+    # ==================== Chat ====================
+    
+    def send_chat(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """
+        發送聊天訊息
+        
+        Args:
+            user_id: 使用者 ID
+            message: 訊息內容
+            search_results: 搜尋結果 (可選)
+            
+        Returns:
+            聊天回應
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+        
+        return self._post_json(url, payload)
+    
+    def send_chat_stream(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        以 Server-Sent Events 串流方式發送聊天訊息，回覆文字產生時即逐段返回
+        
+        伺服器未以 text/event-stream 回應時，退回一次返回完整回覆。
+        
+        Args:
+            user_id: 使用者 ID
+            message: 訊息內容
+            search_results: 搜尋結果 (可選)
+            
+        Yields:
+            回覆文字片段
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+        headers = {**self._get_headers(), "Accept": "text/event-stream"}
+        
+        with self._session.post(url, data=_json_dumps(payload), headers=headers, stream=True) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield _json_loads(response.content).get("response", "")
+                return
+            
+            # SSE 規定使用 UTF-8，避免 requests 對 text/* 預設以 ISO-8859-1 解碼
+            response.encoding = "utf-8"
+            for line in response.iter_lines(decode_unicode=True):
+                text = _sse_text(line)
+                if text == SSE_DONE:
+                    break
+                if text:
+                    yield text
+    
+    def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
+        """
+        取得使用者聊天記憶
+        
+        Args:
+            user_id: 使用者 ID
+            
+        Returns:
+            聊天記憶
+        """
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = self._session.get(url, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
+        """
+        清除使用者聊天記憶
+        
+        Args:
+            user_id: 使用者 ID
+            
+        Returns:
+            清除結果
+        """
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = self._session.delete(url, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+    
+    # ==================== Health ====================
+    
+    def health_check(self) -> Dict[str, Any]:
+        """
+        健康檢查
+        
+        伺服器提供 ETag 時以 If-None-Match 發送條件式請求，304 時直接返回上次的結果。
+        
+        Returns:
+            健康狀態
+        """
+        url = self._urls["health"]
+        headers = {"If-None-Match": self._health_etag} if self._health_etag else None
+        response = self._session.get(url, headers=headers)
+        if response.status_code == 304:
+            return self._health_body
+        response.raise_for_status()
+        self._health_body = _json_loads(response.content)
+        self._health_etag = response.headers.get("ETag")
+        return self._health_body
+
+
+# ==================== 非同步客戶端 ====================
+
+class AsyncRaptorAPIClient:
+    """
+    RAPTOR API Gateway 非同步客戶端
+    
+    以 httpx.AsyncClient 實作，方法與 RaptorAPIClient 一致；
+    多個獨立請求可透過 asyncio.gather 並行發送，總耗時接近單次往返時間。
+    
+    httpx.AsyncClient 綁定於事件迴圈，因此同一事件迴圈內的所有實例共用一個連線池，
+    在首次請求時建立。建議以 `async with AsyncRaptorAPIClient() as client:` 使用；
+    連線池依引用計數管理，最後一個使用中的實例關閉時才會真正關閉，不影響其他並行實例的請求。
+    """
+    
+    # 各事件迴圈共用的 httpx.AsyncClient 及其引用計數；事件迴圈結束後對應條目自動移除
+    _loop_clients: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"] = \
+        weakref.WeakKeyDictionary()
+    _loop_refs: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]"] = weakref.WeakKeyDictionary()
+    
+    def __init__(
+        self,
+        base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012",
+        compress_requests: bool = False
+    ):
+        if httpx is None:
+            raise ImportError("AsyncRaptorAPIClient 需要 httpx，請先執行: pip install httpx")
         self.base_url = base_url
-        self.token: Optional[str] = None
+        self.token = None
+        # 以 gzip 壓縮較大的 JSON 請求本體，預設關閉 (伺服器需支援解壓 Content-Encoding: gzip 的請求)
+        self.compress_requests = compress_requests
+        # health_check 的 ETag 與對應回應，用於條件式 GET
+        self._health_etag: Optional[str] = None
+        self._health_body: Optional[Dict[str, Any]] = None
+        # 本實例持有共用連線池引用的事件迴圈
+        self._held_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+    
+    def _acquire(self, loop: asyncio.AbstractEventLoop) -> None:
+        """在指定事件迴圈上持有共用連線池的引用，每個實例每個事件迴圈只計數一次"""
+        if loop not in self._held_loops:
+            self._held_loops.add(loop)
+            self._loop_refs[loop] = self._loop_refs.get(loop, 0) + 1
+    
+    @property
+    def _client(self) -> "httpx.AsyncClient":
+        """當前事件迴圈共用的非同步 HTTP 客戶端，首次使用或已關閉時建立"""
+        loop = asyncio.get_running_loop()
+        self._acquire(loop)
+        client = self._loop_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._loop_clients[loop] = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=30.0
+            )
+        return client
     
-    def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
-        """取得請求標頭"""
-        headers = {"Content-Type": "application/json"}
-        if include_auth and self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+    async def aclose(self) -> None:
+        """
+        釋放本實例對當前事件迴圈共用連線池的引用
+        
+        其他實例仍在使用時連線池保持開啟；最後一個引用釋放時才關閉連線池。
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._held_loops:
+            return
+        self._held_loops.discard(loop)
+        refs = self._loop_refs.get(loop, 1) - 1
+        if refs > 0:
+            self._loop_refs[loop] = refs
+            return
+        self._loop_refs.pop(loop, None)
+        client = self._loop_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+    
+    async def __aenter__(self) -> "AsyncRaptorAPIClient":
+        self._acquire(asyncio.get_running_loop())
+        return self
+    
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+    
+    @property
+    def base_url(self) -> str:
+        """API Base URL"""
+        return self._base_url
+    
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """設定 base_url 時一併預先組好各端點的完整 URL，避免每次請求重新格式化字串"""
+        self._base_url = value
+        self._urls = {name: f"{value}{path}" for name, path in API_PATHS.items()}
+    
+    @property
+    def token(self) -> Optional[str]:
+        """JWT access token"""
+        return self._token
+    
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        """設定 token 時一併重建快取的請求標頭，之後每次請求直接重用"""
+        self._token = value
+        self._headers_no_auth = MappingProxyType({
+            "Content-Type": "application/json",
+            # 用戶端可解碼的壓縮格式 (gzip/deflate，安裝 brotli 後含 br)，讓伺服器壓縮大型 JSON 回應
+            "Accept-Encoding": ACCEPT_ENCODING
+        })
+        if value:
+            self._headers_auth = MappingProxyType({**self._headers_no_auth, "Authorization": f"Bearer {value}"})
+        else:
+            self._headers_auth = self._headers_no_auth
+    
+    def _get_headers(self, include_auth: bool = True) -> Mapping[str, str]:
+        """取得請求標頭 (返回快取的唯讀映射，需要額外標頭時請複製後再加入)"""
+        return self._headers_auth if include_auth else self._headers_no_auth
+    
+    async def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """以 JSON 發送 POST 請求並解碼回應"""
+        body, headers = _json_request_body(payload, self._get_headers(), self.compress_requests)
+        response = await self._client.post(url, content=body, headers=headers)
+        response.raise_for_status()
+        return _json_loads(response.content)
     
     # ==================== Authentication ====================
     
-    def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
+    async def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
         """
         註冊新使用者
         
@@ -40,17 +1421,17 @@ class RaptorAPIClient:
         Returns:
             註冊結果
         """
-        url = f"{self.base_url}/api/v1/auth/register"
+        url = self._urls["register"]
         payload = {
             "username": username,
             "email": email,
             "password": password
         }
-        response = requests.post(url, json=payload)
+        response = await self._client.post(url, content=_json_dumps(payload), headers=self._get_headers(include_auth=False))
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def login(self, username: str, password: str) -> str:
+    async def login(self, username: str, password: str) -> str:
         """
         登入並取得 JWT token
         
@@ -61,21 +1442,50 @@ class RaptorAPIClient:
         Returns:
             JWT access token
         """
-        url = f"{self.base_url}/api/v1/auth/login"
+        url = self._urls["login"]
         # OAuth2 password flow 使用 form data
         data = {
             "username": username,
             "password": password
         }
-        response = requests.post(url, data=data)
+        response = await self._client.post(url, data=data)
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         self.token = result.get("access_token")
         return self.token
     
     # ==================== Search ====================
     
-    def video_search(
+    async def _search(
+        self,
+        kind: str,
+        query_text: str,
+        embedding_type: str,
+        limit: int,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        單一集合的相似度搜尋，四個 *_search 方法的共用實作
+        
+        Args:
+            kind: 集合類型 (video, audio, document, image)
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            limit: 返回結果數量
+            **filters: 選用的篩選欄位 (filename, speaker, source)，空值不會送出
+            
+        Returns:
+            搜尋結果
+        """
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit": limit
+        }
+        payload.update((field, value) for field, value in filters.items() if value)
+        return await self._post_json(self._urls[f"{kind}_search"], payload)
+    
+    async def video_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -96,22 +1506,9 @@ class RaptorAPIClient:
         Returns:
             搜尋結果
         """
-        url = f"{self.base_url}/api/v1/search/video_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if speaker:
-            payload["speaker"] = speaker
-        
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("video", query_text, embedding_type, limit, filename=filename, speaker=speaker)
     
-    def audio_search(
+    async def audio_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -132,22 +1529,9 @@ class RaptorAPIClient:
         Returns:
             搜尋結果
         """
-        url = f"{self.base_url}/api/v1/search/audio_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if speaker:
-            payload["speaker"] = speaker
-        
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("audio", query_text, embedding_type, limit, filename=filename, speaker=speaker)
     
-    def document_search(
+    async def document_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -168,22 +1552,9 @@ class RaptorAPIClient:
         Returns:
             搜尋結果
         """
-        url = f"{self.base_url}/api/v1/search/document_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if source:
-            payload["source"] = source
-        
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("document", query_text, embedding_type, limit, filename=filename, source=source)
     
-    def image_search(
+    async def image_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -204,22 +1575,9 @@ class RaptorAPIClient:
         Returns:
             搜尋結果
         """
-        url = f"{self.base_url}/api/v1/search/image_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if source:
-            payload["source"] = source
-        
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("image", query_text, embedding_type, limit, filename=filename, source=source)
     
-    def unified_search(
+    async def unified_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -242,7 +1600,7 @@ class RaptorAPIClient:
         Returns:
             搜尋結果
         """
-        url = f"{self.base_url}/api/v1/search/unified_search"
+        url = self._urls["unified_search"]
         payload = {
             "query_text": query_text,
             "embedding_type": embedding_type,
@@ -255,13 +1613,11 @@ class RaptorAPIClient:
         if score_threshold is not None:
             payload["score_threshold"] = score_threshold
         
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
     
     # ==================== File Upload ====================
     
-    def upload_file(
+    async def upload_file(
         self,
         file_path: str,
         archive_ttl: int = 30,
@@ -278,7 +1634,7 @@ class RaptorAPIClient:
         Returns:
             上傳結果
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload"
+        url = self._urls["fileupload"]
         
         with open(file_path, 'rb') as f:
             files = {'primary_file': f}
@@ -287,12 +1643,12 @@ class RaptorAPIClient:
                 'destroy_ttl': destroy_ttl
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
         
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def upload_files_batch(
+    async def upload_files_batch(
         self,
         file_paths: List[str],
         archive_ttl: int = 30,
@@ -311,7 +1667,7 @@ class RaptorAPIClient:
         Returns:
             批次上傳結果
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_batch"
+        url = self._urls["fileupload_batch"]
         
         files = []
         try:
@@ -324,14 +1680,53 @@ class RaptorAPIClient:
                 'concurrency': concurrency
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         finally:
             for _, file_obj in files:
                 file_obj.close()
     
-    def upload_file_with_analysis(
+    async def upload_files_parallel(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4,
+        processing_mode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        在客戶端並行上傳多個檔案 (每個檔案一個請求)
+        
+        以 asyncio.gather 對單檔上傳端點並行發送請求，共用 AsyncClient 連線池；
+        單一大檔案不會拖慢其他檔案，某個檔案失敗也不影響其餘檔案。
+        
+        Args:
+            file_paths: 要上傳的檔案路徑列表
+            archive_ttl: 封存時間 (天)
+            destroy_ttl: 刪除時間 (天)
+            concurrency: 最大並行上傳數 (1-16)
+            processing_mode: 設定時改用 upload_file_with_analysis，每個檔案上傳後自動以此模式分析
+            
+        Returns:
+            與 file_paths 順序一致的結果列表，每項包含 file_path、success，以及 result 或 error
+        """
+        semaphore = asyncio.Semaphore(max(1, min(concurrency, 16)))
+        
+        async def upload_one(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if processing_mode is None:
+                        result = await self.upload_file(file_path, archive_ttl, destroy_ttl)
+                    else:
+                        result = await self.upload_file_with_analysis(file_path, processing_mode, archive_ttl, destroy_ttl)
+                except Exception as e:
+                    return {"file_path": file_path, "success": False, "error": str(e)}
+            return {"file_path": file_path, "success": True, "result": result}
+        
+        return list(await asyncio.gather(*(upload_one(file_path) for file_path in file_paths)))
+    
+    async def upload_file_with_analysis(
         self,
         file_path: str,
         processing_mode: str = "default",
@@ -350,7 +1745,7 @@ class RaptorAPIClient:
         Returns:
             上傳和分析結果
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_analysis"
+        url = self._urls["fileupload_analysis"]
         
         with open(file_path, 'rb') as f:
             files = {'primary_file': f}
@@ -360,12 +1755,12 @@ class RaptorAPIClient:
                 'destroy_ttl': destroy_ttl
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
         
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def upload_files_batch_with_analysis(
+    async def upload_files_batch_with_analysis(
         self,
         file_paths: List[str],
         processing_mode: str = "default",
@@ -386,7 +1781,7 @@ class RaptorAPIClient:
         Returns:
             批次上傳和分析結果
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_analysis_batch"
+        url = self._urls["fileupload_analysis_batch"]
         
         files = []
         try:
@@ -400,16 +1795,16 @@ class RaptorAPIClient:
                 'concurrency': concurrency
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         finally:
             for _, file_obj in files:
                 file_obj.close()
     
     # ==================== Asset Management ====================
     
-    def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
+    async def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
         """
         列出檔案的所有版本
         
@@ -420,20 +1815,21 @@ class RaptorAPIClient:
         Returns:
             版本列表
         """
-        url = f"{self.base_url}/api/v1/asset/fileversions"
+        url = self._urls["fileversions"]
         params = {
             "asset_path": asset_path,
             "filename": filename
         }
-        response = requests.get(url, params=params, headers=self._get_headers())
+        response = await self._client.get(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def download_asset(
+    async def download_asset(
         self,
         asset_path: str,
         version_id: str,
-        return_file_content: bool = True
+        return_file_content: bool = True,
+        dest_path: Optional[str] = None
     ) -> Any:
         """
         下載資產
@@ -442,25 +1838,62 @@ class RaptorAPIClient:
             asset_path: 資產路徑識別碼
             version_id: 版本 ID
             return_file_content: 是否返回檔案內容
+            dest_path: 儲存路徑；指定時以串流方式直接寫入檔案並返回該路徑，記憶體用量與檔案大小無關
             
         Returns:
-            檔案內容或回應
+            檔案內容、儲存路徑 (指定 dest_path 時) 或回應
         """
-        url = f"{self.base_url}/api/v1/asset/filedownload"
+        url = self._urls["filedownload"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id,
             "return_file_content": return_file_content
         }
-        response = requests.get(url, params=params, headers=self._get_headers())
+        if return_file_content and dest_path:
+            async with self._client.stream("GET", url, params=params, headers=self._get_headers()) as response:
+                response.raise_for_status()
+                with open(dest_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            return dest_path
+        
+        response = await self._client.get(url, params=params, headers=self._get_headers())
         response.raise_for_status()
         
         if return_file_content:
             return response.content
         else:
-            return response.json()
+            return _json_loads(response.content)
     
-    def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+    async def iter_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        以串流方式逐塊下載資產內容，適合大型影音檔案
+        
+        Args:
+            asset_path: 資產路徑識別碼
+            version_id: 版本 ID
+            chunk_size: 每塊大小 (bytes)
+            
+        Yields:
+            檔案內容區塊
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        async with self._client.stream("GET", url, params=params, headers=self._get_headers()) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+    
+    async def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
         """
         封存資產
         
@@ -471,16 +1904,16 @@ class RaptorAPIClient:
         Returns:
             封存結果
         """
-        url = f"{self.base_url}/api/v1/asset/filearchive"
+        url = self._urls["filearchive"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id
         }
-        response = requests.post(url, params=params, headers=self._get_headers())
+        response = await self._client.post(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+    async def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
         """
         刪除已封存的資產
         
@@ -491,18 +1924,18 @@ class RaptorAPIClient:
         Returns:
             刪除結果
         """
-        url = f"{self.base_url}/api/v1/asset/delfile"
+        url = self._urls["delfile"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id
         }
-        response = requests.post(url, params=params, headers=self._get_headers())
+        response = await self._client.post(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     # ==================== Processing ====================
     
-    def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         處理已上傳的檔案
         
@@ -512,13 +1945,11 @@ class RaptorAPIClient:
         Returns:
             處理結果
         """
-        url = f"{self.base_url}/api/v1/processing/process-file"
+        url = self._urls["process_file"]
         payload = {"upload_result": upload_result}
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
     
-    def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
+    async def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
         """
         從 Redis 取得快取值
         
@@ -529,26 +1960,26 @@ class RaptorAPIClient:
         Returns:
             快取值
         """
-        url = f"{self.base_url}/api/v1/processing/processing/cache/{m_type}/{key}"
-        response = requests.get(url)
+        url = f"{self._urls['processing_cache']}/{m_type}/{key}"
+        response = await self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def get_all_cache(self) -> Dict[str, Any]:
+    async def get_all_cache(self) -> Dict[str, Any]:
         """
         取得所有 Redis 快取
         
         Returns:
             所有快取鍵值對
         """
-        url = f"{self.base_url}/api/v1/processing/cache/all"
-        response = requests.get(url)
+        url = self._urls["cache_all"]
+        response = await self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     # ==================== Chat ====================
     
-    def send_chat(
+    async def send_chat(
         self,
         user_id: str,
         message: str,
@@ -565,7 +1996,7 @@ class RaptorAPIClient:
         Returns:
             聊天回應
         """
-        url = f"{self.base_url}/api/v1/chat/chat"
+        url = self._urls["chat"]
         payload = {
             "user_id": user_id,
             "message": message
@@ -573,11 +2004,50 @@ class RaptorAPIClient:
         if search_results:
             payload["search_results"] = search_results
         
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
     
-    def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
+    async def send_chat_stream(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> AsyncIterator[str]:
+        """
+        以 Server-Sent Events 串流方式發送聊天訊息，回覆文字產生時即逐段返回
+        
+        伺服器未以 text/event-stream 回應時，退回一次返回完整回覆。
+        
+        Args:
+            user_id: 使用者 ID
+            message: 訊息內容
+            search_results: 搜尋結果 (可選)
+            
+        Yields:
+            回覆文字片段
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+        headers = {**self._get_headers(), "Accept": "text/event-stream"}
+        
+        async with self._client.stream("POST", url, content=_json_dumps(payload), headers=headers) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield _json_loads(await response.aread()).get("response", "")
+                return
+            
+            async for line in response.aiter_lines():
+                text = _sse_text(line)
+                if text == SSE_DONE:
+                    break
+                if text:
+                    yield text
+    
+    async def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
         """
         取得使用者聊天記憶
         
@@ -587,12 +2057,12 @@ class RaptorAPIClient:
         Returns:
             聊天記憶
         """
-        url = f"{self.base_url}/api/v1/chat/memory/{user_id}"
-        response = requests.get(url, headers=self._get_headers())
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = await self._client.get(url, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
-    def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
+    async def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
         """
         清除使用者聊天記憶
         
@@ -602,25 +2072,82 @@ class RaptorAPIClient:
         Returns:
             清除結果
         """
-        url = f"{self.base_url}/api/v1/chat/memory/{user_id}"
-        response = requests.delete(url, headers=self._get_headers())
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = await self._client.delete(url, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
     
     # ==================== Health ====================
     
-    def health_check(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
         """
         健康檢查
         
+        伺服器提供 ETag 時以 If-None-Match 發送條件式請求，304 時直接返回上次的結果。
+        
         Returns:
             健康狀態
         """
-        url = f"{self.base_url}/health"
-        response = requests.get(url)
+        url = self._urls["health"]
+        headers = {"If-None-Match": self._health_etag} if self._health_etag else None
+        response = await self._client.get(url, headers=headers)
+        if response.status_code == 304:
+            return self._health_body
         response.raise_for_status()
-        return response.json()
-
+        self._health_body = _json_loads(response.content)
+        self._health_etag = response.headers.get("ETag")
+        return self._health_body
+    
+    async def search_all(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        limit: int = 5
+    ) -> Dict[str, Any]:
+        """
+        同時在影片、音訊、文件、圖片四個集合中搜尋
+        
+        Args:
+            query_text: 搜尋查詢文字
+            embedding_type: 'text' 或 'summary'
+            limit: 每個集合返回結果數量
+            
+        Returns:
+            以集合名稱為鍵的搜尋結果
+        """
+        video, audio, document, image = await asyncio.gather(
+            self.video_search(query_text, embedding_type, limit=limit),
+            self.audio_search(query_text, embedding_type, limit=limit),
+            self.document_search(query_text, embedding_type, limit=limit),
+            self.image_search(query_text, embedding_type, limit=limit)
+        )
+        return {"video": video, "audio": audio, "document": document, "image": image}
+    
+    async def search_many(
+        self,
+        queries: List[Dict[str, Any]],
+        concurrency: int = 16
+    ) -> List[Any]:
+        """
+        並行執行多個統一搜尋
+        
+        所有請求共用同一個 AsyncClient 連線池，以信號量限制同時進行的請求數；
+        K 個查詢的總耗時約為單次往返時間，而非 K 倍。
+        
+        Args:
+            queries: unified_search 的參數字典列表
+            concurrency: 最大並行請求數
+            
+        Returns:
+            與 queries 順序一致的結果列表；失敗的查詢以例外物件表示
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+        
+        async def search_one(query: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.unified_search(**query)
+        
+        return await asyncio.gather(*(search_one(query) for query in queries), return_exceptions=True)
 
 # ==================== 使用範例 ====================
 
@@ -651,51 +2178,46 @@ def example_usage():
         print(f"登入失敗: {e}")
         return
     
-    # 3. 影片搜尋
-    print("\n=== 影片搜尋 ===")
-    try:
-        result = client.video_search(
-            query_text="機器學習",
-            embedding_type="text",
-            filename=["MV.mp4"],
-            speaker=["SPEAKER_00"],
-            limit=5
-        )
-        print(f"搜尋結果: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"搜尋失敗: {e}")
-    
-    # 4. 文件搜尋
-    print("\n=== 文件搜尋 ===")
-    try:
-        result = client.document_search(
-            query_text="財務報告",
-            embedding_type="text",
-            filename=["EF25Y01.csv"],
-            source="csv",
-            limit=5
-        )
-        print(f"搜尋結果: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"搜尋失敗: {e}")
+    # 3-5. 影片、文件與統一搜尋彼此獨立，以執行緒池並行發送，總耗時約為最慢的一次搜尋
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        searches = {
+            "影片搜尋": executor.submit(
+                client.video_search,
+                query_text="機器學習",
+                embedding_type="text",
+                filename=["MV.mp4"],
+                speaker=["SPEAKER_00"],
+                limit=5
+            ),
+            "文件搜尋": executor.submit(
+                client.document_search,
+                query_text="財務報告",
+                embedding_type="text",
+                filename=["EF25Y01.csv"],
+                source="csv",
+                limit=5
+            ),
+            "統一搜尋": executor.submit(
+                client.unified_search,
+                query_text="機器學習和人工智慧",
+                embedding_type="text",
+                filters={
+                    "video": {"filename": ["MV.mp4"]},
+                    "document": {"source": "csv"}
+                },
+                limit_per_collection=3,
+                global_limit=10,
+                score_threshold=0.5
+            )
+        }
     
-    # 5. 統一搜尋
-    print("\n=== 統一搜尋 ===")
-    try:
-        result = client.unified_search(
-            query_text="機器學習和人工智慧",
-            embedding_type="text",
-            filters={
-                "video": {"filename": ["MV.mp4"]},
-                "document": {"source": "csv"}
-            },
-            limit_per_collection=3,
-            global_limit=10,
-            score_threshold=0.5
-        )
-        print(f"搜尋結果: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"搜尋失敗: {e}")
+    for title, future in searches.items():
+        print(f"\n=== {title} ===")
+        try:
+            result = future.result()
+            print(f"搜尋結果: {json.dumps(result, indent=2, ensure_ascii=False)}")
+        except Exception as e:
+            print(f"搜尋失敗: {e}")
     
     # 6. 上傳檔案 (假設有檔案)
     print("\n=== 上傳檔案 ===")
@@ -738,5 +2260,77 @@ def example_usage():
         print(f"檢查失敗: {e}")
 
 
+async def example_usage_async():
+    """非同步使用範例：登入後以 asyncio.gather 並行發送彼此獨立的請求"""
+    
+    async with AsyncRaptorAPIClient() as client:
+        # 1. 註冊與登入 (後續請求需要 token，依序執行)
+        print("=== 註冊使用者 ===")
+        try:
+            result = await client.register_user(
+                username="test_user",
+                email="test@example.com",
+                password="secure_password"
+            )
+            print(f"註冊成功: {result}")
+        except Exception as e:
+            print(f"註冊失敗: {e}")
+        
+        print("\n=== 登入 ===")
+        try:
+            token = await client.login(username="test_user", password="secure_password")
+            print(f"登入成功，Token: {token[:20]}...")
+        except Exception as e:
+            print(f"登入失敗: {e}")
+            return
+        
+        # 2. 搜尋、聊天、聊天記憶與健康檢查彼此獨立，並行發送後總耗時約為最慢的單次請求
+        requests_by_title = {
+            "影片搜尋": client.video_search(
+                query_text="機器學習",
+                embedding_type="text",
+                filename=["MV.mp4"],
+                speaker=["SPEAKER_00"],
+                limit=5
+            ),
+            "文件搜尋": client.document_search(
+                query_text="財務報告",
+                embedding_type="text",
+                filename=["EF25Y01.csv"],
+                source="csv",
+                limit=5
+            ),
+            "統一搜尋": client.unified_search(
+                query_text="機器學習和人工智慧",
+                embedding_type="text",
+                filters={
+                    "video": {"filename": ["MV.mp4"]},
+                    "document": {"source": "csv"}
+                },
+                limit_per_collection=3,
+                global_limit=10,
+                score_threshold=0.5
+            ),
+            "聊天": client.send_chat(
+                user_id="test_user",
+                message="請幫我總結一下機器學習的重點"
+            ),
+            "取得聊天記憶": client.get_chat_memory(user_id="test_user"),
+            "健康檢查": client.health_check()
+        }
+        results = await asyncio.gather(*requests_by_title.values(), return_exceptions=True)
+        
+        for title, result in zip(requests_by_title, results):
+            print(f"\n=== {title} ===")
+            if isinstance(result, Exception):
+                print(f"失敗: {result}")
+            else:
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
 if __name__ == "__main__":
-    example_usage()
+    # 安裝 httpx 時執行非同步範例，否則退回同步範例
+    if httpx is not None:
+        asyncio.run(example_usage_async())
+    else:
+        example_usage()
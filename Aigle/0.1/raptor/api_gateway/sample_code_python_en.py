@@ -7,28 +7,1414 @@ API Base URL: http://raptor_open_0_1_api.dhtsolution.com:8012
 API Docs: http://raptor_open_0_1_api.dhtsolution.com:8012/docs
 """
 
+import asyncio
+import gzip
+import http.client
+import os
 import requests
 import json
-from typing import Optional, List, Dict, Any
+import math
+import shutil
+import threading
+import time
+import urllib.parse
+import uuid
+import weakref
+from collections import OrderedDict
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, List, Dict, Any, Iterator, AsyncIterator, Tuple, Callable, Sequence, ClassVar, Mapping
+
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+# requests-toolbelt is an optional dependency; when installed, uploads are streamed
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# httpx is an optional dependency, only needed by AsyncRaptorAPIClient
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+# orjson is an optional dependency; when installed it is used to encode/decode JSON (several times faster than the json module)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_dumps(payload: Any, sort_keys: bool = False) -> bytes:
+    """Encode a request payload as JSON bytes; with sort_keys the keys are sorted, giving a stable cache key"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_SORT_KEYS if sort_keys else None)
+    return json.dumps(payload, sort_keys=sort_keys).encode("utf-8")
+
+
+def _json_loads(content: bytes) -> Any:
+    """Decode the response content into Python objects"""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _json_request_body(payload: Any, headers: Mapping[str, str], compress: bool) -> Tuple[bytes, Mapping[str, str]]:
+    """
+    Encode a request payload as a JSON body and return the matching headers
+
+    When compress is true and the body reaches REQUEST_COMPRESSION_MIN_SIZE, it is gzip-compressed and a Content-Encoding header is added.
+    """
+    body = _json_dumps(payload)
+    if compress and len(body) >= REQUEST_COMPRESSION_MIN_SIZE:
+        return gzip.compress(body, compresslevel=5), {**headers, "Content-Encoding": "gzip"}
+    return body, headers
+
+
+# SSE end-of-stream marker
+SSE_DONE = "[DONE]"
+
+
+def _sse_text(line: str) -> Optional[str]:
+    """Extract the text piece from an SSE "data:" line; event names, comments and blank lines return None"""
+    if not line.startswith("data:"):
+        return None
+    data = line[6:] if line.startswith("data: ") else line[5:]
+    if data.startswith("{"):
+        try:
+            return _json_loads(data).get("response", "")
+        except ValueError:
+            pass
+    return data
+
+
+# API endpoint paths (relative to base_url)
+API_PATHS = {
+    "register": "/api/v1/auth/register",
+    "login": "/api/v1/auth/login",
+    "video_search": "/api/v1/search/video_search",
+    "audio_search": "/api/v1/search/audio_search",
+    "document_search": "/api/v1/search/document_search",
+    "image_search": "/api/v1/search/image_search",
+    "unified_search": "/api/v1/search/unified_search",
+    "fileupload": "/api/v1/asset/fileupload",
+    "fileupload_batch": "/api/v1/asset/fileupload_batch",
+    "fileupload_analysis": "/api/v1/asset/fileupload_analysis",
+    "fileupload_analysis_batch": "/api/v1/asset/fileupload_analysis_batch",
+    "fileversions": "/api/v1/asset/fileversions",
+    "filedownload": "/api/v1/asset/filedownload",
+    "filearchive": "/api/v1/asset/filearchive",
+    "delfile": "/api/v1/asset/delfile",
+    "process_file": "/api/v1/processing/process-file",
+    "processing_cache": "/api/v1/processing/processing/cache",
+    "cache_all": "/api/v1/processing/cache/all",
+    "chat": "/api/v1/chat/chat",
+    "chat_memory": "/api/v1/chat/memory",
+    "health": "/health"
+}
+
+# Chunk size for streamed downloads (1 MiB)
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Upload files larger than this are opened with a 1 MiB read buffer to cut down on read syscalls
+UPLOAD_BUFFER_SIZE = 1 << 20
+
+# Common path prefix of the upload endpoints; upload requests are never retried automatically
+UPLOAD_PATH_PREFIX = "/api/v1/asset/fileupload"
+
+# Local read cache for get_cached_value / get_all_cache: TTL (seconds) and max entries
+READ_CACHE_TTL = 2.0
+READ_CACHE_MAX_ENTRIES = 1024
+
+# With compress_requests enabled, JSON request bodies of at least this size (bytes) are gzip-compressed
+REQUEST_COMPRESSION_MIN_SIZE = 1024
+
+# POST is only retried automatically on these statuses: 429 / 503 mean the server declined the request
+# without processing it, so resending cannot run it twice
+POST_RETRY_STATUSES = frozenset([429, 503])
+
+
+class _IdempotentRetry(Retry):
+    """
+    GET / DELETE retry on status_forcelist; POST only retries on POST_RETRY_STATUSES
+
+    On 500 / 502 / 504 the server may already have done the work, so resending non-idempotent POSTs such as
+    process_file, send_chat, archive_asset or register_user would duplicate processing or chat turns.
+    POST is not in allowed_methods, so errors part-way through a request (e.g. read timeouts) never resend it either.
+    """
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if method.upper() == "POST":
+            return status_code in POST_RETRY_STATUSES
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+class SearchResultCache:
+    """
+    Search result cache (optional)
+
+    Partitioned by (endpoint, user token, filters); by default matches the normalized query text (collapsed whitespace, lowercased) exactly.
+    When embed_fn is given, matching becomes semantic: a cached query in the same partition whose cosine similarity to the query vector
+    reaches threshold counts as a hit, e.g. pass a sentence-transformers model's encode so slightly reworded queries are served from cache.
+
+    Args:
+        ttl: Cache lifetime (seconds)
+        max_entries: Maximum number of entries; the least recently used entry is evicted beyond this
+        embed_fn: Function converting query text to a vector (optional)
+        threshold: Cosine similarity threshold for semantic matching
+    """
+
+    def __init__(
+        self,
+        ttl: float = 600.0,
+        max_entries: int = 256,
+        embed_fn: Optional[Callable[[str], Sequence[float]]] = None,
+        threshold: float = 0.92
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        # {(partition, normalized query): (stored time, unit query vector, search result)}
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[float, Optional[List[float]], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _normalize(query_text: str) -> str:
+        """Normalize query text"""
+        return " ".join(query_text.split()).lower()
+
+    def _embed(self, text: str) -> List[float]:
+        """Compute the unit query vector"""
+        vector = [float(x) for x in self.embed_fn(text)]
+        norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+        return [x / norm for x in vector]
+
+    def _nearest(self, namespace: Any, vector: List[float], now: float) -> Any:
+        """Find the most similar unexpired cached result in the same partition"""
+        best, best_score = None, self.threshold
+        with self._lock:
+            for (entry_namespace, _), (stored_at, entry_vector, result) in self._entries.items():
+                if entry_namespace != namespace or entry_vector is None or now - stored_at >= self.ttl:
+                    continue
+                score = sum(a * b for a, b in zip(vector, entry_vector))
+                if score >= best_score:
+                    best, best_score = result, score
+        return best
+
+    def get_or_fetch(self, namespace: Any, query_text: str, fetch: Callable[[], Any]) -> Any:
+        """
+        Get the cached result, calling fetch and caching its result on a miss
+
+        Args:
+            namespace: Cache partition
+            query_text: Query text
+            fetch: Function that fetches the result on a miss
+
+        Returns:
+            Search result (on a hit this is the same object returned before; do not modify it)
+        """
+        key = (namespace, self._normalize(query_text))
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and now - entry[0] < self.ttl:
+                self._entries.move_to_end(key)
+                return entry[2]
+
+        vector = None
+        if self.embed_fn is not None:
+            vector = self._embed(key[1])
+            result = self._nearest(namespace, vector, now)
+            if result is not None:
+                return result
+
+        result = fetch()
+        with self._lock:
+            self._entries[key] = (time.monotonic(), vector, result)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return result
+
+    def clear(self) -> None:
+        """Clear all cached entries"""
+        with self._lock:
+            self._entries.clear()
+
+
+class RaptorAPIClient:
+    """RAPTOR API Gateway Client"""
+
+    # Session and connection pool shared by every client instance in the process, created on first use;
+    # each instance keeps its own token, and auth travels in request headers, so instances stay isolated
+    _shared_session: ClassVar[Optional[requests.Session]] = None
+    _shared_lock: ClassVar[threading.Lock] = threading.Lock()
+    # base_urls whose connection pool has already been warmed up
+    _warmed_base_urls: ClassVar[set] = set()
+    # Maximum connections kept per host; set it before the shared Session is built (first request).
+    # Multi-threaded servers can raise it to match their worker thread count
+    pool_maxsize: ClassVar[int] = 16
+
+    def __init__(
+        self,
+        base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012",
+        search_cache: Optional["SearchResultCache"] = None,
+        warm_up: bool = True,
+        compress_requests: bool = False
+    ):
+        self.base_url = base_url
+        self.token = None
+        # Gzip large JSON request bodies; off by default (the server must decompress Content-Encoding: gzip requests)
+        self.compress_requests = compress_requests
+        # Search result cache, disabled by default
+        self.search_cache = search_cache
+        # Short-lived local cache of Redis cache reads, so polling loops don't hit the network each time
+        self._read_cache: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._read_cache_lock = threading.Lock()
+        # ETag and matching body of the last health_check, for conditional GETs
+        self._health_etag: Optional[str] = None
+        self._health_body: Optional[Dict[str, Any]] = None
+
+        # Warm up the connection pool in the background (once per base_url)
+        if warm_up:
+            self._warm_up()
+
+    @classmethod
+    def _build_session(cls) -> requests.Session:
+        """Build a Session with connection pooling and retries configured"""
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=16,
+            pool_maxsize=cls.pool_maxsize,
+            # Back off and retry on 429 and transient 5xx errors, honouring the server's Retry-After header;
+            # POST only retries on 429 / 503
+            max_retries=_IdempotentRetry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[429, 500, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "DELETE"]),
+                respect_retry_after_header=True,
+                raise_on_status=False
+            )
+        )
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @property
+    def _session(self) -> requests.Session:
+        """Shared Session, reusing connections across all instances via HTTP keep-alive"""
+        cls = type(self)
+        session = cls._shared_session
+        if session is None:
+            with cls._shared_lock:
+                session = cls._shared_session
+                if session is None:
+                    session = cls._shared_session = cls._build_session()
+        return session
+
+    def _upload_session(self) -> requests.Session:
+        """
+        Make sure the upload endpoints of this base_url have a no-retry adapter mounted, and return the shared Session
+
+        Upload bodies can be large and streamed bodies cannot be resent, so retrying a failed upload is left to the caller.
+        """
+        session = self._session
+        prefix = self._upload_prefix
+        if prefix not in session.adapters:
+            with type(self)._shared_lock:
+                if prefix not in session.adapters:
+                    session.mount(prefix, HTTPAdapter(pool_maxsize=type(self).pool_maxsize, max_retries=Retry(total=0)))
+        return session
+
+    def _warm_up(self) -> None:
+        """
+        Resolve DNS, open a TCP connection and keep it alive via HEAD /health in the background, cutting first-request latency
+
+        Runs once per base_url per process and never blocks the constructor.
+        """
+        cls = type(self)
+        with cls._shared_lock:
+            if self._base_url in cls._warmed_base_urls:
+                return
+            cls._warmed_base_urls.add(self._base_url)
+
+        session = self._session
+        url = self._urls["health"]
+
+        def head_health() -> None:
+            try:
+                session.head(url, timeout=2.0)
+            except requests.RequestException:
+                # A failed warm-up is harmless; the first request connects as usual
+                pass
+
+        threading.Thread(target=head_health, name="raptor-pool-warmup", daemon=True).start()
+
+    @classmethod
+    def close_shared_session(cls) -> None:
+        """Close the shared connection pool; later requests build a new Session"""
+        with cls._shared_lock:
+            session, cls._shared_session = cls._shared_session, None
+        if session is not None:
+            session.close()
+
+    def close(self) -> None:
+        """
+        Release this instance's local caches
+
+        The connection pool is shared by all instances and is not closed here; call RaptorAPIClient.close_shared_session() when needed.
+        """
+        self.invalidate_read_cache()
+
+    def __enter__(self) -> "RaptorAPIClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+    @property
+    def base_url(self) -> str:
+        """API Base URL"""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """Pre-build the full URL of every endpoint whenever base_url is set, so requests do not format strings each time"""
+        self._base_url = value
+        self._urls = {name: f"{value}{path}" for name, path in API_PATHS.items()}
+        self._upload_prefix = f"{value}{UPLOAD_PATH_PREFIX}"
+
+    @property
+    def token(self) -> Optional[str]:
+        """JWT access token"""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        """Rebuild the cached request headers whenever the token is set, so every request reuses them"""
+        self._token = value
+        self._headers_no_auth = MappingProxyType({
+            "Content-Type": "application/json",
+            # Compression formats the client can decode (gzip/deflate, plus br when brotli is installed), so the server can compress large JSON responses
+            "Accept-Encoding": ACCEPT_ENCODING
+        })
+        if value:
+            self._headers_auth = MappingProxyType({**self._headers_no_auth, "Authorization": f"Bearer {value}"})
+        else:
+            self._headers_auth = self._headers_no_auth
+
+    def _get_headers(self, include_auth: bool = True) -> Mapping[str, str]:
+        """Get request headers (returns a cached read-only mapping; copy it before adding headers)"""
+        return self._headers_auth if include_auth else self._headers_no_auth
+
+    def _post_multipart(
+        self,
+        url: str,
+        data: Dict[str, Any],
+        files: List[Tuple[str, str]]
+    ) -> requests.Response:
+        """
+        Upload files as multipart/form-data
+
+        With requests-toolbelt installed, MultipartEncoder streams file contents while sending, so memory use does not grow with file size,
+        and sends Content-Length up front so the request is not chunked;
+        otherwise falls back to the built-in files= upload of requests (which reads files into memory first).
+
+        Args:
+            url: Upload endpoint
+            data: Form fields
+            files: List of (field name, file path)
+
+        Returns:
+            HTTP response
+        """
+        headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
+        file_fields = []
+        try:
+            for field_name, file_path in files:
+                buffering = UPLOAD_BUFFER_SIZE if os.path.getsize(file_path) > UPLOAD_BUFFER_SIZE else -1
+                file_fields.append((field_name, (os.path.basename(file_path), open(file_path, 'rb', buffering=buffering))))
+
+            if MultipartEncoder is None:
+                return self._upload_session().post(url, files=file_fields, data=data, headers=headers)
+
+            encoder = MultipartEncoder(fields=[(key, str(value)) for key, value in data.items()] + file_fields)
+            headers["Content-Type"] = encoder.content_type
+            headers["Content-Length"] = str(encoder.len)
+            return self._upload_session().post(url, data=encoder, headers=headers)
+        finally:
+            for _, (_, file_obj) in file_fields:
+                file_obj.close()
+            self.invalidate_read_cache()
+
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a JSON POST request and decode the response"""
+        body, headers = _json_request_body(payload, self._get_headers(), self.compress_requests)
+        response = self._session.post(url, data=body, headers=headers)
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def _get_read_cached(self, cache_key: Any, url: str) -> Dict[str, Any]:
+        """GET through a short-TTL LRU cache; repeated reads within the TTL return the local result"""
+        now = time.monotonic()
+        with self._read_cache_lock:
+            entry = self._read_cache.get(cache_key)
+            if entry is not None and entry[0] > now:
+                self._read_cache.move_to_end(cache_key)
+                return entry[1]
+
+        response = self._session.get(url)
+        response.raise_for_status()
+        result = _json_loads(response.content)
+
+        with self._read_cache_lock:
+            self._read_cache[cache_key] = (now + READ_CACHE_TTL, result)
+            self._read_cache.move_to_end(cache_key)
+            while len(self._read_cache) > READ_CACHE_MAX_ENTRIES:
+                self._read_cache.popitem(last=False)
+        return result
+
+    def invalidate_read_cache(self) -> None:
+        """
+        Clear the local read cache
+
+        Called automatically after uploading or processing files; call it manually if the Redis cache was changed elsewhere.
+        """
+        with self._read_cache_lock:
+            self._read_cache.clear()
+
+    def _post_search(self, url: str, payload: Dict[str, Any], no_cache: bool = False) -> Dict[str, Any]:
+        """Send a search request; consult the cache first when search_cache is set"""
+        if no_cache or self.search_cache is None:
+            return self._post_json(url, payload)
+
+        filters = _json_dumps({key: value for key, value in payload.items() if key != "query_text"}, sort_keys=True)
+        return self.search_cache.get_or_fetch(
+            (url, self.token, filters), payload["query_text"], lambda: self._post_json(url, payload)
+        )
+
+    # ==================== Authentication ====================
+
+    def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
+        """
+        Register a new user
+
+        Args:
+            username: Username
+            email: Email address
+            password: Password
+
+        Returns:
+            Registration result
+        """
+        url = self._urls["register"]
+        payload = {
+            "username": username,
+            "email": email,
+            "password": password
+        }
+        response = self._session.post(url, data=_json_dumps(payload), headers=self._get_headers(include_auth=False))
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def login(self, username: str, password: str) -> str:
+        """
+        Login and get JWT token
+
+        Args:
+            username: Username
+            password: Password
+
+        Returns:
+            JWT access token
+        """
+        url = self._urls["login"]
+        # OAuth2 password flow uses form data
+        data = {
+            "username": username,
+            "password": password
+        }
+        response = self._session.post(url, data=data)
+        response.raise_for_status()
+        result = _json_loads(response.content)
+        self.token = result.get("access_token")
+        return self.token
+
+    # ==================== Search ====================
+
+    def _search(
+        self,
+        kind: str,
+        query_text: str,
+        embedding_type: str,
+        limit: int,
+        no_cache: bool = False,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Single-collection similarity search shared by the four *_search methods
+
+        Args:
+            kind: Collection type (video, audio, document, image)
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            limit: Number of results to return
+            no_cache: Bypass the search cache and query the server directly
+            **filters: Optional filter fields (filename, speaker, source); empty values are not sent
+
+        Returns:
+            Search results
+        """
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit": limit
+        }
+        payload.update((field, value) for field, value in filters.items() if value)
+        return self._post_search(self._urls[f"{kind}_search"], payload, no_cache)
+
+    def video_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        speaker: Optional[List[str]] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Video similarity search
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            filename: List of video filenames to search
+            speaker: List of speakers to filter
+            limit: Number of results to return
+            no_cache: Bypass the search cache and query the server directly
+
+        Returns:
+            Search results
+        """
+        return self._search("video", query_text, embedding_type, limit, no_cache, filename=filename, speaker=speaker)
+
+    def audio_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        speaker: Optional[List[str]] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Audio similarity search
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            filename: List of audio filenames to search
+            speaker: List of speakers to filter
+            limit: Number of results to return
+            no_cache: Bypass the search cache and query the server directly
+
+        Returns:
+            Search results
+        """
+        return self._search("audio", query_text, embedding_type, limit, no_cache, filename=filename, speaker=speaker)
+
+    def document_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Document similarity search
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            filename: List of document filenames to search
+            source: File type (e.g., csv, pdf, docx)
+            limit: Number of results to return
+            no_cache: Bypass the search cache and query the server directly
+
+        Returns:
+            Search results
+        """
+        return self._search("document", query_text, embedding_type, limit, no_cache, filename=filename, source=source)
+
+    def image_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filename: Optional[List[str]] = None,
+        source: Optional[str] = None,
+        limit: int = 5,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Image similarity search
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            filename: List of image filenames to search
+            source: File extension (e.g., jpg, png)
+            limit: Number of results to return
+            no_cache: Bypass the search cache and query the server directly
+
+        Returns:
+            Search results
+        """
+        return self._search("image", query_text, embedding_type, limit, no_cache, filename=filename, source=source)
+
+    def unified_search(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        filters: Optional[Dict[str, Dict]] = None,
+        limit_per_collection: int = 5,
+        global_limit: Optional[int] = None,
+        score_threshold: Optional[float] = None,
+        no_cache: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Unified cross-collection search
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            filters: Filter conditions for each collection
+            limit_per_collection: Number of results per collection (max 50)
+            global_limit: Maximum total results after aggregation (max 100)
+            score_threshold: Minimum score threshold (0.0-1.0)
+            no_cache: Bypass the search cache and query the server directly
+
+        Returns:
+            Search results
+        """
+        url = self._urls["unified_search"]
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit_per_collection": limit_per_collection
+        }
+        if filters:
+            payload["filters"] = filters
+        if global_limit:
+            payload["global_limit"] = global_limit
+        if score_threshold is not None:
+            payload["score_threshold"] = score_threshold
+
+        return self._post_search(url, payload, no_cache)
+
+    # ==================== File Upload ====================
+
+    def upload_file(
+        self,
+        file_path: str,
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Upload a single file to storage service
+
+        Args:
+            file_path: Path to the file to upload
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+
+        Returns:
+            Upload result
+        """
+        url = self._urls["fileupload"]
+
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        response = self._post_multipart(url, data, [('primary_file', file_path)])
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def upload_file_sendfile(
+        self,
+        file_path: str,
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Upload a single file with zero-copy sendfile
+
+        Builds the multipart headers by hand and sends the file body with socket.sendfile, so the kernel writes it
+        from the page cache straight to the socket without Python reading or buffering it; suited to large files.
+        Only works over http:// (TLS has to encrypt in user space); falls back to upload_file for https.
+        This request uses its own connection rather than the shared pool and is not retried automatically.
+
+        Args:
+            file_path: Path of the file to upload
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+
+        Returns:
+            Upload result
+        """
+        url = self._urls["fileupload"]
+        parts = urllib.parse.urlsplit(url)
+        if parts.scheme != "http":
+            return self.upload_file(file_path, archive_ttl, destroy_ttl)
+
+        boundary = uuid.uuid4().hex
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        # Same multipart layout requests produces: double quotes in the filename are escaped as %22
+        filename = os.path.basename(file_path).replace('"', '%22')
+        head = "".join(
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{key}"\r\n\r\n{value}\r\n'
+            for key, value in data.items()
+        ) + (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="primary_file"; filename="{filename}"\r\n'
+            'Content-Type: application/octet-stream\r\n\r\n'
+        )
+        head = head.encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+
+        connection = http.client.HTTPConnection(parts.hostname, parts.port or 80)
+        try:
+            with open(file_path, 'rb') as f:
+                connection.putrequest("POST", parts.path)
+                connection.putheader("Content-Type", f"multipart/form-data; boundary={boundary}")
+                connection.putheader("Content-Length", str(len(head) + os.fstat(f.fileno()).st_size + len(tail)))
+                if self.token:
+                    connection.putheader("Authorization", f"Bearer {self.token}")
+                connection.endheaders(head)
+                connection.sock.sendfile(f)
+                connection.send(tail)
+            response = connection.getresponse()
+            content = response.read()
+        finally:
+            connection.close()
+            self.invalidate_read_cache()
+
+        if response.status >= 400:
+            raise requests.HTTPError(f"{response.status} {response.reason} for url: {url}")
+        return _json_loads(content)
+
+    def upload_files_batch(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Batch upload multiple files
+
+        Args:
+            file_paths: List of file paths to upload
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+            concurrency: Maximum concurrent uploads (1-16)
+
+        Returns:
+            Batch upload result
+        """
+        url = self._urls["fileupload_batch"]
+
+        data = {
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl,
+            'concurrency': concurrency
+        }
+        response = self._post_multipart(url, data, [('primary_files', file_path) for file_path in file_paths])
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def upload_files_parallel(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4,
+        processing_mode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload multiple files in parallel on the client side (one request per file)
+
+        Sends requests to the single-file upload endpoint from a thread pool sharing the Session connection pool;
+        one large file does not hold up the others, and one failed file does not affect the rest.
+
+        Args:
+            file_paths: List of file paths to upload
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+            concurrency: Max concurrent uploads (1-16)
+            processing_mode: When set, use upload_file_with_analysis so each file is analysed with this mode after upload
+
+        Returns:
+            List of results in the same order as file_paths, each with file_path, success, and result or error
+        """
+        def upload_one(file_path: str) -> Dict[str, Any]:
+            try:
+                if processing_mode is None:
+                    result = self.upload_file(file_path, archive_ttl, destroy_ttl)
+                else:
+                    result = self.upload_file_with_analysis(file_path, processing_mode, archive_ttl, destroy_ttl)
+            except Exception as e:
+                return {"file_path": file_path, "success": False, "error": str(e)}
+            return {"file_path": file_path, "success": True, "result": result}
+
+        with ThreadPoolExecutor(max_workers=max(1, min(concurrency, 16))) as executor:
+            return list(executor.map(upload_one, file_paths))
+
+    def upload_file_with_analysis(
+        self,
+        file_path: str,
+        processing_mode: str = "default",
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30
+    ) -> Dict[str, Any]:
+        """
+        Upload file and automatically analyze
+
+        Args:
+            file_path: Path to the file to upload
+            processing_mode: Processing mode
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+
+        Returns:
+            Upload and analysis result
+        """
+        url = self._urls["fileupload_analysis"]
+
+        data = {
+            'processing_mode': processing_mode,
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl
+        }
+        response = self._post_multipart(url, data, [('primary_file', file_path)])
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def upload_files_batch_with_analysis(
+        self,
+        file_paths: List[str],
+        processing_mode: str = "default",
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4
+    ) -> Dict[str, Any]:
+        """
+        Batch upload multiple files and automatically analyze
+
+        Args:
+            file_paths: List of file paths to upload
+            processing_mode: Processing mode
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+            concurrency: Maximum concurrent uploads (1-16)
+
+        Returns:
+            Batch upload and analysis result
+        """
+        url = self._urls["fileupload_analysis_batch"]
+
+        data = {
+            'processing_mode': processing_mode,
+            'archive_ttl': archive_ttl,
+            'destroy_ttl': destroy_ttl,
+            'concurrency': concurrency
+        }
+        response = self._post_multipart(url, data, [('primary_files', file_path) for file_path in file_paths])
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    # ==================== Asset Management ====================
+
+    def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
+        """
+        List all versions of a file
+
+        Args:
+            asset_path: Asset path identifier
+            filename: Filename
+
+        Returns:
+            List of versions
+        """
+        url = self._urls["fileversions"]
+        params = {
+            "asset_path": asset_path,
+            "filename": filename
+        }
+        response = self._session.get(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def download_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        return_file_content: bool = True,
+        dest_path: Optional[str] = None
+    ) -> Any:
+        """
+        Download asset
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+            return_file_content: Whether to return file content
+            dest_path: Destination path; when given, the content is streamed straight to this file and the path is returned, so memory use does not grow with file size
+
+        Returns:
+            File content, destination path (when dest_path is given) or response
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": return_file_content
+        }
+        if return_file_content and dest_path:
+            with self._session.get(url, params=params, headers=self._get_headers(), stream=True) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+                with open(dest_path, 'wb') as f:
+                    shutil.copyfileobj(response.raw, f, length=DOWNLOAD_CHUNK_SIZE)
+            return dest_path
+
+        response = self._session.get(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+
+        if return_file_content:
+            return response.content
+        else:
+            return _json_loads(response.content)
+
+    def iter_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        Stream asset content chunk by chunk, suitable for large video/audio files
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+            chunk_size: Chunk size in bytes
+
+        Yields:
+            File content chunks
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        with self._session.get(url, params=params, headers=self._get_headers(), stream=True) as response:
+            response.raise_for_status()
+            yield from response.iter_content(chunk_size=chunk_size)
+
+    def download_asset_parallel(
+        self,
+        asset_path: str,
+        version_id: str,
+        parts: int = 8
+    ) -> bytes:
+        """
+        Download an asset with several parallel HTTP Range requests, for large files on high-bandwidth, high-latency links
+
+        Issues a HEAD first to learn the size; when the server advertises Accept-Ranges: bytes, the file is split into parts
+        ranges fetched concurrently by a thread pool and written straight into a preallocated buffer.
+        Falls back to download_asset when the server does not support range requests.
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+            parts: Number of parallel requests (1-16), each covering at least DOWNLOAD_CHUNK_SIZE
+
+        Returns:
+            File content
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        # Ranges refer to the raw, uncompressed content, so no content coding is accepted
+        headers = {**self._get_headers(), "Accept-Encoding": "identity"}
+
+        head = self._session.head(url, params=params, headers=headers, allow_redirects=True)
+        size = int(head.headers.get("Content-Length") or 0) if head.ok else 0
+        parts = max(1, min(parts, 16, size // DOWNLOAD_CHUNK_SIZE))
+        if parts == 1 or head.headers.get("Accept-Ranges") != "bytes":
+            return self.download_asset(asset_path, version_id)
+
+        buffer = bytearray(size)
+        view = memoryview(buffer)
+        step = math.ceil(size / parts)
+
+        def fetch_range(start: int) -> None:
+            end = min(start + step, size) - 1
+            response = self._session.get(url, params=params, headers={**headers, "Range": f"bytes={start}-{end}"})
+            response.raise_for_status()
+            if response.status_code != 206 or len(response.content) != end - start + 1:
+                raise requests.HTTPError(f"Range request did not return the expected content: bytes={start}-{end}", response=response)
+            view[start:end + 1] = response.content
+
+        with ThreadPoolExecutor(max_workers=parts) as executor:
+            list(executor.map(fetch_range, range(0, size, step)))
+        return bytes(buffer)
+
+    def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+        """
+        Archive asset
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+
+        Returns:
+            Archive result
+        """
+        url = self._urls["filearchive"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id
+        }
+        response = self._session.post(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+        """
+        Delete archived asset
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+
+        Returns:
+            Delete result
+        """
+        url = self._urls["delfile"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id
+        }
+        response = self._session.post(url, params=params, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    # ==================== Processing ====================
+
+    def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Process uploaded file
+
+        Args:
+            upload_result: Upload result information
+
+        Returns:
+            Processing result
+        """
+        url = self._urls["process_file"]
+        payload = {"upload_result": upload_result}
+        result = self._post_json(url, payload)
+        self.invalidate_read_cache()
+        return result
+
+    def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
+        """
+        Get cached value from Redis
+
+        Args:
+            m_type: Media type (document, video, image, audio)
+            key: Cache key
+
+        Returns:
+            Cached value
+        """
+        url = f"{self._urls['processing_cache']}/{m_type}/{key}"
+        return self._get_read_cached((m_type, key), url)
+
+    def get_all_cache(self) -> Dict[str, Any]:
+        """
+        Get all Redis cache
+
+        Returns:
+            All cache key-value pairs
+        """
+        url = self._urls["cache_all"]
+        return self._get_read_cached("__all__", url)
+
+    # ==================== Chat ====================
+
+    def send_chat(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> Dict[str, Any]:
+        """
+        Send chat message
 
+        Args:
+            user_id: User ID
+            message: Message content
+            search_results: Search results (optional)
 
-class RaptorAPIClient:
-    """RAPTOR API Gateway Client"""
+        Returns:
+            Chat response
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+
+        return self._post_json(url, payload)
+
+    def send_chat_stream(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> Iterator[str]:
+        """
+        Send a chat message over Server-Sent Events, yielding the reply as it is generated
+
+        Falls back to yielding the full reply at once when the server does not answer with text/event-stream.
+
+        Args:
+            user_id: User ID
+            message: Message content
+            search_results: Search results (optional)
+
+        Yields:
+            Reply text pieces
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+        headers = {**self._get_headers(), "Accept": "text/event-stream"}
+
+        with self._session.post(url, data=_json_dumps(payload), headers=headers, stream=True) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield _json_loads(response.content).get("response", "")
+                return
+
+            # SSE is always UTF-8; requests would otherwise decode text/* as ISO-8859-1
+            response.encoding = "utf-8"
+            for line in response.iter_lines(decode_unicode=True):
+                text = _sse_text(line)
+                if text == SSE_DONE:
+                    break
+                if text:
+                    yield text
+
+    def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
+        """
+        Get user chat memory
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Chat memory
+        """
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = self._session.get(url, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
+        """
+        Clear user chat memory
+
+        Args:
+            user_id: User ID
+
+        Returns:
+            Clear result
+        """
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = self._session.delete(url, headers=self._get_headers())
+        response.raise_for_status()
+        return _json_loads(response.content)
+
+    # ==================== Health ====================
+
+    def health_check(self) -> Dict[str, Any]:
+        """
+        Health check
+
+        When the server sends an ETag, the request is made conditional with If-None-Match and a 304 returns the previous result.
+
+        Returns:
+            Health status
+        """
+        url = self._urls["health"]
+        headers = {"If-None-Match": self._health_etag} if self._health_etag else None
+        response = self._session.get(url, headers=headers)
+        if response.status_code == 304:
+            return self._health_body
+        response.raise_for_status()
+        self._health_body = _json_loads(response.content)
+        self._health_etag = response.headers.get("ETag")
+        return self._health_body
+
+
+# ==================== Async Client ====================
+
+class AsyncRaptorAPIClient:
+    """
+    RAPTOR API Gateway Async Client
+
+    Built on httpx.AsyncClient with the same methods as RaptorAPIClient;
+    independent requests can be sent concurrently with asyncio.gather, taking about one round trip in total.
+
+    httpx.AsyncClient is bound to an event loop, so all instances in the same event loop share one connection pool,
+    created on the first request. Use it as `async with AsyncRaptorAPIClient() as client:`; the pool is
+    reference-counted and only closed when the last instance using it closes, so concurrent instances are unaffected.
+    """
 
-    def __init__(self, base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012"):
+    # httpx.AsyncClient shared per event loop and its reference count; entries go away automatically once the loop is gone
+    _loop_clients: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]"] = \
+        weakref.WeakKeyDictionary()
+    _loop_refs: ClassVar["weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int]"] = weakref.WeakKeyDictionary()
+
+    def __init__(
+        self,
+        base_url: str = "http://raptor_open_0_1_api.dhtsolution.com:8012",
+        compress_requests: bool = False
+    ):
+        if httpx is None:
+            raise ImportError("AsyncRaptorAPIClient requires httpx, please run: pip install httpx")
         self.base_url = base_url
-        self.token: Optional[str] = None
+        self.token = None
+        # Gzip large JSON request bodies; off by default (the server must decompress Content-Encoding: gzip requests)
+        self.compress_requests = compress_requests
+        # ETag and matching body of the last health_check, for conditional GETs
+        self._health_etag: Optional[str] = None
+        self._health_body: Optional[Dict[str, Any]] = None
+        # Event loops on which this instance holds a reference to the shared pool
+        self._held_loops: "weakref.WeakSet[asyncio.AbstractEventLoop]" = weakref.WeakSet()
+
+    def _acquire(self, loop: asyncio.AbstractEventLoop) -> None:
+        """Hold a reference to the shared pool on the given loop, counted once per instance per loop"""
+        if loop not in self._held_loops:
+            self._held_loops.add(loop)
+            self._loop_refs[loop] = self._loop_refs.get(loop, 0) + 1
+
+    @property
+    def _client(self) -> "httpx.AsyncClient":
+        """Async HTTP client shared by the current event loop, created on first use or after it was closed"""
+        loop = asyncio.get_running_loop()
+        self._acquire(loop)
+        client = self._loop_clients.get(loop)
+        if client is None or client.is_closed:
+            client = self._loop_clients[loop] = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+                timeout=30.0
+            )
+        return client
+
+    async def aclose(self) -> None:
+        """
+        Release this instance's reference to the current event loop's shared pool
+
+        The pool stays open while other instances still use it and is closed when the last reference is released.
+        """
+        loop = asyncio.get_running_loop()
+        if loop not in self._held_loops:
+            return
+        self._held_loops.discard(loop)
+        refs = self._loop_refs.get(loop, 1) - 1
+        if refs > 0:
+            self._loop_refs[loop] = refs
+            return
+        self._loop_refs.pop(loop, None)
+        client = self._loop_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    async def __aenter__(self) -> "AsyncRaptorAPIClient":
+        self._acquire(asyncio.get_running_loop())
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
+
+    @property
+    def base_url(self) -> str:
+        """API Base URL"""
+        return self._base_url
+
+    @base_url.setter
+    def base_url(self, value: str) -> None:
+        """Pre-build the full URL of every endpoint whenever base_url is set, so requests do not format strings each time"""
+        self._base_url = value
+        self._urls = {name: f"{value}{path}" for name, path in API_PATHS.items()}
+
+    @property
+    def token(self) -> Optional[str]:
+        """JWT access token"""
+        return self._token
+
+    @token.setter
+    def token(self, value: Optional[str]) -> None:
+        """Rebuild the cached request headers whenever the token is set, so every request reuses them"""
+        self._token = value
+        self._headers_no_auth = MappingProxyType({
+            "Content-Type": "application/json",
+            # Compression formats the client can decode (gzip/deflate, plus br when brotli is installed), so the server can compress large JSON responses
+            "Accept-Encoding": ACCEPT_ENCODING
+        })
+        if value:
+            self._headers_auth = MappingProxyType({**self._headers_no_auth, "Authorization": f"Bearer {value}"})
+        else:
+            self._headers_auth = self._headers_no_auth
 
-    def _get_headers(self, include_auth: bool = True) -> Dict[str, str]:
-        """Get request headers"""
-        headers = {"Content-Type": "application/json"}
-        if include_auth and self.token:
-            headers["Authorization"] = f"Bearer {self.token}"
-        return headers
+    def _get_headers(self, include_auth: bool = True) -> Mapping[str, str]:
+        """Get request headers (returns a cached read-only mapping; copy it before adding headers)"""
+        return self._headers_auth if include_auth else self._headers_no_auth
+
+    async def _post_json(self, url: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a JSON POST request and decode the response"""
+        body, headers = _json_request_body(payload, self._get_headers(), self.compress_requests)
+        response = await self._client.post(url, content=body, headers=headers)
+        response.raise_for_status()
+        return _json_loads(response.content)
 
     # ==================== Authentication ====================
 
-    def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
+    async def register_user(self, username: str, email: str, password: str) -> Dict[str, Any]:
         """
         Register a new user
 
@@ -40,17 +1426,17 @@ class RaptorAPIClient:
         Returns:
             Registration result
         """
-        url = f"{self.base_url}/api/v1/auth/register"
+        url = self._urls["register"]
         payload = {
             "username": username,
             "email": email,
             "password": password
         }
-        response = requests.post(url, json=payload)
+        response = await self._client.post(url, content=_json_dumps(payload), headers=self._get_headers(include_auth=False))
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def login(self, username: str, password: str) -> str:
+    async def login(self, username: str, password: str) -> str:
         """
         Login and get JWT token
 
@@ -61,21 +1447,50 @@ class RaptorAPIClient:
         Returns:
             JWT access token
         """
-        url = f"{self.base_url}/api/v1/auth/login"
+        url = self._urls["login"]
         # OAuth2 password flow uses form data
         data = {
             "username": username,
             "password": password
         }
-        response = requests.post(url, data=data)
+        response = await self._client.post(url, data=data)
         response.raise_for_status()
-        result = response.json()
+        result = _json_loads(response.content)
         self.token = result.get("access_token")
         return self.token
 
     # ==================== Search ====================
 
-    def video_search(
+    async def _search(
+        self,
+        kind: str,
+        query_text: str,
+        embedding_type: str,
+        limit: int,
+        **filters: Any
+    ) -> Dict[str, Any]:
+        """
+        Single-collection similarity search shared by the four *_search methods
+
+        Args:
+            kind: Collection type (video, audio, document, image)
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            limit: Number of results to return
+            **filters: Optional filter fields (filename, speaker, source); empty values are not sent
+
+        Returns:
+            Search results
+        """
+        payload = {
+            "query_text": query_text,
+            "embedding_type": embedding_type,
+            "limit": limit
+        }
+        payload.update((field, value) for field, value in filters.items() if value)
+        return await self._post_json(self._urls[f"{kind}_search"], payload)
+
+    async def video_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -96,22 +1511,9 @@ class RaptorAPIClient:
         Returns:
             Search results
         """
-        url = f"{self.base_url}/api/v1/search/video_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if speaker:
-            payload["speaker"] = speaker
-
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("video", query_text, embedding_type, limit, filename=filename, speaker=speaker)
 
-    def audio_search(
+    async def audio_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -132,22 +1534,9 @@ class RaptorAPIClient:
         Returns:
             Search results
         """
-        url = f"{self.base_url}/api/v1/search/audio_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if speaker:
-            payload["speaker"] = speaker
-
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("audio", query_text, embedding_type, limit, filename=filename, speaker=speaker)
 
-    def document_search(
+    async def document_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -168,22 +1557,9 @@ class RaptorAPIClient:
         Returns:
             Search results
         """
-        url = f"{self.base_url}/api/v1/search/document_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if source:
-            payload["source"] = source
-
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("document", query_text, embedding_type, limit, filename=filename, source=source)
 
-    def image_search(
+    async def image_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -204,22 +1580,9 @@ class RaptorAPIClient:
         Returns:
             Search results
         """
-        url = f"{self.base_url}/api/v1/search/image_search"
-        payload = {
-            "query_text": query_text,
-            "embedding_type": embedding_type,
-            "limit": limit
-        }
-        if filename:
-            payload["filename"] = filename
-        if source:
-            payload["source"] = source
-
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._search("image", query_text, embedding_type, limit, filename=filename, source=source)
 
-    def unified_search(
+    async def unified_search(
         self,
         query_text: str,
         embedding_type: str = "text",
@@ -242,7 +1605,7 @@ class RaptorAPIClient:
         Returns:
             Search results
         """
-        url = f"{self.base_url}/api/v1/search/unified_search"
+        url = self._urls["unified_search"]
         payload = {
             "query_text": query_text,
             "embedding_type": embedding_type,
@@ -255,13 +1618,11 @@ class RaptorAPIClient:
         if score_threshold is not None:
             payload["score_threshold"] = score_threshold
 
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
 
     # ==================== File Upload ====================
 
-    def upload_file(
+    async def upload_file(
         self,
         file_path: str,
         archive_ttl: int = 30,
@@ -278,7 +1639,7 @@ class RaptorAPIClient:
         Returns:
             Upload result
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload"
+        url = self._urls["fileupload"]
 
         with open(file_path, 'rb') as f:
             files = {'primary_file': f}
@@ -287,12 +1648,12 @@ class RaptorAPIClient:
                 'destroy_ttl': destroy_ttl
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
 
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def upload_files_batch(
+    async def upload_files_batch(
         self,
         file_paths: List[str],
         archive_ttl: int = 30,
@@ -311,7 +1672,7 @@ class RaptorAPIClient:
         Returns:
             Batch upload result
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_batch"
+        url = self._urls["fileupload_batch"]
 
         files = []
         try:
@@ -324,14 +1685,53 @@ class RaptorAPIClient:
                 'concurrency': concurrency
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         finally:
             for _, file_obj in files:
                 file_obj.close()
 
-    def upload_file_with_analysis(
+    async def upload_files_parallel(
+        self,
+        file_paths: List[str],
+        archive_ttl: int = 30,
+        destroy_ttl: int = 30,
+        concurrency: int = 4,
+        processing_mode: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Upload multiple files in parallel on the client side (one request per file)
+
+        Sends requests to the single-file upload endpoint with asyncio.gather sharing the AsyncClient connection pool;
+        one large file does not hold up the others, and one failed file does not affect the rest.
+
+        Args:
+            file_paths: List of file paths to upload
+            archive_ttl: Archive time (days)
+            destroy_ttl: Destroy time (days)
+            concurrency: Max concurrent uploads (1-16)
+            processing_mode: When set, use upload_file_with_analysis so each file is analysed with this mode after upload
+
+        Returns:
+            List of results in the same order as file_paths, each with file_path, success, and result or error
+        """
+        semaphore = asyncio.Semaphore(max(1, min(concurrency, 16)))
+
+        async def upload_one(file_path: str) -> Dict[str, Any]:
+            async with semaphore:
+                try:
+                    if processing_mode is None:
+                        result = await self.upload_file(file_path, archive_ttl, destroy_ttl)
+                    else:
+                        result = await self.upload_file_with_analysis(file_path, processing_mode, archive_ttl, destroy_ttl)
+                except Exception as e:
+                    return {"file_path": file_path, "success": False, "error": str(e)}
+            return {"file_path": file_path, "success": True, "result": result}
+
+        return list(await asyncio.gather(*(upload_one(file_path) for file_path in file_paths)))
+
+    async def upload_file_with_analysis(
         self,
         file_path: str,
         processing_mode: str = "default",
@@ -350,7 +1750,7 @@ class RaptorAPIClient:
         Returns:
             Upload and analysis result
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_analysis"
+        url = self._urls["fileupload_analysis"]
 
         with open(file_path, 'rb') as f:
             files = {'primary_file': f}
@@ -360,12 +1760,12 @@ class RaptorAPIClient:
                 'destroy_ttl': destroy_ttl
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
 
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def upload_files_batch_with_analysis(
+    async def upload_files_batch_with_analysis(
         self,
         file_paths: List[str],
         processing_mode: str = "default",
@@ -386,7 +1786,7 @@ class RaptorAPIClient:
         Returns:
             Batch upload and analysis result
         """
-        url = f"{self.base_url}/api/v1/asset/fileupload_analysis_batch"
+        url = self._urls["fileupload_analysis_batch"]
 
         files = []
         try:
@@ -400,16 +1800,16 @@ class RaptorAPIClient:
                 'concurrency': concurrency
             }
             headers = {"Authorization": f"Bearer {self.token}"} if self.token else {}
-            response = requests.post(url, files=files, data=data, headers=headers)
+            response = await self._client.post(url, files=files, data=data, headers=headers)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         finally:
             for _, file_obj in files:
                 file_obj.close()
 
     # ==================== Asset Management ====================
 
-    def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
+    async def list_file_versions(self, asset_path: str, filename: str) -> Dict[str, Any]:
         """
         List all versions of a file
 
@@ -420,20 +1820,21 @@ class RaptorAPIClient:
         Returns:
             List of versions
         """
-        url = f"{self.base_url}/api/v1/asset/fileversions"
+        url = self._urls["fileversions"]
         params = {
             "asset_path": asset_path,
             "filename": filename
         }
-        response = requests.get(url, params=params, headers=self._get_headers())
+        response = await self._client.get(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def download_asset(
+    async def download_asset(
         self,
         asset_path: str,
         version_id: str,
-        return_file_content: bool = True
+        return_file_content: bool = True,
+        dest_path: Optional[str] = None
     ) -> Any:
         """
         Download asset
@@ -442,25 +1843,62 @@ class RaptorAPIClient:
             asset_path: Asset path identifier
             version_id: Version ID
             return_file_content: Whether to return file content
+            dest_path: Destination path; when given, the content is streamed straight to this file and the path is returned, so memory use does not grow with file size
 
         Returns:
-            File content or response
+            File content, destination path (when dest_path is given) or response
         """
-        url = f"{self.base_url}/api/v1/asset/filedownload"
+        url = self._urls["filedownload"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id,
             "return_file_content": return_file_content
         }
-        response = requests.get(url, params=params, headers=self._get_headers())
+        if return_file_content and dest_path:
+            async with self._client.stream("GET", url, params=params, headers=self._get_headers()) as response:
+                response.raise_for_status()
+                with open(dest_path, 'wb') as f:
+                    async for chunk in response.aiter_bytes(DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+            return dest_path
+
+        response = await self._client.get(url, params=params, headers=self._get_headers())
         response.raise_for_status()
 
         if return_file_content:
             return response.content
         else:
-            return response.json()
+            return _json_loads(response.content)
 
-    def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+    async def iter_asset(
+        self,
+        asset_path: str,
+        version_id: str,
+        chunk_size: int = DOWNLOAD_CHUNK_SIZE
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream asset content chunk by chunk, suitable for large video/audio files
+
+        Args:
+            asset_path: Asset path identifier
+            version_id: Version ID
+            chunk_size: Chunk size in bytes
+
+        Yields:
+            File content chunks
+        """
+        url = self._urls["filedownload"]
+        params = {
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "return_file_content": True
+        }
+        async with self._client.stream("GET", url, params=params, headers=self._get_headers()) as response:
+            response.raise_for_status()
+            async for chunk in response.aiter_bytes(chunk_size):
+                yield chunk
+
+    async def archive_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
         """
         Archive asset
 
@@ -471,16 +1909,16 @@ class RaptorAPIClient:
         Returns:
             Archive result
         """
-        url = f"{self.base_url}/api/v1/asset/filearchive"
+        url = self._urls["filearchive"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id
         }
-        response = requests.post(url, params=params, headers=self._get_headers())
+        response = await self._client.post(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
+    async def delete_asset(self, asset_path: str, version_id: str) -> Dict[str, Any]:
         """
         Delete archived asset
 
@@ -491,18 +1929,18 @@ class RaptorAPIClient:
         Returns:
             Delete result
         """
-        url = f"{self.base_url}/api/v1/asset/delfile"
+        url = self._urls["delfile"]
         params = {
             "asset_path": asset_path,
             "version_id": version_id
         }
-        response = requests.post(url, params=params, headers=self._get_headers())
+        response = await self._client.post(url, params=params, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
     # ==================== Processing ====================
 
-    def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
+    async def process_file(self, upload_result: Dict[str, Any]) -> Dict[str, Any]:
         """
         Process uploaded file
 
@@ -512,13 +1950,11 @@ class RaptorAPIClient:
         Returns:
             Processing result
         """
-        url = f"{self.base_url}/api/v1/processing/process-file"
+        url = self._urls["process_file"]
         payload = {"upload_result": upload_result}
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
 
-    def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
+    async def get_cached_value(self, m_type: str, key: str) -> Dict[str, Any]:
         """
         Get cached value from Redis
 
@@ -529,26 +1965,26 @@ class RaptorAPIClient:
         Returns:
             Cached value
         """
-        url = f"{self.base_url}/api/v1/processing/processing/cache/{m_type}/{key}"
-        response = requests.get(url)
+        url = f"{self._urls['processing_cache']}/{m_type}/{key}"
+        response = await self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def get_all_cache(self) -> Dict[str, Any]:
+    async def get_all_cache(self) -> Dict[str, Any]:
         """
         Get all Redis cache
 
         Returns:
             All cache key-value pairs
         """
-        url = f"{self.base_url}/api/v1/processing/cache/all"
-        response = requests.get(url)
+        url = self._urls["cache_all"]
+        response = await self._client.get(url)
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
     # ==================== Chat ====================
 
-    def send_chat(
+    async def send_chat(
         self,
         user_id: str,
         message: str,
@@ -565,7 +2001,7 @@ class RaptorAPIClient:
         Returns:
             Chat response
         """
-        url = f"{self.base_url}/api/v1/chat/chat"
+        url = self._urls["chat"]
         payload = {
             "user_id": user_id,
             "message": message
@@ -573,11 +2009,50 @@ class RaptorAPIClient:
         if search_results:
             payload["search_results"] = search_results
 
-        response = requests.post(url, json=payload, headers=self._get_headers())
-        response.raise_for_status()
-        return response.json()
+        return await self._post_json(url, payload)
 
-    def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
+    async def send_chat_stream(
+        self,
+        user_id: str,
+        message: str,
+        search_results: Optional[List[Dict]] = None
+    ) -> AsyncIterator[str]:
+        """
+        Send a chat message over Server-Sent Events, yielding the reply as it is generated
+
+        Falls back to yielding the full reply at once when the server does not answer with text/event-stream.
+
+        Args:
+            user_id: User ID
+            message: Message content
+            search_results: Search results (optional)
+
+        Yields:
+            Reply text pieces
+        """
+        url = self._urls["chat"]
+        payload = {
+            "user_id": user_id,
+            "message": message
+        }
+        if search_results:
+            payload["search_results"] = search_results
+        headers = {**self._get_headers(), "Accept": "text/event-stream"}
+
+        async with self._client.stream("POST", url, content=_json_dumps(payload), headers=headers) as response:
+            response.raise_for_status()
+            if not response.headers.get("Content-Type", "").startswith("text/event-stream"):
+                yield _json_loads(await response.aread()).get("response", "")
+                return
+
+            async for line in response.aiter_lines():
+                text = _sse_text(line)
+                if text == SSE_DONE:
+                    break
+                if text:
+                    yield text
+
+    async def get_chat_memory(self, user_id: str) -> Dict[str, Any]:
         """
         Get user chat memory
 
@@ -587,12 +2062,12 @@ class RaptorAPIClient:
         Returns:
             Chat memory
         """
-        url = f"{self.base_url}/api/v1/chat/memory/{user_id}"
-        response = requests.get(url, headers=self._get_headers())
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = await self._client.get(url, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
-    def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
+    async def clear_chat_memory(self, user_id: str) -> Dict[str, Any]:
         """
         Clear user chat memory
 
@@ -602,25 +2077,82 @@ class RaptorAPIClient:
         Returns:
             Clear result
         """
-        url = f"{self.base_url}/api/v1/chat/memory/{user_id}"
-        response = requests.delete(url, headers=self._get_headers())
+        url = f"{self._urls['chat_memory']}/{user_id}"
+        response = await self._client.delete(url, headers=self._get_headers())
         response.raise_for_status()
-        return response.json()
+        return _json_loads(response.content)
 
     # ==================== Health ====================
 
-    def health_check(self) -> Dict[str, Any]:
+    async def health_check(self) -> Dict[str, Any]:
         """
         Health check
 
+        When the server sends an ETag, the request is made conditional with If-None-Match and a 304 returns the previous result.
+
         Returns:
             Health status
         """
-        url = f"{self.base_url}/health"
-        response = requests.get(url)
+        url = self._urls["health"]
+        headers = {"If-None-Match": self._health_etag} if self._health_etag else None
+        response = await self._client.get(url, headers=headers)
+        if response.status_code == 304:
+            return self._health_body
         response.raise_for_status()
-        return response.json()
+        self._health_body = _json_loads(response.content)
+        self._health_etag = response.headers.get("ETag")
+        return self._health_body
+
+    async def search_all(
+        self,
+        query_text: str,
+        embedding_type: str = "text",
+        limit: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Search the video, audio, document and image collections at the same time
+
+        Args:
+            query_text: Search query text
+            embedding_type: 'text' or 'summary'
+            limit: Number of results per collection
+
+        Returns:
+            Search results keyed by collection name
+        """
+        video, audio, document, image = await asyncio.gather(
+            self.video_search(query_text, embedding_type, limit=limit),
+            self.audio_search(query_text, embedding_type, limit=limit),
+            self.document_search(query_text, embedding_type, limit=limit),
+            self.image_search(query_text, embedding_type, limit=limit)
+        )
+        return {"video": video, "audio": audio, "document": document, "image": image}
+
+    async def search_many(
+        self,
+        queries: List[Dict[str, Any]],
+        concurrency: int = 16
+    ) -> List[Any]:
+        """
+        Run multiple unified searches concurrently
+
+        All requests share one AsyncClient connection pool, with a semaphore limiting in-flight requests;
+        K queries take about one round trip in total instead of K.
+
+        Args:
+            queries: List of unified_search keyword-argument dicts
+            concurrency: Max concurrent requests
+
+        Returns:
+            List of results in the same order as queries; failed queries are returned as exception objects
+        """
+        semaphore = asyncio.Semaphore(max(1, concurrency))
 
+        async def search_one(query: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.unified_search(**query)
+
+        return await asyncio.gather(*(search_one(query) for query in queries), return_exceptions=True)
 
 # ==================== Usage Examples ====================
 
@@ -651,51 +2183,46 @@ def example_usage():
         print(f"Login failed: {e}")
         return
 
-    # 3. Video search
-    print("\n=== Video Search ===")
-    try:
-        result = client.video_search(
-            query_text="machine learning",
-            embedding_type="text",
-            filename=["MV.mp4"],
-            speaker=["SPEAKER_00"],
-            limit=5
-        )
-        print(f"Search results: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"Search failed: {e}")
-
-    # 4. Document search
-    print("\n=== Document Search ===")
-    try:
-        result = client.document_search(
-            query_text="financial report",
-            embedding_type="text",
-            filename=["EF25Y01.csv"],
-            source="csv",
-            limit=5
-        )
-        print(f"Search results: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"Search failed: {e}")
+    # 3-5. Video, document and unified search are independent; run them concurrently in a thread pool so they take about as long as the slowest one
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        searches = {
+            "Video Search": executor.submit(
+                client.video_search,
+                query_text="machine learning",
+                embedding_type="text",
+                filename=["MV.mp4"],
+                speaker=["SPEAKER_00"],
+                limit=5
+            ),
+            "Document Search": executor.submit(
+                client.document_search,
+                query_text="financial report",
+                embedding_type="text",
+                filename=["EF25Y01.csv"],
+                source="csv",
+                limit=5
+            ),
+            "Unified Search": executor.submit(
+                client.unified_search,
+                query_text="machine learning and artificial intelligence",
+                embedding_type="text",
+                filters={
+                    "video": {"filename": ["MV.mp4"]},
+                    "document": {"source": "csv"}
+                },
+                limit_per_collection=3,
+                global_limit=10,
+                score_threshold=0.5
+            )
+        }
 
-    # 5. Unified search
-    print("\n=== Unified Search ===")
-    try:
-        result = client.unified_search(
-            query_text="machine learning and artificial intelligence",
-            embedding_type="text",
-            filters={
-                "video": {"filename": ["MV.mp4"]},
-                "document": {"source": "csv"}
-            },
-            limit_per_collection=3,
-            global_limit=10,
-            score_threshold=0.5
-        )
-        print(f"Search results: {json.dumps(result, indent=2, ensure_ascii=False)}")
-    except Exception as e:
-        print(f"Search failed: {e}")
+    for title, future in searches.items():
+        print(f"\n=== {title} ===")
+        try:
+            result = future.result()
+            print(f"Search results: {json.dumps(result, indent=2, ensure_ascii=False)}")
+        except Exception as e:
+            print(f"Search failed: {e}")
 
     # 6. Upload file (assuming file exists)
     print("\n=== Upload File ===")
@@ -738,5 +2265,77 @@ def example_usage():
         print(f"Check failed: {e}")
 
 
+async def example_usage_async():
+    """Async usage example: after login, send independent requests concurrently with asyncio.gather"""
+
+    async with AsyncRaptorAPIClient() as client:
+        # 1. Register and login (later requests need the token, so these run in order)
+        print("=== Register User ===")
+        try:
+            result = await client.register_user(
+                username="test_user",
+                email="test@example.com",
+                password="secure_password"
+            )
+            print(f"Registration successful: {result}")
+        except Exception as e:
+            print(f"Registration failed: {e}")
+
+        print("\n=== Login ===")
+        try:
+            token = await client.login(username="test_user", password="secure_password")
+            print(f"Login successful, Token: {token[:20]}...")
+        except Exception as e:
+            print(f"Login failed: {e}")
+            return
+
+        # 2. Searches, chat, chat memory and health check are independent; sent concurrently they take about as long as the slowest one
+        requests_by_title = {
+            "Video Search": client.video_search(
+                query_text="machine learning",
+                embedding_type="text",
+                filename=["MV.mp4"],
+                speaker=["SPEAKER_00"],
+                limit=5
+            ),
+            "Document Search": client.document_search(
+                query_text="financial report",
+                embedding_type="text",
+                filename=["EF25Y01.csv"],
+                source="csv",
+                limit=5
+            ),
+            "Unified Search": client.unified_search(
+                query_text="machine learning and artificial intelligence",
+                embedding_type="text",
+                filters={
+                    "video": {"filename": ["MV.mp4"]},
+                    "document": {"source": "csv"}
+                },
+                limit_per_collection=3,
+                global_limit=10,
+                score_threshold=0.5
+            ),
+            "Chat": client.send_chat(
+                user_id="test_user",
+                message="Please summarize the key points of machine learning for me"
+            ),
+            "Get Chat Memory": client.get_chat_memory(user_id="test_user"),
+            "Health Check": client.health_check()
+        }
+        results = await asyncio.gather(*requests_by_title.values(), return_exceptions=True)
+
+        for title, result in zip(requests_by_title, results):
+            print(f"\n=== {title} ===")
+            if isinstance(result, Exception):
+                print(f"Failed: {result}")
+            else:
+                print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
 if __name__ == "__main__":
-    example_usage()
+    # Run the async example when httpx is installed, otherwise fall back to the sync one
+    if httpx is not None:
+        asyncio.run(example_usage_async())
+    else:
+        example_usage()
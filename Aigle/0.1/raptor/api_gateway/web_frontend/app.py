@@ -2,21 +2,33 @@ import base64
 import importlib.util
 import json
 import os
+import re
+import shutil
 import tempfile
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import requests
 from flask import (
     Flask,
+    Response,
     abort,
+    jsonify,
     redirect,
     render_template,
     request,
+    send_file,
     session,
     url_for,
 )
-from werkzeug.datastructures import FileStorage
+from werkzeug.datastructures import FileStorage, ImmutableMultiDict
+
+# orjson 為選用依賴，安裝後以其格式化回應並解析表單中的 JSON
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 DEFAULT_BASE_URL = os.getenv(
     "RAPTOR_API_BASE_URL",
@@ -25,6 +37,15 @@ DEFAULT_BASE_URL = os.getenv(
 SESSION_BASE_URL_KEY = "raptor_base_url"
 SESSION_TOKEN_KEY = "raptor_token"
 SESSION_ASSET_RECORDS_KEY = "raptor_asset_records"
+SESSION_ANALYSIS_JOBS_KEY = "raptor_analysis_jobs"
+# 每個 session 保留的背景工作 ID 數量上限；只能查詢自己送出的工作
+MAX_SESSION_ANALYSIS_JOBS = 20
+# 上傳檔案寫入暫存檔時的複製區塊大小 (Werkzeug FileStorage.save 預設僅 16 KiB)
+UPLOAD_COPY_BUFFER_SIZE = 1 << 20
+# 上傳/下載暫存檔的根目錄；預設放在 tmpfs (/dev/shm) 以免寫入磁碟，無 tmpfs 時退回系統暫存目錄
+_DEFAULT_UPLOAD_PARENT = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+UPLOAD_ROOT = Path(os.getenv("RAPTOR_UPLOAD_ROOT", os.path.join(_DEFAULT_UPLOAD_PARENT, "raptor_uploads")))
+UPLOAD_ROOT.mkdir(parents=True, exist_ok=True)
 
 PAGE_DEFINITIONS: List[Tuple[str, str]] = [
     ("settings", "環境設定"),
@@ -37,6 +58,7 @@ PAGE_DEFINITIONS: List[Tuple[str, str]] = [
 ]
 DEFAULT_PAGE = "search"
 VALID_PAGES = {key for key, _ in PAGE_DEFINITIONS}
+PAGES_USING_ASSET_RECORDS = frozenset({"uploads", "assets", "processing"})
 
 AUTH_REQUIRED_ACTIONS = {
     "video_search",
@@ -67,6 +89,14 @@ ASSET_RESULT_ACTIONS = {
     "process_file",
 }
 
+# 表單中以逗號或換行分隔的清單欄位
+LIST_SEPARATOR_RE = re.compile(r"[,\r\n]+")
+
+# 從回應 JSON 中辨識資產紀錄時依序嘗試的欄位名稱
+ASSET_PATH_KEYS = ("asset_path", "assetPath", "assetpath")
+VERSION_ID_KEYS = ("version_id", "versionId", "versionid", "version")
+FILENAME_KEYS = ("filename", "file_name", "fileName", "name", "primary_filename", "uploaded_file")
+
 ACTION_DISPLAY_NAMES = {
     "upload_file": "單檔上傳",
     "upload_files_batch": "批次上傳",
@@ -88,10 +118,37 @@ def _load_sample_client_class():
 
 
 RaptorAPIClient = _load_sample_client_class()
+# 上游連線池大小；以多執行緒 worker 部署時設為每個進程的執行緒數，避免連線在池滿時被丟棄重建
+if os.getenv("RAPTOR_UPSTREAM_POOL_SIZE"):
+    RaptorAPIClient.pool_maxsize = int(os.environ["RAPTOR_UPSTREAM_POOL_SIZE"])
 
 app = Flask(__name__)
 app.secret_key = os.getenv("RAPTOR_WEB_SECRET", "raptor-demo-secret")
 
+REDIS_URL = os.getenv("RAPTOR_REDIS_URL")
+ANALYSIS_JOB_QUEUE = None
+ANALYSIS_JOB_TIMEOUT = 3600
+if REDIS_URL:
+    # 設定 Redis 時改用伺服器端 Session，Cookie 只帶 session id，資產紀錄不再隨每次回應簽章傳送
+    import redis
+    from flask_session import Session
+
+    redis_connection = redis.Redis.from_url(REDIS_URL)
+    app.config.update(
+        SESSION_TYPE="redis",
+        SESSION_REDIS=redis_connection,
+        SESSION_USE_SIGNER=False,
+        SESSION_PERMANENT=False,
+        SESSION_KEY_PREFIX="raptor:",
+    )
+    Session(app)
+
+    if os.getenv("RAPTOR_ANALYSIS_QUEUE"):
+        # 上傳並分析可能耗時數分鐘，啟用時改交由 rq worker 在背景執行；worker 需與前端共用 UPLOAD_ROOT
+        from rq import Queue
+
+        ANALYSIS_JOB_QUEUE = Queue("raptor_analysis", connection=redis_connection)
+
 
 def _get_base_url() -> str:
     return session.get(SESSION_BASE_URL_KEY, DEFAULT_BASE_URL)
@@ -120,18 +177,31 @@ def _set_asset_records(records: List[Dict[str, str]]) -> None:
     session[SESSION_ASSET_RECORDS_KEY] = records
 
 
-def _make_client() -> Any:
-    client = RaptorAPIClient(base_url=_get_base_url())
-    token = _get_token()
+def _get_analysis_jobs() -> List[str]:
+    return session.get(SESSION_ANALYSIS_JOBS_KEY, [])
+
+
+def _add_analysis_job(job_id: str) -> None:
+    session[SESSION_ANALYSIS_JOBS_KEY] = (_get_analysis_jobs() + [job_id])[-MAX_SESSION_ANALYSIS_JOBS:]
+
+
+@lru_cache(maxsize=64)
+def _client_for(base_url: str, token: Optional[str]) -> Any:
+    # 每組 (base_url, token) 重用同一個客戶端，保留其讀取快取與 warm-up 狀態；連線池本身由類別層級共用
+    client = RaptorAPIClient(base_url=base_url)
     if token:
         client.token = token
     return client
 
 
+def _make_client() -> Any:
+    return _client_for(_get_base_url(), _get_token())
+
+
 def _parse_comma_separated(raw: str) -> Optional[List[str]]:
     if not raw:
         return None
-    parts = [item.strip() for item in raw.replace("\r", "").replace("\n", ",").split(",")]
+    parts = (item.strip() for item in LIST_SEPARATOR_RE.split(raw))
     cleaned = [item for item in parts if item]
     return cleaned or None
 
@@ -157,34 +227,122 @@ def _sanitize_upload_name(filename: Optional[str], fallback_stem: str) -> str:
     return Path(name).name or f"{fallback_stem}.bin"
 
 
+def _save_upload(file_storage: FileStorage, target_path: Path) -> None:
+    with open(target_path, "wb", buffering=0) as dst:
+        shutil.copyfileobj(file_storage.stream, dst, length=UPLOAD_COPY_BUFFER_SIZE)
+
+
 def _run_with_temp_file(file_storage: FileStorage, runner: Callable[[str], Any]) -> Any:
     if not file_storage or not file_storage.filename:
         raise ValueError("請選擇要上傳的檔案")
     safe_name = _sanitize_upload_name(file_storage.filename, "upload")
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with tempfile.TemporaryDirectory(dir=UPLOAD_ROOT) as tmp_dir:
         target_path = Path(tmp_dir) / safe_name
-        file_storage.save(target_path)
+        _save_upload(file_storage, target_path)
         return runner(str(target_path))
 
 
 def _run_with_temp_files(file_storages: Iterable[FileStorage], runner: Callable[[List[str]], Any]) -> Any:
     stored_paths: List[str] = []
-    with tempfile.TemporaryDirectory() as tmp_dir:
+    with tempfile.TemporaryDirectory(dir=UPLOAD_ROOT) as tmp_dir:
         for index, file_storage in enumerate(file_storages):
             if not file_storage or not file_storage.filename:
                 continue
             safe_name = _sanitize_upload_name(file_storage.filename, f"upload_{index}")
             target_path = Path(tmp_dir) / safe_name
-            file_storage.save(target_path)
+            _save_upload(file_storage, target_path)
             stored_paths.append(str(target_path))
         if not stored_paths:
             raise ValueError("請至少選擇一個檔案")
         return runner(stored_paths)
 
 
+def _stage_files_for_job(file_storages: Iterable[FileStorage]) -> Tuple[str, List[str]]:
+    staging_dir = tempfile.mkdtemp(dir=UPLOAD_ROOT)
+    stored_paths: List[str] = []
+    try:
+        for index, file_storage in enumerate(file_storages):
+            if not file_storage or not file_storage.filename:
+                continue
+            safe_name = _sanitize_upload_name(file_storage.filename, f"upload_{index}")
+            target_path = Path(staging_dir) / safe_name
+            _save_upload(file_storage, target_path)
+            stored_paths.append(str(target_path))
+        if not stored_paths:
+            raise ValueError("請至少選擇一個檔案")
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    return staging_dir, stored_paths
+
+
+def _run_analysis_job(
+    base_url: str,
+    token: Optional[str],
+    method_name: str,
+    staging_dir: str,
+    kwargs: Dict[str, Any],
+) -> Any:
+    # 於 rq worker 中執行；暫存檔在工作結束後才刪除
+    try:
+        return getattr(_client_for(base_url, token), method_name)(**kwargs)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+
+def _enqueue_analysis_job(
+    client: Any,
+    method_name: str,
+    file_storages: Iterable[FileStorage],
+    path_argument: str,
+    **kwargs: Any,
+) -> Dict[str, Any]:
+    staging_dir, paths = _stage_files_for_job(file_storages)
+    kwargs[path_argument] = paths if path_argument == "file_paths" else paths[0]
+    try:
+        # 以字串指定工作函式，前端以 python app.py 啟動 (模組名為 __main__) 時 worker 仍可匯入
+        job = ANALYSIS_JOB_QUEUE.enqueue(
+            "app._run_analysis_job",
+            client.base_url,
+            client.token,
+            method_name,
+            staging_dir,
+            kwargs,
+            job_timeout=ANALYSIS_JOB_TIMEOUT,
+            meta={"action": method_name},
+        )
+    except Exception:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+        raise
+    _add_analysis_job(job.id)
+    return {
+        "job_id": job.id,
+        "status": job.get_status(),
+        "status_url": url_for("job_status", job_id=job.id),
+    }
+
+
+def _json_pretty(data: Any) -> str:
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode("utf-8")
+    return json.dumps(data, indent=2, ensure_ascii=False)
+
+
+def _json_bytes(data: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data, ensure_ascii=False).encode("utf-8")
+
+
+def _json_loads(raw: str) -> Any:
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 def _format_response(data: Any, action: str) -> Dict[str, Any]:
     if isinstance(data, (dict, list)):
-        return {"type": "json", "value": json.dumps(data, indent=2, ensure_ascii=False)}
+        return {"type": "json", "value": _json_pretty(data)}
     if isinstance(data, bytes):
         encoded = base64.b64encode(data).decode()
         return {
@@ -201,46 +359,40 @@ def _format_error(exc: Exception) -> str:
     if isinstance(exc, requests.HTTPError) and exc.response is not None:
         try:
             payload = exc.response.json()
-            return json.dumps(payload, indent=2, ensure_ascii=False)
+            return _json_pretty(payload)
         except ValueError:
             return exc.response.text or str(exc)
     return str(exc)
 
 
+def _first_present(value: Dict[str, Any], keys: Tuple[str, ...]) -> Any:
+    for key in keys:
+        found = value.get(key)
+        if found:
+            return found
+    return None
+
+
 def _extract_asset_entries(data: Any) -> List[Dict[str, Any]]:
     results: List[Dict[str, Any]] = []
-
-    def _walk(value: Any) -> None:
+    # 以明確的堆疊走訪取代遞迴；子節點反向推入以維持原本的前序走訪順序
+    stack: List[Any] = [data]
+    while stack:
+        value = stack.pop()
         if isinstance(value, dict):
-            lowered = {key.lower(): value[key] for key in value}
-            asset_path = lowered.get("asset_path") or lowered.get("assetpath")
-            version_id = (
-                lowered.get("version_id")
-                or lowered.get("versionid")
-                or lowered.get("version")
-            )
-            filename = (
-                lowered.get("filename")
-                or lowered.get("file_name")
-                or lowered.get("name")
-                or lowered.get("primary_filename")
-                or lowered.get("uploaded_file")
-            )
+            asset_path = _first_present(value, ASSET_PATH_KEYS)
+            version_id = _first_present(value, VERSION_ID_KEYS)
             if asset_path and version_id:
                 results.append(
                     {
                         "asset_path": asset_path,
                         "version_id": version_id,
-                        "filename": filename,
+                        "filename": _first_present(value, FILENAME_KEYS),
                     }
                 )
-            for nested in value.values():
-                _walk(nested)
+            stack.extend(reversed(value.values()))
         elif isinstance(value, list):
-            for item in value:
-                _walk(item)
-
-    _walk(data)
+            stack.extend(reversed(value))
     return results
 
 
@@ -248,8 +400,11 @@ def _register_asset_records(records: Iterable[Dict[str, Any]], source: str) -> N
     if not records:
         return
 
-    existing = _get_asset_records()
-    updated: List[Dict[str, str]] = existing[:]
+    # 以 (asset_path, version_id) 為鍵、由舊到新排列；重複的紀錄先移除再放到最後，即成為最新的一筆
+    indexed: Dict[Tuple[str, str], Dict[str, str]] = {
+        (item.get("asset_path"), item.get("version_id")): item
+        for item in reversed(_get_asset_records())
+    }
 
     for record in records:
         asset_path = str(record.get("asset_path", "") or "").strip()
@@ -265,31 +420,310 @@ def _register_asset_records(records: Iterable[Dict[str, Any]], source: str) -> N
             "source": ACTION_DISPLAY_NAMES.get(source, source),
         }
 
-        updated = [item for item in updated if not (
-            item.get("asset_path") == asset_path and item.get("version_id") == version_id
-        )]
-        updated.insert(0, entry)
-
-    if len(updated) > 20:
-        updated = updated[:20]
+        key = (asset_path, version_id)
+        indexed.pop(key, None)
+        indexed[key] = entry
 
-    _set_asset_records(updated)
+    _set_asset_records(list(reversed(indexed.values()))[:20])
 
 
-def _prepare_asset_records_for_view() -> List[Dict[str, str]]:
+@lru_cache(maxsize=256)
+def _encode_asset_records(records: Tuple[Tuple[str, str, str, str], ...]) -> Tuple[Dict[str, str], ...]:
     prepared: List[Dict[str, str]] = []
-    for record in _get_asset_records():
+    for asset_path, version_id, filename, source in records:
         safe_record = {
-            "asset_path": str(record.get("asset_path", "")),
-            "version_id": str(record.get("version_id", "")),
-            "filename": str(record.get("filename", "")),
-            "source": str(record.get("source", "")),
+            "asset_path": asset_path,
+            "version_id": version_id,
+            "filename": filename,
+            "source": source,
         }
-        encoded = base64.b64encode(
-            json.dumps(safe_record, ensure_ascii=False).encode("utf-8")
-        ).decode("ascii")
+        encoded = base64.b64encode(_json_bytes(safe_record)).decode("ascii")
         prepared.append({**safe_record, "encoded": encoded})
-    return prepared
+    return tuple(prepared)
+
+
+def _prepare_asset_records_for_view(page: str) -> Sequence[Dict[str, str]]:
+    # 只有這幾個分頁會顯示最近資產紀錄，其餘分頁不必讀取與編碼
+    if page not in PAGES_USING_ASSET_RECORDS:
+        return ()
+    # 紀錄內容未變時直接重用先前的編碼結果，避免每次渲染都重新 JSON + Base64
+    key = tuple(
+        (
+            str(record.get("asset_path", "")),
+            str(record.get("version_id", "")),
+            str(record.get("filename", "")),
+            str(record.get("source", "")),
+        )
+        for record in _get_asset_records()
+    )
+    return list(_encode_asset_records(key))
+
+
+ActionHandler = Callable[[Any, ImmutableMultiDict, ImmutableMultiDict], Any]
+
+
+def _do_video_search(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.video_search(
+        query_text=form.get("query_text", ""),
+        embedding_type=form.get("embedding_type", "text"),
+        filename=_parse_comma_separated(form.get("filename", "")),
+        speaker=_parse_comma_separated(form.get("speaker", "")),
+        limit=int(form.get("limit", 5)),
+    )
+
+
+def _do_audio_search(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.audio_search(
+        query_text=form.get("query_text", ""),
+        embedding_type=form.get("embedding_type", "text"),
+        filename=_parse_comma_separated(form.get("filename", "")),
+        speaker=_parse_comma_separated(form.get("speaker", "")),
+        limit=int(form.get("limit", 5)),
+    )
+
+
+def _do_document_search(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.document_search(
+        query_text=form.get("query_text", ""),
+        embedding_type=form.get("embedding_type", "text"),
+        filename=_parse_comma_separated(form.get("filename", "")),
+        source=form.get("source") or None,
+        limit=int(form.get("limit", 5)),
+    )
+
+
+def _do_image_search(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.image_search(
+        query_text=form.get("query_text", ""),
+        embedding_type=form.get("embedding_type", "text"),
+        filename=_parse_comma_separated(form.get("filename", "")),
+        source=form.get("source") or None,
+        limit=int(form.get("limit", 5)),
+    )
+
+
+def _do_unified_search(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    filters_raw = form.get("filters")
+    filters_value = None
+    if filters_raw:
+        filters_value = _json_loads(filters_raw)
+    return client.unified_search(
+        query_text=form.get("query_text", ""),
+        embedding_type=form.get("embedding_type", "text"),
+        filters=filters_value,
+        limit_per_collection=int(form.get("limit_per_collection", 5)),
+        global_limit=_parse_optional_int(form.get("global_limit")),
+        score_threshold=_parse_optional_float(form.get("score_threshold")),
+    )
+
+
+def _do_upload_file(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    archive_ttl = int(form.get("archive_ttl", 30))
+    destroy_ttl = int(form.get("destroy_ttl", 30))
+    return _run_with_temp_file(
+        files.get("primary_file"),
+        lambda path: client.upload_file(
+            file_path=path,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+        ),
+    )
+
+
+def _do_upload_files_batch(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    archive_ttl = int(form.get("archive_ttl", 30))
+    destroy_ttl = int(form.get("destroy_ttl", 30))
+    concurrency = int(form.get("concurrency", 4))
+    return _run_with_temp_files(
+        files.getlist("primary_files"),
+        lambda paths: client.upload_files_batch(
+            file_paths=paths,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+            concurrency=concurrency,
+        ),
+    )
+
+
+def _do_upload_file_with_analysis(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    archive_ttl = int(form.get("archive_ttl", 30))
+    destroy_ttl = int(form.get("destroy_ttl", 30))
+    processing_mode = form.get("processing_mode", "default")
+    if ANALYSIS_JOB_QUEUE is not None:
+        return _enqueue_analysis_job(
+            client,
+            "upload_file_with_analysis",
+            [files.get("primary_file")],
+            "file_path",
+            processing_mode=processing_mode,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+        )
+    return _run_with_temp_file(
+        files.get("primary_file"),
+        lambda path: client.upload_file_with_analysis(
+            file_path=path,
+            processing_mode=processing_mode,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+        ),
+    )
+
+
+def _do_upload_files_batch_with_analysis(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    archive_ttl = int(form.get("archive_ttl", 30))
+    destroy_ttl = int(form.get("destroy_ttl", 30))
+    concurrency = int(form.get("concurrency", 4))
+    processing_mode = form.get("processing_mode", "default")
+    if ANALYSIS_JOB_QUEUE is not None:
+        return _enqueue_analysis_job(
+            client,
+            "upload_files_batch_with_analysis",
+            files.getlist("primary_files"),
+            "file_paths",
+            processing_mode=processing_mode,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+            concurrency=concurrency,
+        )
+    return _run_with_temp_files(
+        files.getlist("primary_files"),
+        lambda paths: client.upload_files_batch_with_analysis(
+            file_paths=paths,
+            processing_mode=processing_mode,
+            archive_ttl=archive_ttl,
+            destroy_ttl=destroy_ttl,
+            concurrency=concurrency,
+        ),
+    )
+
+
+def _do_list_file_versions(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.list_file_versions(
+        asset_path=form.get("asset_path", ""),
+        filename=form.get("filename", ""),
+    )
+
+
+def _find_asset_filename(asset_path: str, version_id: str) -> Optional[str]:
+    for record in _get_asset_records():
+        if record.get("asset_path") == asset_path and record.get("version_id") == version_id:
+            return record.get("filename") or None
+    return None
+
+
+def _do_download_asset(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    asset_path = form.get("asset_path", "")
+    version_id = form.get("version_id", "")
+    if form.get("return_file_content") != "on":
+        return client.download_asset(
+            asset_path=asset_path,
+            version_id=version_id,
+            return_file_content=False,
+        )
+
+    # 串流寫入暫存檔後以 send_file 回傳，不再將整個檔案讀入記憶體並轉為 Base64 嵌入頁面
+    fd, target_path = tempfile.mkstemp(dir=UPLOAD_ROOT)
+    os.close(fd)
+    try:
+        client.download_asset(
+            asset_path=asset_path,
+            version_id=version_id,
+            return_file_content=True,
+            dest_path=target_path,
+        )
+        response = send_file(
+            target_path,
+            as_attachment=True,
+            download_name=_find_asset_filename(asset_path, version_id) or version_id or "download.bin",
+            conditional=True,
+        )
+    except Exception:
+        os.remove(target_path)
+        raise
+    response.call_on_close(lambda: os.remove(target_path))
+    return response
+
+
+def _do_archive_asset(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.archive_asset(
+        asset_path=form.get("asset_path", ""),
+        version_id=form.get("version_id", ""),
+    )
+
+
+def _do_delete_asset(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.delete_asset(
+        asset_path=form.get("asset_path", ""),
+        version_id=form.get("version_id", ""),
+    )
+
+
+def _do_process_file(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    raw = form.get("upload_result", "")
+    if not raw:
+        raise ValueError("請提供 upload_result JSON 資料")
+    return client.process_file(upload_result=_json_loads(raw))
+
+
+def _do_get_cached_value(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.get_cached_value(
+        m_type=form.get("m_type", ""),
+        key=form.get("cache_key", ""),
+    )
+
+
+def _do_get_all_cache(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.get_all_cache()
+
+
+def _do_send_chat(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    search_results_raw = form.get("search_results")
+    search_results_value = None
+    if search_results_raw:
+        search_results_value = _json_loads(search_results_raw)
+    return client.send_chat(
+        user_id=form.get("user_id", ""),
+        message=form.get("message", ""),
+        search_results=search_results_value,
+    )
+
+
+def _do_get_chat_memory(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.get_chat_memory(user_id=form.get("user_id", ""))
+
+
+def _do_clear_chat_memory(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.clear_chat_memory(user_id=form.get("user_id", ""))
+
+
+def _do_health_check(client: Any, form: ImmutableMultiDict, files: ImmutableMultiDict) -> Any:
+    return client.health_check()
+
+
+# 需要呼叫客戶端的操作；dashboard 以 action 直接查表分派
+ACTIONS: Dict[str, ActionHandler] = {
+    "video_search": _do_video_search,
+    "audio_search": _do_audio_search,
+    "document_search": _do_document_search,
+    "image_search": _do_image_search,
+    "unified_search": _do_unified_search,
+    "upload_file": _do_upload_file,
+    "upload_files_batch": _do_upload_files_batch,
+    "upload_file_with_analysis": _do_upload_file_with_analysis,
+    "upload_files_batch_with_analysis": _do_upload_files_batch_with_analysis,
+    "list_file_versions": _do_list_file_versions,
+    "download_asset": _do_download_asset,
+    "archive_asset": _do_archive_asset,
+    "delete_asset": _do_delete_asset,
+    "process_file": _do_process_file,
+    "get_cached_value": _do_get_cached_value,
+    "get_all_cache": _do_get_all_cache,
+    "send_chat": _do_send_chat,
+    "get_chat_memory": _do_get_chat_memory,
+    "clear_chat_memory": _do_clear_chat_memory,
+    "health_check": _do_health_check,
+}
 
 
 @app.route("/")
@@ -302,6 +736,29 @@ def dashboard_redirect() -> Any:
     return redirect(url_for("dashboard", page=DEFAULT_PAGE))
 
 
+@app.route("/jobs/<job_id>")
+def job_status(job_id: str) -> Any:
+    # 不屬於目前 session 的工作一律視為不存在，避免以工作 ID 讀取他人的上傳結果
+    if ANALYSIS_JOB_QUEUE is None or job_id not in _get_analysis_jobs():
+        abort(404)
+    job = ANALYSIS_JOB_QUEUE.fetch_job(job_id)
+    if job is None:
+        abort(404)
+
+    body: Dict[str, Any] = {"job_id": job.id, "status": job.get_status()}
+    if job.is_finished:
+        body["result"] = job.result
+        # 資產紀錄只在第一次查詢到完成結果時登錄，之後的輪詢不再重複處理
+        if isinstance(job.result, (dict, list)) and not job.meta.get("assets_registered"):
+            _register_asset_records(_extract_asset_entries(job.result), job.meta.get("action", ""))
+            job.meta["assets_registered"] = True
+            job.save_meta()
+    elif job.is_failed:
+        # 不回傳 worker 的完整 traceback，詳細內容請查看 worker 日誌
+        body["error"] = "背景工作執行失敗，請稍後再試"
+    return jsonify(body)
+
+
 @app.route("/dashboard/<page>", methods=["GET", "POST"])
 def dashboard(page: str) -> Any:
     if page not in VALID_PAGES:
@@ -316,7 +773,7 @@ def dashboard(page: str) -> Any:
         "result": None,
         "error": None,
         "requires_auth_actions": AUTH_REQUIRED_ACTIONS,
-        "asset_records": _prepare_asset_records_for_view(),
+        "asset_records": _prepare_asset_records_for_view(page),
     }
 
     if request.method == "POST":
@@ -333,7 +790,7 @@ def dashboard(page: str) -> Any:
 
             if action == "clear_asset_history":
                 _set_asset_records([])
-                context["asset_records"] = _prepare_asset_records_for_view()
+                context["asset_records"] = _prepare_asset_records_for_view(page)
                 context["result"] = {"type": "text", "value": "已清除最近資產紀錄"}
                 return render_template("index.html", **context)
 
@@ -354,10 +811,12 @@ def dashboard(page: str) -> Any:
                 context["result"] = _format_response(payload, action)
                 if isinstance(payload, (dict, list)) and action in ASSET_RESULT_ACTIONS:
                     _register_asset_records(_extract_asset_entries(payload), action)
-                    context["asset_records"] = _prepare_asset_records_for_view()
+                    context["asset_records"] = _prepare_asset_records_for_view(page)
                 return render_template("index.html", **context)
 
             if action == "login":
+                # login 會改寫客戶端的 token，使用獨立實例以免污染快取中的客戶端
+                client = RaptorAPIClient(base_url=_get_base_url())
                 token = client.login(
                     username=request.form.get("username", "").strip(),
                     password=request.form.get("password", ""),
@@ -370,203 +829,17 @@ def dashboard(page: str) -> Any:
             if action in AUTH_REQUIRED_ACTIONS and not _get_token():
                 raise ValueError("此操作需要先登入，請先取得 Token。")
 
-            if action == "video_search":
-                payload = client.video_search(
-                    query_text=request.form.get("query_text", ""),
-                    embedding_type=request.form.get("embedding_type", "text"),
-                    filename=_parse_comma_separated(request.form.get("filename", "")),
-                    speaker=_parse_comma_separated(request.form.get("speaker", "")),
-                    limit=int(request.form.get("limit", 5)),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "audio_search":
-                payload = client.audio_search(
-                    query_text=request.form.get("query_text", ""),
-                    embedding_type=request.form.get("embedding_type", "text"),
-                    filename=_parse_comma_separated(request.form.get("filename", "")),
-                    speaker=_parse_comma_separated(request.form.get("speaker", "")),
-                    limit=int(request.form.get("limit", 5)),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "document_search":
-                payload = client.document_search(
-                    query_text=request.form.get("query_text", ""),
-                    embedding_type=request.form.get("embedding_type", "text"),
-                    filename=_parse_comma_separated(request.form.get("filename", "")),
-                    source=request.form.get("source") or None,
-                    limit=int(request.form.get("limit", 5)),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "image_search":
-                payload = client.image_search(
-                    query_text=request.form.get("query_text", ""),
-                    embedding_type=request.form.get("embedding_type", "text"),
-                    filename=_parse_comma_separated(request.form.get("filename", "")),
-                    source=request.form.get("source") or None,
-                    limit=int(request.form.get("limit", 5)),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "unified_search":
-                filters_raw = request.form.get("filters")
-                filters_value = None
-                if filters_raw:
-                    filters_value = json.loads(filters_raw)
-                payload = client.unified_search(
-                    query_text=request.form.get("query_text", ""),
-                    embedding_type=request.form.get("embedding_type", "text"),
-                    filters=filters_value,
-                    limit_per_collection=int(request.form.get("limit_per_collection", 5)),
-                    global_limit=_parse_optional_int(request.form.get("global_limit")),
-                    score_threshold=_parse_optional_float(request.form.get("score_threshold")),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "upload_file":
-                archive_ttl = int(request.form.get("archive_ttl", 30))
-                destroy_ttl = int(request.form.get("destroy_ttl", 30))
-                file_storage = request.files.get("primary_file")
-
-                payload = _run_with_temp_file(
-                    file_storage,
-                    lambda path: client.upload_file(
-                        file_path=path,
-                        archive_ttl=archive_ttl,
-                        destroy_ttl=destroy_ttl,
-                    ),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "upload_files_batch":
-                archive_ttl = int(request.form.get("archive_ttl", 30))
-                destroy_ttl = int(request.form.get("destroy_ttl", 30))
-                concurrency = int(request.form.get("concurrency", 4))
-                payload = _run_with_temp_files(
-                    request.files.getlist("primary_files"),
-                    lambda paths: client.upload_files_batch(
-                        file_paths=paths,
-                        archive_ttl=archive_ttl,
-                        destroy_ttl=destroy_ttl,
-                        concurrency=concurrency,
-                    ),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "upload_file_with_analysis":
-                archive_ttl = int(request.form.get("archive_ttl", 30))
-                destroy_ttl = int(request.form.get("destroy_ttl", 30))
-                processing_mode = request.form.get("processing_mode", "default")
-                payload = _run_with_temp_file(
-                    request.files.get("primary_file"),
-                    lambda path: client.upload_file_with_analysis(
-                        file_path=path,
-                        processing_mode=processing_mode,
-                        archive_ttl=archive_ttl,
-                        destroy_ttl=destroy_ttl,
-                    ),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "upload_files_batch_with_analysis":
-                archive_ttl = int(request.form.get("archive_ttl", 30))
-                destroy_ttl = int(request.form.get("destroy_ttl", 30))
-                concurrency = int(request.form.get("concurrency", 4))
-                processing_mode = request.form.get("processing_mode", "default")
-                payload = _run_with_temp_files(
-                    request.files.getlist("primary_files"),
-                    lambda paths: client.upload_files_batch_with_analysis(
-                        file_paths=paths,
-                        processing_mode=processing_mode,
-                        archive_ttl=archive_ttl,
-                        destroy_ttl=destroy_ttl,
-                        concurrency=concurrency,
-                    ),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "list_file_versions":
-                payload = client.list_file_versions(
-                    asset_path=request.form.get("asset_path", ""),
-                    filename=request.form.get("filename", ""),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "download_asset":
-                return_content = request.form.get("return_file_content") == "on"
-                data = client.download_asset(
-                    asset_path=request.form.get("asset_path", ""),
-                    version_id=request.form.get("version_id", ""),
-                    return_file_content=return_content,
-                )
-                context["result"] = _format_response(data, action)
-
-            elif action == "archive_asset":
-                payload = client.archive_asset(
-                    asset_path=request.form.get("asset_path", ""),
-                    version_id=request.form.get("version_id", ""),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "delete_asset":
-                payload = client.delete_asset(
-                    asset_path=request.form.get("asset_path", ""),
-                    version_id=request.form.get("version_id", ""),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "process_file":
-                raw = request.form.get("upload_result", "")
-                if not raw:
-                    raise ValueError("請提供 upload_result JSON 資料")
-                parsed = json.loads(raw)
-                payload = client.process_file(upload_result=parsed)
-                context["result"] = _format_response(payload, action)
-
-            elif action == "get_cached_value":
-                payload = client.get_cached_value(
-                    m_type=request.form.get("m_type", ""),
-                    key=request.form.get("cache_key", ""),
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "get_all_cache":
-                payload = client.get_all_cache()
-                context["result"] = _format_response(payload, action)
-
-            elif action == "send_chat":
-                search_results_raw = request.form.get("search_results")
-                search_results_value = None
-                if search_results_raw:
-                    search_results_value = json.loads(search_results_raw)
-                payload = client.send_chat(
-                    user_id=request.form.get("user_id", ""),
-                    message=request.form.get("message", ""),
-                    search_results=search_results_value,
-                )
-                context["result"] = _format_response(payload, action)
-
-            elif action == "get_chat_memory":
-                payload = client.get_chat_memory(user_id=request.form.get("user_id", ""))
-                context["result"] = _format_response(payload, action)
-
-            elif action == "clear_chat_memory":
-                payload = client.clear_chat_memory(user_id=request.form.get("user_id", ""))
-                context["result"] = _format_response(payload, action)
-
-            elif action == "health_check":
-                payload = client.health_check()
-                context["result"] = _format_response(payload, action)
-
-            else:
+            handler = ACTIONS.get(action)
+            if handler is None:
                 raise ValueError("未知的操作")
-
-            if action in ASSET_RESULT_ACTIONS and isinstance(context["result"], dict) and context["result"].get("type") == "json":
-                raw_json = json.loads(context["result"]["value"])
-                _register_asset_records(_extract_asset_entries(raw_json), action)
-                context["asset_records"] = _prepare_asset_records_for_view()
+            payload = handler(client, request.form, request.files)
+            if isinstance(payload, Response):
+                return payload
+            context["result"] = _format_response(payload, action)
+
+            if action in ASSET_RESULT_ACTIONS and isinstance(payload, (dict, list)):
+                _register_asset_records(_extract_asset_entries(payload), action)
+                context["asset_records"] = _prepare_asset_records_for_view(page)
 
         except Exception as exc:  # pylint: disable=broad-except
             context["error"] = _format_error(exc)